@@ -0,0 +1,266 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import benchmarks — bulk CSV into a saved case.
+
+Writes a synthetic CSV export and imports it two ways: the paste path
+(read the file, :func:`importers.parse_csv`, add the events, :func:`io.save`)
+and the file path (:func:`importers.stage_csv` then
+:meth:`importers.StagedImport.commit`). Reports wall time and traced peak
+memory for each (timed untraced, then run again under :mod:`tracemalloc`);
+the staged path's peak should stay flat as ``--rows`` grows.
+
+``--timestamps`` picks how the CSV writes times: ``iso`` (with offset),
+``naive`` (``2025-01-01 09:00:00``) or ``unpadded`` (``2025-01-01 9:00:00``,
+which only the strptime fallbacks read).
+
+``--xlsx`` writes the same rows as a workbook and compares traced peak memory
+for the original :func:`importers.parse_xlsx` (every row listed, then
+filtered into a second list: ``legacy_parse_xlsx`` below), the streaming
+``parse_xlsx``, and :func:`importers.stage_xlsx` (needs openpyxl).
+
+``--duplicates`` re-imports the same file into the case twice more, with
+``duplicates="keep"`` and ``"skip"`` on :meth:`importers.StagedImport.commit`,
+and times :func:`importers.parse_csv` against the loaded case both ways: the
+difference is the cost of the content-key lookups.
+
+``--files N`` splits the rows across ``N`` per-host CSVs in a folder and
+times :func:`ingest.ingest_folder` serially and, with ``--workers``, with a
+pool, again with the parent's CPU time.
+
+``--workers N`` also times staging alone (:func:`importers.stage_csv`, no
+commit) serially and with an ``N``-process pool, with the parent process's own
+CPU time: that is the part the pool cannot spread, so serial wall time over
+it bounds the speedup more cores could give.
+
+``--jsonl`` writes the rows as psort ``json_line`` records (one in ten with
+``timestamp_desc`` "Creation Time") and times :func:`plaso.stage_jsonl` with
+and without a ``timestamp_descs`` filter.
+
+    python benchmarks/bench_import.py                # 200k rows
+    python benchmarks/bench_import.py --rows 1000000 --skip-paste
+    python benchmarks/bench_import.py --rows 1000000 --skip-paste --workers 8
+    python benchmarks/bench_import.py --timestamps unpadded
+    python benchmarks/bench_import.py --rows 500000 --skip-paste --xlsx
+    python benchmarks/bench_import.py --rows 1000000 --skip-paste --jsonl
+    python benchmarks/bench_import.py --skip-paste --duplicates
+    python benchmarks/bench_import.py --skip-paste --files 40 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import io as stdlib_io
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from timeline_creator import importers, ingest, io, plaso  # noqa: E402
+from timeline_creator.models import Investigation  # noqa: E402
+
+USERS = [("alice", "User account"), ("bob", "User account"), ("root", "Privileged account"),
+         ("svc_backup", "Service account"), ("SYSTEM", "System account")]
+
+
+TIMESTAMPS = {
+    "iso": datetime.isoformat,
+    "naive": lambda dt: dt.strftime("%Y-%m-%d %H:%M:%S"),
+    "unpadded": lambda dt: f"{dt:%Y-%m-%d} {dt.hour}:{dt:%M:%S}",
+}
+
+
+def write_csv(path: Path, rows: int, span_ratio: float = 0.5, seed: int = 1,
+              timestamps: str = "iso") -> None:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    text = TIMESTAMPS[timestamps]
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("datetime,message,endpoint,username,account_type,end\n")
+        for index in range(rows):
+            username, account_type = rng.choice(USERS)
+            dt = start + timedelta(seconds=rng.uniform(0, 30 * 86400))
+            end = text(dt + timedelta(seconds=rng.uniform(1, 3600))) \
+                if rng.random() < span_ratio else ""
+            handle.write(f"{text(dt)},session {index} 10.0.{rng.randint(0, 255)}."
+                         f"{rng.randint(0, 255)},HOST{rng.randint(1, 50)},{username},"
+                         f"{account_type},{end}\n")
+
+
+def write_xlsx(csv_path: Path, path: Path) -> None:
+    from openpyxl import Workbook
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("events")
+    with csv_path.open(encoding="utf-8", newline="") as handle:
+        for row in csv.reader(handle):
+            sheet.append(row)
+    workbook.save(path)
+
+
+def write_jsonl(csv_path: Path, path: Path) -> None:
+    with csv_path.open(encoding="utf-8", newline="") as source, \
+            path.open("w", encoding="utf-8") as handle:
+        for index, row in enumerate(csv.DictReader(source)):
+            desc = "Creation Time" if index % 10 == 0 else "Content Modification Time"
+            handle.write(json.dumps({
+                "datetime": row["datetime"], "timestamp_desc": desc, "message": row["message"],
+                "hostname": row["endpoint"], "username": row["username"],
+                "parser": "filestat", "data_type": "fs:stat"}) + "\n")
+
+
+def split_csv(csv_path: Path, folder: Path, files: int) -> None:
+    folder.mkdir()
+    with csv_path.open(encoding="utf-8", newline="") as source:
+        header, *rows = source.readlines()
+    for index in range(files):
+        with (folder / f"host{index:03d}.csv").open("w", encoding="utf-8", newline="") as out:
+            out.write(header)
+            out.writelines(rows[index::files])
+
+
+def legacy_parse_xlsx(data: bytes) -> importers.ImportResult:
+    """The pre-streaming parse_xlsx: the whole sheet listed twice before validation."""
+    from openpyxl import load_workbook
+    workbook = load_workbook(stdlib_io.BytesIO(data), read_only=True, data_only=True)
+    rows = [list(r) for r in workbook.active.iter_rows(values_only=True)]
+    rows = [r for r in rows if any(c is not None and str(c).strip() for c in r)]
+    header = [str(c) if c is not None else "" for c in rows[0]]
+    return importers._collect([importers._Table(None, importers._columns(header),
+                                                iter(rows[1:]))], True, 1)
+
+
+def paste_import(path: Path, directory: Path) -> None:
+    result = importers.parse_csv(path.read_text(encoding="utf-8"))
+    investigation = Investigation(name="pasted")
+    for event in result.events:
+        investigation.add_event(event)
+    io.save(investigation, directory)
+
+
+def staged_import(path: Path, directory: Path) -> None:
+    with importers.stage_csv(path, staging_dir=directory) as staged:
+        staged.commit("staged", directory)
+    io._jsonl_path("staged", directory).unlink()  # each run imports into a new case
+
+
+def peak_mb(fn, *args) -> float:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def measure(fn, *args) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    fn(*args)
+    seconds = time.perf_counter() - t0
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return seconds, tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--timestamps", choices=sorted(TIMESTAMPS), default="iso")
+    parser.add_argument("--xlsx", action="store_true",
+                        help="also compare xlsx import memory (needs openpyxl)")
+    parser.add_argument("--jsonl", action="store_true",
+                        help="also time plaso.stage_jsonl, unfiltered and filtered")
+    parser.add_argument("--duplicates", action="store_true",
+                        help="also time re-imports with and without duplicate skipping")
+    parser.add_argument("--files", type=int, default=0,
+                        help="also time ingest_folder over the rows split into this many CSVs")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="also time parse_csv validation with this many processes")
+    parser.add_argument("--skip-paste", action="store_true",
+                        help="only run the staged import (the paste path needs the whole file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        path = directory / "export.csv"
+        write_csv(path, args.rows, timestamps=args.timestamps)
+        print(f"{args.rows} rows, {path.stat().st_size / 1e6:.1f} MB CSV")
+        if not args.skip_paste:
+            seconds, peak = measure(paste_import, path, directory)
+            print(f"  parse_csv + io.save:        {seconds:7.2f}s  peak {peak:7.1f} MB")
+        seconds, peak = measure(staged_import, path, directory)
+        print(f"  stage_csv + commit:         {seconds:7.2f}s  peak {peak:7.1f} MB")
+        if args.xlsx:
+            workbook = directory / "export.xlsx"
+            write_xlsx(path, workbook)
+            print(f"  xlsx: {workbook.stat().st_size / 1e6:.1f} MB workbook")
+            data = workbook.read_bytes()
+            for label, fn, source in [
+                ("legacy parse_xlsx", legacy_parse_xlsx, data),
+                ("parse_xlsx (streamed)", importers.parse_xlsx, data),
+                ("stage_xlsx", lambda p: importers.stage_xlsx(p, staging_dir=directory).discard(),
+                 workbook),
+            ]:
+                print(f"  {label + ':':<27} {peak_mb(fn, source):7.1f} MB peak")
+        if args.jsonl:
+            export = directory / "export.jsonl"
+            write_jsonl(path, export)
+            print(f"  jsonl: {export.stat().st_size / 1e6:.1f} MB")
+            for label, descs in [("all records", None), ("1 in 10 kept", {"Creation Time"})]:
+                t0 = time.perf_counter()
+                plaso.stage_jsonl(export, staging_dir=directory, timestamp_descs=descs).discard()
+                print(f"  stage_jsonl, {label + ':':<14} {time.perf_counter() - t0:7.2f}s")
+        if args.duplicates:
+            with importers.stage_csv(path, staging_dir=directory) as staged:
+                staged.commit("dedup", directory)
+            for mode in ("keep", "skip"):
+                staged = importers.stage_csv(path, staging_dir=directory)
+                t0 = time.perf_counter()
+                staged.commit("dedup", directory, duplicates=mode)
+                print(f"  commit onto the same rows, duplicates={mode!r}: "
+                      f"{time.perf_counter() - t0:6.2f}s ({staged.duplicates} skipped)")
+            case = io.load("dedup", directory).investigation
+            text = path.read_text(encoding="utf-8")
+            for mode in ("keep", "skip"):
+                t0 = time.perf_counter()
+                result = importers.parse_csv(text, investigation=case, duplicates=mode)
+                print(f"  parse_csv vs {len(case.events)} events, duplicates={mode!r}: "
+                      f"{time.perf_counter() - t0:6.2f}s ({result.duplicates} duplicates)")
+        if args.files:
+            folder = directory / "triage"
+            split_csv(path, folder, args.files)
+            for workers in (1, args.workers) if args.workers else (1,):
+                t0, cpu0 = time.perf_counter(), time.process_time()
+                result = ingest.ingest_folder(folder, f"ingested{workers}", directory,
+                                              workers=workers, staging_dir=directory)
+                print(f"  ingest_folder, {args.files} files, {workers:2d} worker(s): "
+                      f"{time.perf_counter() - t0:7.2f}s  parent CPU "
+                      f"{time.process_time() - cpu0:6.2f}s  ({result.events} events)")
+        for workers in (1, args.workers) if args.workers else ():
+            t0, cpu0 = time.perf_counter(), time.process_time()
+            importers.stage_csv(path, staging_dir=directory, workers=workers).discard()
+            print(f"  stage_csv, {workers:2d} worker(s):     "
+                  f"{time.perf_counter() - t0:7.2f}s  parent CPU "
+                  f"{time.process_time() - cpu0:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Load benchmarks — :func:`io.load` on a span-heavy investigation.
+
+Saves a synthetic network-session case (mostly spans, so two records each) and
+times a full :func:`io.load`, plus span pairing alone: the one-pass
+:func:`io._reconstitute` against the original, which rebuilt a set of every
+prior key per span record (``legacy_reconstitute`` below). The legacy pairing
+is quadratic, so it is only run up to ``--legacy-max`` records.
+
+``--memory`` reports traced peak memory for the original read-everything load
+(``legacy_load_events``), :func:`io.load`, and a pass over
+:func:`io.iter_events` that keeps nothing (the batch-job case). ``--journal``
+times a Save after adding one event: full :func:`io.save` against
+:meth:`io.Journal.save`. ``--cache`` times a reopen from the columnar
+``<name>.events.bin`` cache against parsing the JSONL. ``--trusted`` times
+:func:`io.load` with ``trusted=True`` (hash-checked, no re-validation).
+``--lazy`` times one day's window through :class:`lazy.LazyInvestigation`
+(cold index build, then warm) against :func:`io.load` + ``by_time_window``.
+``--partition`` times the same window through :func:`io.load_window` on the
+single-file layout and on a day-partitioned copy. ``--sqlite`` times one
+endpoint over one day via :func:`sqlite_store.query` against :func:`io.load`
++ :func:`filters.apply`. ``--gzip`` compares file size, save time and load time
+for ``<name>.jsonl`` against ``<name>.jsonl.gz``. ``--merge`` splits the case
+into four per-host investigations and compares :func:`merge.merge` (streamed)
+with loading all four, sorting and saving, in time and traced peak memory.
+
+    python benchmarks/bench_io.py                    # 200k records
+    python benchmarks/bench_io.py --records 50000 --legacy-max 50000
+    python benchmarks/bench_io.py --memory
+    python benchmarks/bench_io.py --journal          # Save after one added event
+    python benchmarks/bench_io.py --cache            # reopen via <name>.events.bin
+    python benchmarks/bench_io.py --records 500000 --trusted --legacy-max 0
+    python benchmarks/bench_io.py --lazy --legacy-max 0
+    python benchmarks/bench_io.py --partition --legacy-max 0
+    python benchmarks/bench_io.py --sqlite --legacy-max 0
+    python benchmarks/bench_io.py --gzip --legacy-max 0
+    python benchmarks/bench_io.py --merge --legacy-max 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from timeline_creator import filters, io, merge, sqlite_store  # noqa: E402
+from timeline_creator.lazy import LazyInvestigation, index_path  # noqa: E402
+from timeline_creator.models import AccountType, Event, Investigation  # noqa: E402
+
+USERS = [("alice", AccountType.USER), ("bob", AccountType.USER), ("root", AccountType.PRIVILEGED),
+         ("svc_backup", AccountType.SERVICE), ("SYSTEM", AccountType.SYSTEM)]
+
+
+def legacy_reconstitute(records, warnings):
+    """The pre-rework pairing: a fresh set of all prior keys per span record."""
+    span_groups, ordered, points = {}, [], {}
+    for index, record in enumerate(records):
+        desc = record.get("timestamp_desc", io.DESC_EVENT)
+        span_id = record.get("span_id")
+        if desc in (io.DESC_START, io.DESC_END) and span_id:
+            group = span_groups.setdefault(span_id, {"first_index": index})
+            group[desc] = record
+            if span_id not in {sid for _, sid in ordered}:
+                ordered.append((index, span_id))
+        else:
+            points[index] = record
+            ordered.append((index, "point"))
+    events = []
+    for index, key in ordered:
+        if key == "point":
+            events.append(io._point_event_from_record(points[index]))
+        else:
+            events.append(io._event_from_halves(key, span_groups[key], warnings))
+    return events
+
+
+def legacy_load_events(name, directory):
+    """The pre-streaming load: whole text, then every record dict, then events."""
+    text = Path(directory, f"{name}.jsonl").read_text(encoding="utf-8")
+    records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return io._reconstitute(records, [])
+
+
+def count_streamed(name, directory):
+    return sum(1 for _ in io.iter_events(name, directory))
+
+
+def lazy_window(name, directory, start, end):
+    with LazyInvestigation.open(name, directory) as lazy:
+        return lazy.window(start, end)
+
+
+def peak_mb(fn, *args) -> float:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def eager_merge(names, directory, output):
+    """Load every input, sort the union, save it: the in-memory baseline."""
+    events = [e for name in names for e in io.load(name, directory).investigation.events]
+    events.sort(key=lambda event: event.datetime)
+    io.save(Investigation(name=output, events=events), directory)
+
+
+def make_investigation(n_records: int, span_ratio: float = 0.8, seed: int = 1) -> Investigation:
+    """Roughly ``n_records`` on-disk records; ``span_ratio`` of events are spans."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = []
+    records = 0
+    while records < n_records:
+        username, account_type = rng.choice(USERS)
+        dt = start + timedelta(seconds=rng.uniform(0, 30 * 86400))
+        is_span = rng.random() < span_ratio
+        end = dt + timedelta(seconds=rng.uniform(1, 3600)) if is_span else None
+        events.append(Event(datetime=dt, end=end,
+                            message=f"session {len(events)} 10.0.{rng.randint(0, 255)}."
+                                    f"{rng.randint(0, 255)}:{rng.randint(1, 65535)}",
+                            endpoint=f"HOST{rng.randint(1, 50)}", username=username,
+                            account_type=account_type))
+        records += 2 if is_span else 1
+    return Investigation(name="bench", events=events)
+
+
+def timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    out = fn(*args, **kwargs)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--memory", action="store_true",
+                        help="also report peak traced memory per load strategy")
+    parser.add_argument("--trusted", action="store_true",
+                        help="also time a trusted (hash-verified) load")
+    parser.add_argument("--cache", action="store_true",
+                        help="also time a reopen from the columnar cache")
+    parser.add_argument("--lazy", action="store_true",
+                        help="also time a one-day window via the lazy offset index")
+    parser.add_argument("--partition", action="store_true",
+                        help="also time a one-day load_window, single file vs day shards")
+    parser.add_argument("--sqlite", action="store_true",
+                        help="also time an endpoint + one-day query pushed down to SQLite")
+    parser.add_argument("--gzip", action="store_true",
+                        help="also compare size and save/load time, plain vs gzip JSONL")
+    parser.add_argument("--merge", action="store_true",
+                        help="also compare a streamed 4-host merge with an in-memory one")
+    parser.add_argument("--journal", action="store_true",
+                        help="also time a one-event Save, full rewrite vs journal")
+    parser.add_argument("--legacy-max", type=int, default=25_000,
+                        help="largest size the legacy pairing is run at")
+    args = parser.parse_args()
+
+    sizes = sorted({min(s, args.records) for s in (5_000, 20_000, args.records)})
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'records':>8} {'load s':>8} {'pair s':>8} {'legacy s':>9} {'speedup':>8}")
+        for n in sizes:
+            inv = make_investigation(n)
+            io.save(inv, tmp)
+            result, t_load = timed(io.load, inv.name, tmp)
+            assert len(result.investigation.events) == len(inv.events)
+            lines = Path(tmp, f"{inv.name}.jsonl").read_text(encoding="utf-8").splitlines()
+            records = [json.loads(line) for line in lines]
+            new, t_pair = timed(io._reconstitute, records, [])
+            if len(records) <= args.legacy_max:
+                old, t_old = timed(legacy_reconstitute, records, [])
+                assert old == new, "one-pass pairing diverged from the legacy pairing"
+                legacy, speedup = f"{t_old:9.3f}", f"{t_old / t_pair:7.0f}x"
+            else:
+                legacy, speedup = f"{'-':>9}", f"{'-':>8}"
+            print(f"{len(records):>8} {t_load:8.3f} {t_pair:8.3f} {legacy} {speedup}")
+        if args.memory:
+            name = inv.name
+            print(f"peak MB at {len(records)} records: "
+                  f"legacy load {peak_mb(legacy_load_events, name, tmp):.0f}, "
+                  f"io.load {peak_mb(io.load, name, tmp):.0f}, "
+                  f"iter_events {peak_mb(count_streamed, name, tmp):.1f}")
+        if args.trusted:
+            trusted, t_trusted = timed(io.load, inv.name, tmp, trusted=True)
+            assert trusted.investigation.events == result.investigation.events
+            print(f"load at {len(records)} records: validated {t_load:.3f}s, "
+                  f"trusted {t_trusted:.3f}s")
+        if args.cache:
+            io.save(inv, tmp, cache=True)
+            cached, t_cached = timed(io.load, inv.name, tmp)
+            assert cached.investigation.events == result.investigation.events
+            print(f"reopen at {len(records)} records: jsonl {t_load:.3f}s, "
+                  f"cache {t_cached:.3f}s")
+        if args.lazy:
+            start = datetime(2025, 1, 15, tzinfo=timezone.utc)
+            end = start + timedelta(days=1)
+            eager = filters.by_time_window(result.investigation.events, start, end)
+            index_path(inv.name, tmp).unlink(missing_ok=True)
+            cold, t_cold = timed(lazy_window, inv.name, tmp, start, end)
+            warm, t_warm = timed(lazy_window, inv.name, tmp, start, end)
+            assert cold == warm == eager
+            print(f"one-day window ({len(eager)} events) at {len(records)} records: "
+                  f"load+filter {t_load:.3f}s, lazy cold {t_cold:.3f}s, "
+                  f"lazy warm {t_warm * 1000:.1f}ms")
+        if args.partition:
+            start = datetime(2025, 1, 15, tzinfo=timezone.utc)
+            end = start + timedelta(days=1)
+            flat, t_flat = timed(io.load_window, inv.name, tmp, start, end)
+            parted_dir = Path(tmp, "parted")
+            io.save(inv, parted_dir, partition="day")
+            parted, t_parted = timed(io.load_window, inv.name, parted_dir, start, end)
+            assert parted == flat
+            print(f"one-day load_window ({len(flat)} events) at {len(records)} records: "
+                  f"single file {t_flat:.3f}s, day shards {t_parted:.3f}s")
+        if args.sqlite:
+            start = datetime(2025, 1, 15, tzinfo=timezone.utc)
+            selection = {"endpoints": ["HOST7"], "start": start, "end": start + timedelta(days=1)}
+            db = Path(tmp, "cases.db")
+            _, t_import = timed(sqlite_store.save, result.investigation, db)
+            eager, t_apply = timed(filters.apply, result.investigation.events, **selection)
+            pushed, t_query = timed(sqlite_store.query, inv.name, db, **selection)
+            assert pushed == eager
+            print(f"endpoint + one-day query ({len(eager)} events) at {len(records)} records: "
+                  f"io.load+apply {t_load + t_apply:.3f}s, sqlite {t_query * 1000:.1f}ms "
+                  f"(one-off import {t_import:.2f}s)")
+        if args.gzip:
+            gz_dir = Path(tmp, "gz")
+            _, t_plain_save = timed(io.save, inv, tmp)
+            _, t_gz_save = timed(io.save, inv, gz_dir, compress=True)
+            plain_mb = Path(tmp, f"{inv.name}.jsonl").stat().st_size / 1e6
+            gz_mb = Path(gz_dir, f"{inv.name}.jsonl.gz").stat().st_size / 1e6
+            plain, t_plain = timed(io.load, inv.name, tmp)
+            packed, t_gz = timed(io.load, inv.name, gz_dir)
+            assert packed.investigation.events == plain.investigation.events
+            print(f"{len(records)} records: jsonl {plain_mb:.1f}MB save {t_plain_save:.2f}s "
+                  f"load {t_plain:.2f}s | jsonl.gz {gz_mb:.1f}MB ({plain_mb / gz_mb:.1f}x smaller) "
+                  f"save {t_gz_save:.2f}s load {t_gz:.2f}s")
+        if args.merge:
+            hosts = [f"host{i}" for i in range(4)]
+            for i, host in enumerate(hosts):
+                io.save(Investigation(name=host, events=inv.events[i::4]), tmp)
+            _, t_eager = timed(eager_merge, hosts, tmp, "eager")
+            _, t_stream = timed(merge.merge, hosts, "streamed", tmp)
+            assert ([e.datetime for e in io.load("streamed", tmp).investigation.events]
+                    == [e.datetime for e in io.load("eager", tmp).investigation.events])
+            print(f"4-host merge of {len(records)} records: in memory {t_eager:.2f}s "
+                  f"{peak_mb(eager_merge, hosts, tmp, 'eager'):.0f}MB peak, streamed "
+                  f"{t_stream:.2f}s (building the offset indexes) "
+                  f"{peak_mb(merge.merge, hosts, 'streamed', tmp):.0f}MB peak")
+        if args.journal:
+            journal = io.Journal(tmp, compact_min_bytes=1 << 30)
+            inv = journal.load(inv.name).investigation
+            inv.add_event(inv.events[0].model_copy(update={"message": "one more"}))
+            _, t_journal = timed(journal.save, inv)
+            inv.add_event(inv.events[1].model_copy(update={"message": "and another"}))
+            _, t_full = timed(io.save, inv, tmp)
+            print(f"one-event save at {len(records)} records: full rewrite {t_full:.3f}s, "
+                  f"journal {t_journal * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Layout benchmarks — split-window planning on an over-cap timeline.
+
+Compares the single-sweep :func:`layout._suggest_splits` against the original
+quadratic planner (re-sort + re-colour the whole window per box), reproduced
+below as ``legacy_suggest_splits``. The legacy planner is only run up to
+``--legacy-max`` labels: its cost grows with the square of the window size, so
+wide windows (a high ``--max-levels``) take it from seconds to hours.
+
+    python benchmarks/bench_layout.py                 # 50k labels
+    python benchmarks/bench_layout.py --max-levels 400 --legacy-max 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from timeline_creator import layout  # noqa: E402
+from timeline_creator.layout import (  # noqa: E402
+    AxisProjection, LayoutEvent, LayoutParams, SplitSuggestion, default_font,
+)
+
+
+def legacy_suggest_splits(boxes, projection, params, max_levels_fit):
+    """The pre-rework planner: O(n^2 log n) with two clones per box per step."""
+
+    def clone(b):
+        return layout._Box(b.id, b.anchor_x, b.left, b.right, b.width, b.height,
+                           b.n_lines, b.wrapped_text, b.anchor_iso)
+
+    def colour(bs):
+        edges = []
+        for b in bs:
+            level = next((i for i, e in enumerate(edges) if b.left >= e), len(edges))
+            if level == len(edges):
+                edges.append(0.0)
+            edges[level] = b.right + params.box_h_pad_px
+        return len(edges)
+
+    suggestions, window = [], []
+
+    def close_window():
+        if window:
+            suggestions.append(SplitSuggestion(
+                projection.to_dt(min(b.left for b in window)),
+                projection.to_dt(max(b.right for b in window)),
+                colour([clone(b) for b in window])))
+
+    for box in (clone(b) for b in boxes):
+        trial = sorted(window + [box], key=lambda b: b.left)
+        if window and colour([clone(b) for b in trial]) > max_levels_fit:
+            close_window()
+            window = [box]
+        else:
+            window.append(box)
+    close_window()
+    return suggestions
+
+
+def make_boxes(n: int, seed: int = 1):
+    """An EDR-style day: bursts of near-simultaneous alerts on a quiet baseline."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    projection = AxisProjection(start, start + timedelta(days=1), 1800.0)
+    events = []
+    for i in range(n):
+        if rng.random() < 0.7:  # burst around one of a few hot instants
+            dt = start + timedelta(hours=rng.choice((3, 9, 14, 21)),
+                                   seconds=rng.uniform(0, 120))
+        else:
+            dt = start + timedelta(seconds=rng.uniform(0, 86400))
+        events.append(LayoutEvent(str(i), dt, f"alert {i} {'x' * rng.randint(4, 40)}"))
+    font, params = default_font(), LayoutParams()
+    boxes = [layout._build_box(e, projection, font, params, None)[0] for e in events]
+    boxes.sort(key=lambda b: (round(b.left, 6), b.anchor_iso, b.id))
+    return boxes, projection, params
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--labels", type=int, default=50_000)
+    parser.add_argument("--legacy-max", type=int, default=50_000,
+                        help="largest size the legacy planner is run at")
+    parser.add_argument("--max-levels", type=int, default=40)
+    args = parser.parse_args()
+
+    sizes = sorted({min(s, args.labels) for s in (500, 1_000, 2_000, 5_000, args.labels)})
+    print(f"{'labels':>8} {'windows':>8} {'sweep s':>9} {'legacy s':>9} {'speedup':>8}")
+    for n in sizes:
+        boxes, projection, params = make_boxes(n)
+        intervals = [(b.left, b.right) for b in boxes]
+        new, t_new = timed(layout._suggest_splits, intervals, projection, params,
+                           args.max_levels)
+        if n <= args.legacy_max:
+            old, t_old = timed(legacy_suggest_splits, boxes, projection, params,
+                               args.max_levels)
+            assert old == new, "sweep planner diverged from the legacy planner"
+            legacy, speedup = f"{t_old:9.3f}", f"{t_old / t_new:7.0f}x"
+        else:
+            legacy, speedup = f"{'-':>9}", f"{'-':>8}"
+        print(f"{n:>8} {len(new):>8} {t_new:9.3f} {legacy} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
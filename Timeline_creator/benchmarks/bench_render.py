@@ -0,0 +1,188 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Render benchmarks — per-stage timings for :meth:`TimelineRenderer.render`.
+
+Times layout, drawing (artist creation), a full canvas draw and SVG export on
+a synthetic fixture, once with the batched-collection drawing and once with
+the original one-artist-per-marker/leader/bar drawing (``legacy_draw`` below).
+``--direct-svg`` adds the figure-free :mod:`timeline_creator.svg` writer.
+
+    python benchmarks/bench_render.py               # 10k events
+    python benchmarks/bench_render.py --events 2000 --png-diff
+    python benchmarks/bench_render.py --events 100000 --engine array --direct-svg
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+import matplotlib.dates as mdates  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
+
+from timeline_creator import render  # noqa: E402
+from timeline_creator.models import AccountType, Event  # noqa: E402
+
+USERS = [("alice", AccountType.USER), ("bob", AccountType.USER), ("root", AccountType.PRIVILEGED),
+         ("svc_backup", AccountType.SERVICE), ("SYSTEM", AccountType.SYSTEM),
+         ("edr", AccountType.EDR), ("guest", AccountType.GUEST)]
+
+
+def make_events(n: int, seed: int = 1) -> list[Event]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = []
+    for i in range(n):
+        username, account_type = rng.choice(USERS)
+        dt = start + timedelta(seconds=rng.uniform(0, 14 * 86400))
+        end = dt + timedelta(minutes=rng.uniform(5, 600)) if rng.random() < 0.1 else None
+        events.append(Event(datetime=dt, end=end, message=f"event {i} " + "x" * rng.randint(3, 40),
+                            endpoint=f"HOST{rng.randint(1, 20)}", username=username,
+                            account_type=account_type))
+    return events
+
+
+def legacy_draw(self, ax, result, events, assignment, pixel_width, xlim):
+    """The pre-batching drawing: one artist per bar, marker, leader and label."""
+    x_lo, x_hi = xlim
+
+    def px_to_x(px):
+        return x_lo + (px / pixel_width) * (x_hi - x_lo)
+
+    def colour(event):
+        return render.colour_for(assignment[(event.account_type, event.username)])
+
+    for bar in result.iter_bars():
+        event = events[int(bar.id)]
+        y = -(bar.lane + 1) * self.style.lane_height_px
+        ax.hlines(y, px_to_x(bar.start_x_px), px_to_x(bar.end_x_px), color=colour(event),
+                  linewidth=4, capstyle="round", alpha=0.9)
+    for placed in result.iter_placed():
+        event = events[int(placed.id)]
+        if not event.is_span:
+            token = assignment[(event.account_type, event.username)]
+            ax.plot(mdates.date2num(event.datetime), 0, token.marker_token,
+                    color=colour(event), markersize=4, zorder=5)
+    for placed in result.iter_placed():
+        event = events[int(placed.id)]
+        anchor_x = mdates.date2num(event.datetime)
+        ax.plot([anchor_x, anchor_x], [0, placed.box_bottom_px],
+                color=colour(event), linewidth=0.4, alpha=0.6, zorder=1)
+        ax.text(px_to_x(placed.box_left_px), placed.box_bottom_px, placed.wrapped_text,
+                fontsize=self.style.font_size, ha="left", va="bottom", color="black", zorder=6,
+                bbox=dict(boxstyle="round,pad=0.2", facecolor="white", edgecolor=colour(event),
+                          linewidth=0.6, alpha=0.85))
+
+
+def run(events, draw, out_dir: Path, label: str, engine: str) -> dict[str, float]:
+    renderer = render.TimelineRenderer(engine=engine)
+    timings: dict[str, float] = {}
+    original_layout, original_draw = renderer._layout, render.TimelineRenderer._draw
+
+    def timed_layout(*args, **kwargs):
+        t0 = time.perf_counter()
+        out = original_layout(*args, **kwargs)
+        timings["layout"] = time.perf_counter() - t0
+        return out
+
+    def timed_draw(self, *args):
+        t0 = time.perf_counter()
+        draw(self, *args)
+        timings["draw"] = time.perf_counter() - t0
+
+    renderer._layout = timed_layout
+    render.TimelineRenderer._draw = timed_draw
+    try:
+        t0 = time.perf_counter()
+        rendered = renderer.render(events, accurate=False)
+        timings["render"] = time.perf_counter() - t0
+    finally:
+        render.TimelineRenderer._draw = original_draw
+    t0 = time.perf_counter()
+    rendered.figure.canvas.draw()
+    timings["canvas"] = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    render.export_svg(rendered, str(out_dir / f"{label}.svg"))
+    timings["svg"] = time.perf_counter() - t0
+    timings["svg_mb"] = (out_dir / f"{label}.svg").stat().st_size / 1e6
+    timings["artists"] = len(rendered.axes.get_children())
+    plt.close(rendered.figure)
+    return timings
+
+
+def run_direct(events, out_dir: Path, engine: str) -> dict[str, float]:
+    """Layout + :func:`timeline_creator.svg.export_svg_direct`, no figure."""
+    renderer = render.TimelineRenderer(engine=engine)
+    t0 = time.perf_counter()
+    renderer.export_svg_direct(events, str(out_dir / "direct.svg"))
+    total = time.perf_counter() - t0
+    return {"svg": total, "svg_mb": (out_dir / "direct.svg").stat().st_size / 1e6}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--engine", choices=("python", "array"), default="python")
+    parser.add_argument("--direct-svg", action="store_true",
+                        help="also time the direct SVG writer (layout included)")
+    parser.add_argument("--png-diff", action="store_true",
+                        help="also report the pixel difference between the two drawings")
+    args = parser.parse_args()
+
+    events = make_events(args.events)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        rows = {
+            "legacy": run(events, legacy_draw, out, "legacy", args.engine),
+            "batched": run(events, render.TimelineRenderer._draw, out, "batched", args.engine),
+        }
+        columns = ("layout", "draw", "render", "canvas", "svg", "svg_mb", "artists")
+        print(f"{args.events} events, {args.engine} engine")
+        print(f"{'':>8} " + " ".join(f"{c:>9}" for c in columns))
+        for name, row in rows.items():
+            print(f"{name:>8} " + " ".join(
+                f"{row[c]:>9.0f}" if c == "artists" else f"{row[c]:>9.3f}" for c in columns))
+        if args.direct_svg:
+            direct = run_direct(events, out, args.engine)
+            print(f"  direct layout+svg {direct['svg']:.3f}s, {direct['svg_mb']:.3f} MB")
+        if args.png_diff:
+            import numpy as np
+            images = []
+            for draw in (legacy_draw, render.TimelineRenderer._draw):
+                render.TimelineRenderer._draw, original = draw, render.TimelineRenderer._draw
+                try:
+                    rendered = render.TimelineRenderer(engine=args.engine).render(
+                        events, accurate=False)
+                finally:
+                    render.TimelineRenderer._draw = original
+                rendered.figure.canvas.draw()
+                images.append(np.asarray(rendered.figure.canvas.buffer_rgba(), dtype=float))
+                plt.close(rendered.figure)
+            diff = np.abs(images[0] - images[1])
+            print(f"png diff: mean {diff.mean():.4f}/255, "
+                  f"{(diff.max(axis=2) > 32).mean() * 100:.3f}% of pixels differ by >32")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,16 +16,25 @@ Layered package (see timeline_tool_scratchpad.md, decisions D1-D23):
 
   models      pydantic validation gate (Event, Investigation, AccountType)
   io          on-disk JSONL + meta sidecar (Timesketch-aligned)
+  event_cache binary columnar reopen cache for io (stdlib only)
+  sqlite_store  SQLite storage backend with SQL-side filtering (stdlib sqlite3)
+  lazy        mmap-backed lazy event access via a byte-offset index
+  merge       k-way streaming merge of investigations (super-timelines)
   importers   CSV / xlsx bulk import
+  plaso       plaso l2tcsv / JSON-lines and Timesketch JSONL import (streaming)
+  ingest      folder of CSV / xlsx exports into one case (process pool)
   filters     endpoint / user / time-window filtering
   colour      account-type -> hue family, username -> shade/marker (symbolic)
   layout      PURE pixel-aware label deconfliction
+  array_layout  numpy-backed twin of the layout engine (needs numpy)
+  measure     cached text measurement for the layout's measurer hook
+  svg         direct streaming SVG writer from a layout (no matplotlib)
   render      matplotlib rendering + SVG/PNG export (needs matplotlib)
   app         thin ipywidgets notebook UI (needs ipywidgets)
 
-The core (models, io, importers, filters, colour, layout) is pure Python with
-no pandas / matplotlib / ipywidgets dependency, so it is unit-testable in
-isolation. Only `render` and `app` pull in the heavy GUI/plotting stack.
+The core (models, io, event_cache, sqlite_store, lazy, merge, importers,
+plaso, ingest, filters, colour, layout, svg) is pure Python with no pandas / matplotlib / ipywidgets
+dependency, so it is unit-testable in isolation. Only `render` and `app` pull in the heavy GUI/plotting stack.
 """
 
 from .models import AccountType, Event, Investigation
@@ -38,6 +38,7 @@ import ipywidgets as widgets
 from IPython.display import display
 
 from . import importers, io
+from .measure import MeasureCache, cache_path_for
 from .models import AccountType, Event, Investigation
 
 _ACCOUNT_TYPE_OPTIONS = [(at.value, at) for at in AccountType]
@@ -55,6 +56,21 @@ def _enable_enter(text: "widgets.Text", handler) -> None:
         pass
 
 
+def _case_options(directory: Path) -> list[tuple[str, str]]:
+    """Open-dropdown entries, labelled from the directory catalogue (no case is loaded)."""
+    options = [("", "")]
+    for case in io.catalogue(directory):
+        if case.error:
+            label = f"{case.name} (unreadable)"
+        elif case.first is None:
+            label = f"{case.name} (empty)"
+        else:
+            label = (f"{case.name} — {case.events} events, {len(case.endpoints)} endpoints, "
+                     f"{case.first:%Y-%m-%d} → {case.last:%Y-%m-%d}")
+        options.append((label, case.name))
+    return options
+
+
 def _parse_utc(date_str: str, time_str: str) -> datetime:
     """Combine a YYYY-MM-DD date and HH:MM[:SS] time into an aware UTC datetime."""
     date_str, time_str = date_str.strip(), time_str.strip()
@@ -73,6 +89,8 @@ class TimelineApp:
 
     def __init__(self, directory: str | Path = "."):
         self.directory = Path(directory)
+        # Save appends changes, not the whole case; compactions refresh the reopen cache
+        self._store = io.Journal(self.directory, cache=True)
         self.investigation: Investigation | None = None
         self._renderer = None      # lazy: importing render pulls in matplotlib
         self._rendered = None      # last RenderedTimeline
@@ -100,7 +118,7 @@ class TimelineApp:
         name = widgets.Text(description="Investigation:", placeholder="case name",
                             style={"description_width": "auto"},
                             layout=widgets.Layout(width="360px"))
-        existing = widgets.Dropdown(description="Open:", options=[""] + io.list_investigations(self.directory),
+        existing = widgets.Dropdown(description="Open:", options=_case_options(self.directory),
                                     style={"description_width": "auto"})
         create_btn = widgets.Button(description="Create", button_style="success")
         open_btn = widgets.Button(description="Open", button_style="info")
@@ -138,7 +156,7 @@ class TimelineApp:
                 status.clear_output()
             try:
                 target = existing.value or name.value.strip()
-                result = io.load(target, self.directory)
+                result = self._store.load(target, trusted=True)
                 self.investigation = result.investigation
                 name.value = self.investigation.name
                 for warning in result.warnings:
@@ -152,9 +170,9 @@ class TimelineApp:
         def on_save(_):
             try:
                 inv = self._require_investigation()
-                jsonl, meta = io.save(inv, self.directory)
-                existing.options = [""] + io.list_investigations(self.directory)
-                self._status(status, f"saved {jsonl.name} + {meta.name}.")
+                written, meta = self._store.save(inv)
+                existing.options = _case_options(self.directory)
+                self._status(status, f"saved {written.name} + {meta.name}.")
             except Exception as exc:  # noqa: BLE001
                 self._status(status, str(exc), error=True)
 
@@ -234,6 +252,18 @@ class TimelineApp:
                                    layout=widgets.Layout(width="640px", height="120px"))
         csv_btn = widgets.Button(description="Import CSV", button_style="info")
         xlsx_up = widgets.FileUpload(accept=".xlsx", multiple=False, description="Upload .xlsx")
+        xlsx_sheets = widgets.Text(description="Sheets:",
+                                   placeholder="active sheet, or names, comma-separated",
+                                   style={"description_width": "auto"})
+        import_progress = widgets.IntProgress(description="Importing:", min=0, max=1,
+                                              style={"description_width": "auto"},
+                                              layout=widgets.Layout(visibility="hidden"))
+
+        def show_progress(rows, done, total):
+            import_progress.layout.visibility = "visible"
+            import_progress.description = f"{rows:,} rows:"
+            if total:
+                import_progress.max, import_progress.value = total, done
 
         def refresh_table():
             inv = self.investigation
@@ -286,7 +316,7 @@ class TimelineApp:
             try:
                 inv = self._require_investigation()
                 if row_pick.value is not None:
-                    removed = inv.events.pop(row_pick.value)
+                    removed = inv.remove_event(row_pick.value)
                     refresh_table()
                     self._status(status, f"deleted '{removed.message}'.")
             except Exception as exc:  # noqa: BLE001
@@ -307,7 +337,7 @@ class TimelineApp:
                 if e.end:
                     end_date.value = e.end.date().isoformat()
                     end_time.value = e.end.strftime("%H:%M:%S")
-                inv.events.pop(row_pick.value)  # editing == delete + re-add on submit
+                inv.remove_event(row_pick.value)  # editing == delete + re-add on submit
                 refresh_table()
                 self._status(status, "loaded into form; resubmit to save the edit.")
             except Exception as exc:  # noqa: BLE001
@@ -320,20 +350,24 @@ class TimelineApp:
                     self._status(status, f"import rejected — {len(result.errors)} bad row(s):",
                                  error=True)
                     for err in result.errors:
-                        print(f"   row {err.row}: {err.message}")
+                        where = f"{err.source} row {err.row}" if err.source else f"row {err.row}"
+                        print(f"   {where}: {err.message}")
                 return
             for event in result.events:
                 inv.add_event(event)
             refresh_table()
             if getattr(self, "_refresh_catalogues", None):
                 self._refresh_catalogues()
-            self._status(status, f"imported {len(result.events)} event(s).")
+            skipped = f", skipped {result.duplicates} duplicate(s)" if result.duplicates else ""
+            self._status(status, f"imported {len(result.events)} event(s){skipped}.")
 
         def on_csv(_):
             with status:
                 status.clear_output()
             try:
-                _commit_import(importers.parse_csv(csv_box.value))
+                _commit_import(importers.parse_csv(
+                    csv_box.value, investigation=self._require_investigation(),
+                    duplicates="skip"))
             except Exception as exc:  # noqa: BLE001
                 self._status(status, str(exc), error=True)
 
@@ -346,9 +380,14 @@ class TimelineApp:
                 item = next(iter(xlsx_up.value.values())) if isinstance(xlsx_up.value, dict) \
                     else xlsx_up.value[0]
                 content = item["content"] if isinstance(item, dict) else item.content
-                _commit_import(importers.parse_xlsx(bytes(content)))
+                sheets = [n.strip() for n in xlsx_sheets.value.split(",") if n.strip()]
+                _commit_import(importers.parse_xlsx(
+                    bytes(content), sheets=sheets or None, progress=show_progress,
+                    investigation=self._require_investigation(), duplicates="skip"))
             except Exception as exc:  # noqa: BLE001
                 self._status(status, str(exc), error=True)
+            finally:
+                import_progress.layout.visibility = "hidden"
 
         add_btn.on_click(on_add)
         delete_btn.on_click(on_delete)
@@ -370,8 +409,8 @@ class TimelineApp:
             widgets.HBox([row_pick, edit_btn, delete_btn]),
             widgets.HTML("<hr style='margin:6px 0'><b>Add / edit event</b>"), form,
             widgets.HTML("<hr style='margin:6px 0'><b>Bulk import</b>"),
-            csv_box, widgets.HBox([csv_btn, xlsx_up]),
-            status,
+            csv_box, widgets.HBox([csv_btn, xlsx_up, xlsx_sheets]),
+            import_progress, status,
         ])
 
     # =====================================================================
@@ -382,6 +421,11 @@ class TimelineApp:
         if self._renderer is None:
             from .render import TimelineRenderer  # lazy: pulls in matplotlib
             self._renderer = TimelineRenderer()
+        # text widths persist next to the open investigation
+        inv = self.investigation
+        cache_path = cache_path_for(inv.name, self.directory) if inv else None
+        if self._renderer.measure_cache.path != cache_path:
+            self._renderer.measure_cache = MeasureCache(path=cache_path)
         return self._renderer
 
     def display_panel(self) -> widgets.Widget:
@@ -406,6 +450,8 @@ class TimelineApp:
         svg_name = widgets.Text(value="timeline.svg", description="SVG file:",
                                 style={"description_width": "auto"})
         export_svg_btn = widgets.Button(description="Export SVG", button_style="primary")
+        direct_svg = widgets.Checkbox(value=False, description="direct (large timelines)",
+                                      indent=False)
         png_name = widgets.Text(value="timeline.png", description="PNG file:",
                                 style={"description_width": "auto"})
         export_png_btn = widgets.Button(description="Export PNG")
@@ -472,8 +518,11 @@ class TimelineApp:
                                      into_figure=self._rendered.figure)
                 self._rendered = rt
                 rt.figure.canvas.draw_idle()
+                cache = renderer.measure_cache
                 with status:
-                    self._status(status, "re-laid out for the current view.")
+                    self._status(status, "re-laid out for the current view "
+                                         f"(text cache: {cache.hits} hits / "
+                                         f"{cache.misses} misses).")
             except Exception as exc:  # noqa: BLE001
                 self._status(status, str(exc), error=True)
 
@@ -481,7 +530,11 @@ class TimelineApp:
             try:
                 if self._rendered is None:
                     raise RuntimeError("render a timeline first.")
-                path = render_mod.export_svg(self._rendered, svg_name.value)
+                if direct_svg.value:
+                    path = self._get_renderer().export_svg_direct(
+                        _filtered_events(), svg_name.value, window=self._rendered.window)
+                else:
+                    path = render_mod.export_svg(self._rendered, svg_name.value)
                 self._status(status, f"wrote {path}.")
             except Exception as exc:  # noqa: BLE001
                 self._status(status, str(exc), error=True)
@@ -510,7 +563,7 @@ class TimelineApp:
             widgets.HBox([all_btn, clear_btn]),
             widgets.HBox([start_in, end_in]),
             widgets.HBox([render_btn, relayout_btn]),
-            widgets.HBox([svg_name, export_svg_btn, png_name, export_png_btn]),
+            widgets.HBox([svg_name, direct_svg, export_svg_btn, png_name, export_png_btn]),
             status,
         ])
         return widgets.VBox([controls, plot])
@@ -27,8 +27,10 @@ colours; username-only keying made the same name under different account types
 ambiguous.
 
 This module emits *symbolic* tokens only (family name + shade index + marker
-token). :mod:`timeline_creator.render` maps those tokens to concrete matplotlib
-colours/markers, keeping this layer pure and unit-testable.
+token). The concrete hex ramps behind the families also live here
+(:data:`FAMILY_RAMPS`, :func:`hex_for`) so every backend — matplotlib in
+:mod:`timeline_creator.render`, the direct writer in :mod:`timeline_creator.svg`
+— draws a token the same way, while this layer stays pure and unit-testable.
 """
 
 from __future__ import annotations
@@ -38,7 +40,7 @@ from collections.abc import Sequence
 
 from .models import AccountType, Event
 
-# account type -> hue family name. render owns the actual colour ramps.
+# account type -> hue family name.
 FAMILY_BY_ACCOUNT_TYPE: dict[AccountType, str] = {
     AccountType.PRIVILEGED: "reds",
     AccountType.EDR: "blues",
@@ -52,9 +54,20 @@ FAMILY_BY_ACCOUNT_TYPE: dict[AccountType, str] = {
 # Number of distinguishable shades render provides per family ramp.
 SHADES_PER_FAMILY = 4
 
-# Marker tokens used once a family's shades are exhausted (render maps to mpl).
+# Marker tokens used once a family's shades are exhausted (matplotlib marker codes).
 MARKERS: tuple[str, ...] = ("o", "s", "^", "D", "v", "P", "X", "*")
 
+# Concrete colour ramps per family (light -> dark), SHADES_PER_FAMILY entries each.
+FAMILY_RAMPS: dict[str, list[str]] = {
+    "reds":    ["#fcae91", "#fb6a4a", "#de2d26", "#a50f15"],
+    "blues":   ["#9ecae1", "#4292c6", "#2171b5", "#084594"],
+    "greys":   ["#bdbdbd", "#969696", "#636363", "#252525"],
+    "oranges": ["#fdbe85", "#fd8d3c", "#e6550d", "#a63603"],
+    "greens":  ["#a1d99b", "#41ab5d", "#238b45", "#005a32"],
+    "purples": ["#bcbddc", "#807dba", "#6a51a3", "#4a1486"],
+    "neutral": ["#bdbdbd", "#737373", "#525252", "#252525"],
+}
+
 
 @dataclass(frozen=True)
 class ColourToken:
@@ -78,6 +91,12 @@ class LegendGroup:
     entries: list[LegendEntry]
 
 
+def hex_for(token: ColourToken) -> str:
+    """Concrete hex colour for a symbolic token."""
+    ramp = FAMILY_RAMPS.get(token.family, FAMILY_RAMPS["neutral"])
+    return ramp[token.shade_index % SHADES_PER_FAMILY]
+
+
 def _distinct_pairs(events: Sequence[Event]) -> list[tuple[AccountType, str]]:
     """Distinct (account_type, username) pairs, in a deterministic order."""
     seen: set[tuple[AccountType, str]] = set()
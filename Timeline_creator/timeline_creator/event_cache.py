@@ -0,0 +1,187 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Binary columnar cache of an investigation's events (``<name>.events.bin``).
+
+Re-opening a large case otherwise re-parses JSON and re-validates every record.
+The cache stores the events exactly as loading ``<name>.jsonl`` would produce
+them, column-wise, using only the stdlib (``array`` + ``struct``):
+
+  * start / end as int64 epoch nanoseconds (end = ``NO_END`` for points);
+  * endpoint, username and account_type dictionary-encoded as uint32 codes;
+  * message and span_id as UTF-8 blobs with uint64 code-point offsets (each
+    blob is decoded once and sliced).
+
+A JSON header carries the dictionaries, the load warnings and the SHA-256 of
+the ``.jsonl`` it was built from. The ``.jsonl`` stays the source of truth: a
+cache whose hash does not match is ignored. Because the hash pins the cache to
+a file this tool wrote from validated events, events are rebuilt with
+:meth:`Event.construct_trusted` (no re-validation).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .models import AccountType, Event
+
+MAGIC = b"TCEV"
+FORMAT_VERSION = 1
+NO_END = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PREAMBLE = struct.Struct("<4sII")  # magic, format version, header length
+
+
+def cache_path(name: str, directory: str | Path = ".") -> Path:
+    return Path(directory) / f"{name}.events.bin"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _epoch_ns(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+def _from_epoch_ns(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value // 1000)
+
+
+def _blob(strings: Sequence[str]) -> tuple[array, bytes]:
+    offsets = array("Q", [0])
+    total = 0
+    for text in strings:
+        total += len(text)
+        offsets.append(total)
+    return offsets, "".join(strings).encode("utf-8")
+
+
+def _slices(text: str, offsets: array) -> list[str]:
+    return [text[a:b] for a, b in zip(offsets, offsets[1:])]
+
+
+def _codes(values: Sequence[str]) -> tuple[list[str], array]:
+    index: dict[str, int] = {}
+    codes = array("I", (index.setdefault(v, len(index)) for v in values))
+    return list(index), codes
+
+
+def write_cache(path: str | Path, events: Sequence[Event], jsonl_sha256: str,
+                warnings: Sequence[str] = ()) -> Path:
+    """Write ``events`` (as loaded from a ``.jsonl`` with that hash) to ``path``."""
+    path = Path(path)
+    starts = array("q", (_epoch_ns(e.datetime) for e in events))
+    ends = array("q", (NO_END if e.end is None else _epoch_ns(e.end) for e in events))
+    endpoints, endpoint_codes = _codes([e.endpoint for e in events])
+    usernames, username_codes = _codes([e.username for e in events])
+    account_types, account_codes = _codes([e.account_type.value for e in events])
+    message_offsets, messages = _blob([e.message for e in events])
+    span_offsets, span_ids = _blob([e.span_id or "" for e in events])
+
+    columns = [starts, ends, endpoint_codes, username_codes, account_codes,
+               message_offsets, span_offsets]
+    header = json.dumps({
+        "jsonl_sha256": jsonl_sha256,
+        "count": len(events),
+        "byteorder": sys.byteorder,
+        "endpoints": endpoints,
+        "usernames": usernames,
+        "account_types": account_types,
+        "blob_lengths": [len(messages), len(span_ids)],
+        "warnings": list(warnings),
+    }).encode("utf-8")
+
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        handle.write(header)
+        for column in columns:
+            column.tofile(handle)
+        handle.write(messages)
+        handle.write(span_ids)
+    os.replace(tmp, path)
+    return path
+
+
+def read_cache(path: str | Path, jsonl_sha256: str) -> tuple[list[Event], list[str]] | None:
+    """Events and load warnings from ``path``, or None if missing/stale/damaged."""
+    path = Path(path)
+    try:
+        data = path.read_bytes()
+        magic, version, header_length = _PREAMBLE.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        offset = _PREAMBLE.size
+        header = json.loads(data[offset:offset + header_length])
+        if header["jsonl_sha256"] != jsonl_sha256:
+            return None
+        offset += header_length
+        count = header["count"]
+
+        def column(typecode: str, length: int) -> array:
+            nonlocal offset
+            values = array(typecode)
+            values.frombytes(data[offset:offset + length * values.itemsize])
+            if len(values) != length:
+                raise ValueError("truncated column")
+            offset += length * values.itemsize
+            if header["byteorder"] != sys.byteorder:
+                values.byteswap()
+            return values
+
+        starts, ends = column("q", count), column("q", count)
+        endpoint_codes, username_codes, account_codes = (column("I", count) for _ in range(3))
+        message_offsets, span_offsets = column("Q", count + 1), column("Q", count + 1)
+        message_length, span_length = header["blob_lengths"]
+        messages = data[offset:offset + message_length]
+        span_ids = data[offset + message_length:offset + message_length + span_length]
+        if len(span_ids) != span_length:
+            return None
+
+        endpoints, usernames = header["endpoints"], header["usernames"]
+        account_types = [AccountType(value) for value in header["account_types"]]
+        texts = _slices(_decoded(messages, message_offsets), message_offsets)
+        span_texts = _slices(_decoded(span_ids, span_offsets), span_offsets)
+        construct = Event.construct_trusted
+        events = [
+            construct(_from_epoch_ns(start), message, endpoints[endpoint], usernames[username],
+                      account_types[account], None if end == NO_END else _from_epoch_ns(end),
+                      span_id or None)
+            for start, end, endpoint, username, account, message, span_id in zip(
+                starts, ends, endpoint_codes, username_codes, account_codes, texts, span_texts)
+        ]
+        return events, list(header["warnings"])
+    except (OSError, ValueError, KeyError, IndexError, TypeError, OverflowError,
+            struct.error):  # UnicodeDecodeError is a ValueError
+        return None
+
+
+def _decoded(blob: bytes, offsets: array) -> str:
+    """``blob`` as text, checked against the code-point offsets that slice it."""
+    text = blob.decode("utf-8")
+    if offsets[0] != 0 or offsets[-1] != len(text):
+        raise ValueError("offsets do not span the blob")
+    return text
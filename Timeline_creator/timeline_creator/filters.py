@@ -46,7 +46,8 @@ def by_users(events: Sequence[Event], usernames: Iterable[str] | None) -> list[E
     return [e for e in events if e.username in allowed]
 
 
-def _intersects(event: Event, start: datetime | None, end: datetime | None) -> bool:
+def intersects(event: Event, start: datetime | None, end: datetime | None) -> bool:
+    """Whether ``event`` (a point, or a span's full extent) touches ``[start, end]``."""
     event_end = event.end if event.is_span else event.datetime
     if start is not None and event_end < start:
         return False
@@ -71,7 +72,7 @@ def by_time_window(events: Sequence[Event], start: datetime | None = None,
 
     Spans crossing a bound are clipped to the window when ``clip`` is True.
     """
-    kept = [e for e in events if _intersects(e, start, end)]
+    kept = [e for e in events if intersects(e, start, end)]
     if clip:
         kept = [_clip(e, start, end) for e in kept]
     return kept
@@ -25,19 +25,54 @@ endpoints/usernames are NOT errors — they are returned for auto-adding (D18).
 
 Import timestamps may be naive; they are assumed UTC by default (the DFIR norm,
 matching the "enter in UTC" entry default), then validated as aware by the
-model. Pass ``assume_utc=False`` to require explicit offsets.
+model. Pass ``assume_utc=False`` to require explicit offsets. A column is
+sampled to pick one parser for all its cells (ISO, or one fallback format
+compiled to a regex); cells that parser rejects are parsed one by one as before.
+
+Large exports go through :func:`stage_csv` instead of :func:`parse_csv`: the
+file is read and validated in chunks, valid events are staged to a temporary
+JSONL file rather than held, and :meth:`StagedImport.commit` streams them into
+a saved case in one atomic replace — the same all-or-nothing guarantee with
+memory bounded by the chunk size, not the file size. :func:`stage_xlsx` does
+the same for workbooks, streaming worksheet rows; both xlsx entry points can
+import any worksheet, or several in one pass (``sheets=``).
+
+Validation is per-row pydantic work, so every entry point takes ``workers``:
+above 1, chunks are validated in a process pool and merged back in input
+order, with the same events, row numbers and messages as a serial run.
+
+Re-imported overlapping exports are caught by ``duplicates=`` (on
+:func:`parse_csv` / :func:`parse_xlsx` against an ``investigation``, and on
+:meth:`StagedImport.commit` against the saved case): ``"skip"`` drops an event
+whose :meth:`Event.content_key` is already there or earlier in the batch,
+``"report"`` keeps it; both count them in ``duplicates``. Each lookup is one
+hash and one set probe.
 """
 
 from __future__ import annotations
 
 import csv
 import io as _io
+import json
+import os
+import re
+import tempfile
+import zipfile
+from collections import deque
+from collections.abc import Callable, Container, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
+from itertools import chain, count, islice
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO, TypeVar
 
 from pydantic import ValidationError
 
-from .models import AccountType, Event
+from . import io
+from .models import AccountType, Event, Investigation
 
 REQUIRED_COLUMNS = ("datetime", "message", "endpoint", "username", "account_type")
 OPTIONAL_COLUMNS = ("end", "span_id")
@@ -54,15 +89,27 @@ _HEADER_ALIASES = {
     "endtime": "end",
 }
 
+_T = TypeVar("_T")
+
+# What to do with an event already imported: keep it, skip it, or keep and count it.
+DUPLICATES = ("keep", "skip", "report")
+
+# Rows validated per chunk (and per process-pool task when workers > 1).
+CHUNK_ROWS = 10_000
+
 # ISO first; a couple of unambiguous space-separated fallbacks. Slash formats are
 # intentionally rejected (dd/mm vs mm/dd is ambiguous -> ask for ISO).
 _FALLBACK_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S")
 
+# Non-empty cells of a datetime column sampled to pick its parser.
+_SAMPLE_CELLS = 20
+
 
 @dataclass
 class RowError:
     row: int  # 1-based data row number (header is row 0)
     message: str
+    source: str | None = None  # the worksheet, for an xlsx import
 
 
 @dataclass
@@ -71,6 +118,7 @@ class ImportResult:
     errors: list[RowError] = field(default_factory=list)
     discovered_endpoints: list[str] = field(default_factory=list)
     discovered_users: dict[str, AccountType] = field(default_factory=dict)
+    duplicates: int = 0  # skipped (or, with duplicates="report", kept) re-imports
 
     @property
     def ok(self) -> bool:
@@ -115,15 +163,123 @@ def _parse_dt(value, assume_utc: bool) -> datetime:
     return dt
 
 
-def _row_to_event(row: dict, assume_utc: bool) -> Event:
-    """Build one Event from a column->value dict. Raises on any problem."""
+def _iso_aware(text: str) -> datetime:
+    dt = datetime.fromisoformat(text)  # takes a trailing Z itself from Python 3.11
+    if dt.tzinfo is None:
+        raise ValueError("no offset")
+    return dt
+
+
+def _iso_z(text: str) -> datetime:
+    # _parse_dt's own Z handling, for Pythons whose fromisoformat lacks it. A
+    # date-only text ignores the offset; that cell is left to _parse_dt.
+    if text[-1:] != "Z":
+        raise ValueError("no Z suffix")
+    dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        raise ValueError("offset ignored")
+    return dt
+
+
+def _iso_naive_as_utc(text: str) -> datetime:
+    # Not fromisoformat(text + "+00:00"): a date-only text ignores the offset.
+    dt = datetime.fromisoformat(text)
+    if dt.tzinfo is not None:
+        raise ValueError("has an offset")
+    return dt.replace(tzinfo=timezone.utc)
+
+
+# strptime directive -> the digits it accepts; datetime() then range-checks.
+_DIRECTIVES = {"%Y": r"(\d{4})", "%m": r"(\d{1,2})", "%d": r"(\d{1,2})",
+               "%H": r"(\d{1,2})", "%M": r"(\d{1,2})", "%S": r"(\d{1,2})"}
+
+
+def _compile_format(fmt: str) -> re.Pattern:
+    """A regex equivalent to ``strptime(text, fmt)`` for a :data:`_FALLBACK_FORMATS` entry.
+
+    Fields must be in datetime-constructor order (year first), as they are there.
+    """
+    return re.compile("".join(_DIRECTIVES.get(part, re.escape(part))
+                              for part in re.split(r"(%[YmdHMS])", fmt)))
+
+
+def _matched_as_utc(pattern: re.Pattern, text: str) -> datetime:
+    match = pattern.fullmatch(text)
+    if match is None:
+        raise ValueError(f"does not match {pattern.pattern}")
+    return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+
+
+_COMPILED_FALLBACKS = [partial(_matched_as_utc, _compile_format(fmt)) for fmt in _FALLBACK_FORMATS]
+
+
+def _candidate_parsers(assume_utc: bool) -> list[Callable[[str], datetime]]:
+    """The parsers :func:`_column_parser` tries, in order."""
+    candidates: list[Callable[[str], datetime]] = [_iso_aware, _iso_z]
+    if assume_utc:
+        candidates += [_iso_naive_as_utc, *_COMPILED_FALLBACKS]
+    return candidates
+
+
+def _column_parser(values: Iterable, assume_utc: bool) -> Callable[[str], datetime] | None:
+    """The one parser that reads every sampled cell of a column, if there is one.
+
+    Candidates agree with :func:`_parse_dt` wherever they succeed, and a cell
+    they reject goes back to :func:`_parse_dt`, so choosing one never changes
+    a result or an error message — it only skips the per-cell search.
+    """
+    sample = [value.strip() for value in islice(
+        (v for v in values if isinstance(v, str) and v.strip()), _SAMPLE_CELLS)]
+    if not sample:
+        return None
+    for parser in _candidate_parsers(assume_utc):
+        try:
+            for text in sample:
+                parser(text)
+        except ValueError:
+            continue
+        return parser
+    return None
+
+
+def _column_parsers(columns: list[str], rows: list[list],
+                    assume_utc: bool) -> dict[str, Callable[[str], datetime]]:
+    """:func:`_column_parser` for the ``datetime`` and ``end`` columns of ``rows``."""
+    position = {name: i for i, name in enumerate(columns)}  # last wins, as in _validate
+    parsers = {}
+    for name in ("datetime", "end"):
+        if name in position:
+            i = position[name]
+            parser = _column_parser((raw[i] for raw in rows if i < len(raw)), assume_utc)
+            if parser is not None:
+                parsers[name] = parser
+    return parsers
+
+
+def _parse_cell(value, parser: Callable[[str], datetime] | None, assume_utc: bool) -> datetime:
+    if parser is not None and isinstance(value, str):
+        try:
+            return parser(value.strip())
+        except ValueError:
+            pass  # not this column's usual shape
+    return _parse_dt(value, assume_utc)
+
+
+def _row_to_event(row: dict, assume_utc: bool,
+                  parsers: dict[str, Callable[[str], datetime]] | None = None) -> Event:
+    """Build one Event from a column->value dict. Raises on any problem.
+
+    ``parsers`` are the column-level datetime parsers from :func:`_column_parsers`.
+    """
     missing = [c for c in REQUIRED_COLUMNS if not str(row.get(c, "")).strip()]
     if missing:
         raise ValueError(f"missing required value(s): {', '.join(missing)}")
 
-    dt = _parse_dt(row["datetime"], assume_utc)
+    parsers = parsers or {}
+    dt = _parse_cell(row["datetime"], parsers.get("datetime"), assume_utc)
     end_raw = row.get("end")
-    end = _parse_dt(end_raw, assume_utc) if end_raw not in (None, "") else None
+    end = (_parse_cell(end_raw, parsers.get("end"), assume_utc)
+           if end_raw not in (None, "") else None)
     account_type = AccountType(str(row["account_type"]).strip())
     span_id = (str(row["span_id"]).strip() or None) if row.get("span_id") else None
 
@@ -138,8 +294,8 @@ def _row_to_event(row: dict, assume_utc: bool) -> Event:
     )
 
 
-def _rows_to_result(header: list[str], rows: list[list], assume_utc: bool) -> ImportResult:
-    """Validate a header + raw rows into an ImportResult (all-or-nothing)."""
+def _columns(header: list[str]) -> list[str]:
+    """Canonical column names for a header row; raises if a required one is missing."""
     columns = [_normalise_header(h) for h in header]
     missing_cols = [c for c in REQUIRED_COLUMNS if c not in columns]
     if missing_cols:
@@ -147,25 +303,156 @@ def _rows_to_result(header: list[str], rows: list[list], assume_utc: bool) -> Im
             f"missing required column(s): {', '.join(missing_cols)}. "
             f"Expected header: {', '.join(REQUIRED_COLUMNS)} (+ optional end, span_id)."
         )
+    return columns
+
+
+def _validate(columns: list[str], raw: list, data_index: int, assume_utc: bool,
+              parsers: dict[str, Callable[[str], datetime]] | None = None
+              ) -> Event | RowError | None:
+    """One raw row as an Event, a RowError, or None for a wholly blank row."""
+    row = {columns[i]: raw[i] for i in range(min(len(columns), len(raw)))}
+    if not any(str(v).strip() for v in row.values()):
+        return None  # skip wholly blank lines
+    try:
+        return _row_to_event(row, assume_utc, parsers)
+    except ValidationError as exc:
+        messages = "; ".join(
+            f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()
+        )
+        return RowError(data_index, messages)
+    except (ValueError, KeyError) as exc:
+        return RowError(data_index, str(exc))
+
+
+# A source-format reader run on each raw record before validation (in the
+# worker): returns the row in the table's columns, or None to skip the record.
+_Convert = Callable[[Any], "Sequence | None"]
+
 
+def _converted(convert: _Convert, raw, data_index: int) -> Sequence | RowError | None:
+    try:
+        return convert(raw)
+    except (ValueError, KeyError) as exc:
+        return RowError(data_index, str(exc))
+
+
+def _validate_chunk(columns: list[str], first_row: int, rows: list, assume_utc: bool,
+                    convert: _Convert | None = None) -> list[Event | RowError]:
+    """:func:`_validate` over rows numbered from ``first_row``, blank rows dropped.
+
+    The datetime columns are sampled once per chunk (:func:`_column_parsers`).
+    """
+    if convert is not None:
+        rows = [_converted(convert, raw, data_index)
+                for data_index, raw in enumerate(rows, start=first_row)]
+    parsers = _column_parsers(columns, [raw for raw in rows
+                                        if raw is not None and not isinstance(raw, RowError)],
+                              assume_utc)
+    outcomes = (raw if raw is None or isinstance(raw, RowError)
+                else _validate(columns, raw, data_index, assume_utc, parsers)
+                for data_index, raw in enumerate(rows, start=first_row))
+    return [outcome for outcome in outcomes if outcome is not None]
+
+
+def _validated_chunks(task: Callable[..., _T], columns: list[str], rows: Iterable,
+                      assume_utc: bool, chunk_size: int, workers: int,
+                      convert: _Convert | None = None) -> Iterator[_T]:
+    """Run ``task`` over ``rows`` (numbered from 1) ``chunk_size`` at a time, in order.
+
+    With ``workers > 1`` the chunks go to a process pool; at most two chunks
+    per worker are in flight, so memory stays bounded by the chunk size and
+    results come back in the order the rows were read. A chunk travels as its
+    first row number plus the bare rows, which pickle far faster than pairs.
+    """
+    rows = iter(rows)
+    chunks = zip(count(1, chunk_size), iter(lambda: list(islice(rows, chunk_size)), []))
+    if workers <= 1:
+        for first_row, chunk in chunks:
+            yield task(columns, first_row, chunk, assume_utc, convert)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future] = deque()
+        for first_row, chunk in chunks:
+            pending.append(pool.submit(task, columns, first_row, chunk, assume_utc, convert))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@dataclass
+class _Table:
+    """One header-checked run of rows to validate: a CSV, or one worksheet."""
+
+    source: str | None
+    columns: list[str]
+    rows: Iterator  # data rows after the header (non-blank, unless ``convert`` skips them)
+    convert: _Convert | None = None
+
+
+# Where a source's reader is, as progress's (done, total).
+_Position = Callable[[], "tuple[int | None, int | None]"]
+
+
+class _Duplicates:
+    """Content keys already imported (``known``) plus those seen in this batch."""
+
+    def __init__(self, mode: str, known: Container[bytes] = ()):
+        if mode not in DUPLICATES:
+            raise ValueError(f"duplicates must be one of {', '.join(DUPLICATES)}, not {mode!r}")
+        self.mode = mode
+        self.known = known
+        self.seen: set[bytes] = set()
+        self.count = 0
+
+    def remember(self, events: Iterable[Event]) -> Iterator[Event]:
+        """Pass ``events`` through, adding their keys to ``seen``."""
+        for event in events:
+            self.seen.add(event.content_key())
+            yield event
+
+    def keep(self, event: Event) -> bool:
+        """Whether ``event`` goes in; a duplicate is counted either way."""
+        if self.mode == "keep":
+            return True
+        key = event.content_key()
+        if key in self.seen or key in self.known:
+            self.count += 1
+            return self.mode == "report"
+        self.seen.add(key)
+        return True
+
+
+def _duplicates(mode: str, investigation: Investigation | None) -> _Duplicates:
+    if investigation is None or mode == "keep":
+        return _Duplicates(mode)
+    return _Duplicates(mode, investigation.content_keys())
+
+
+def _collect(tables: Iterable[_Table], assume_utc: bool, workers: int,
+             progress: Progress | None = None,
+             position: _Position = lambda: (None, None),
+             duplicates: _Duplicates | None = None) -> ImportResult:
+    """Validate every table into one ImportResult (all-or-nothing)."""
     result = ImportResult()
-    for data_index, raw in enumerate(rows, start=1):
-        row = {columns[i]: raw[i] for i in range(min(len(columns), len(raw)))}
-        if not any(str(v).strip() for v in row.values()):
-            continue  # skip wholly blank lines
-        try:
-            event = _row_to_event(row, assume_utc)
-        except ValidationError as exc:
-            messages = "; ".join(
-                f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in exc.errors()
-            )
-            result.errors.append(RowError(data_index, messages))
-        except (ValueError, KeyError) as exc:
-            result.errors.append(RowError(data_index, str(exc)))
-        else:
-            result.events.append(event)
+    rows = 0
+    for table in tables:
+        for outcomes in _validated_chunks(_validate_chunk, table.columns, table.rows,
+                                          assume_utc, CHUNK_ROWS, workers, table.convert):
+            for outcome in outcomes:
+                if isinstance(outcome, RowError):
+                    outcome.source = table.source
+                    result.errors.append(outcome)
+                else:
+                    result.events.append(outcome)
+            rows += len(outcomes)
+            if progress is not None:
+                progress(rows, *position())
 
     if result.ok:
+        if duplicates is not None and duplicates.mode != "keep":
+            result.events = [event for event in result.events if duplicates.keep(event)]
+            result.duplicates = duplicates.count
         for event in result.events:
             if event.endpoint not in result.discovered_endpoints:
                 result.discovered_endpoints.append(event.endpoint)
@@ -175,33 +462,396 @@ def _rows_to_result(header: list[str], rows: list[list], assume_utc: bool) -> Im
     return result
 
 
-def parse_csv(text: str, *, assume_utc: bool = True) -> ImportResult:
-    """Parse pasted CSV (with a header row) into an ImportResult."""
-    reader = list(csv.reader(_io.StringIO(text)))
-    rows = [r for r in reader if any(str(c).strip() for c in r)]
-    if not rows:
+def _csv_table(text: TextIO) -> _Table:
+    rows = _non_blank(csv.reader(text))
+    header = next(rows, None)
+    if header is None:
         raise ImportError_("no data found (expected a header row + at least one row).")
-    return _rows_to_result(rows[0], rows[1:], assume_utc)
+    return _Table(None, _columns(header), rows)
+
+
+def parse_csv(text: str, *, assume_utc: bool = True, workers: int = 1,
+              investigation: Investigation | None = None,
+              duplicates: str = "keep") -> ImportResult:
+    """Parse pasted CSV (with a header row) into an ImportResult.
+
+    ``workers > 1`` validates rows in that many processes (see
+    :func:`_validated_chunks`); the result is identical either way.
+    ``duplicates`` (one of :data:`DUPLICATES`) checks events against
+    ``investigation`` and each other.
+    """
+    dedup = _duplicates(duplicates, investigation)
+    return _collect([_csv_table(_io.StringIO(text))], assume_utc, workers, duplicates=dedup)
+
+
+def _non_blank(reader: Iterable[list[str]]) -> Iterator[list[str]]:
+    return (r for r in reader if "".join(r).strip())
+
+
+# progress(rows validated, done, total): done/total count bytes of a CSV file or
+# worksheet rows of an xlsx workbook, and are None where unknown (a CSV stream).
+Progress = Callable[[int, "int | None", "int | None"], None]
+
+
+def _staged_record(event: Event) -> str:
+    return json.dumps({
+        "datetime": event.datetime.isoformat(),
+        "end": event.end.isoformat() if event.end is not None else None,
+        "message": event.message,
+        "endpoint": event.endpoint,
+        "username": event.username,
+        "account_type": event.account_type.value,
+        "span_id": event.span_id,
+    })
+
+
+def _staged_event(line: str) -> Event:
+    """Rebuild a staged event; it was validated before it was written."""
+    record = json.loads(line)
+    end = record["end"]
+    return Event.construct_trusted(
+        datetime.fromisoformat(record["datetime"]),
+        record["message"],
+        record["endpoint"],
+        record["username"],
+        AccountType(record["account_type"]),
+        datetime.fromisoformat(end) if end is not None else None,
+        record["span_id"],
+    )
+
+
+@dataclass
+class _StagedChunk:
+    """One validated chunk, reduced to what :func:`stage_csv` writes and merges.
+
+    Far cheaper to send back from a worker than the chunk's events.
+    """
 
+    rows: int
+    skipped: int  # records the table's convert skipped (or blank ones)
+    lines: str  # the staging lines of the chunk's valid events
+    staged: int
+    errors: list[RowError]
+    endpoints: list[str]  # first-seen order
+    users: dict[str, AccountType]  # first account type seen per username
+
+
+def _stage_chunk(columns: list[str], first_row: int, rows: list, assume_utc: bool,
+                 convert: _Convert | None = None) -> _StagedChunk:
+    outcomes = _validate_chunk(columns, first_row, rows, assume_utc, convert)
+    errors = [outcome for outcome in outcomes if isinstance(outcome, RowError)]
+    events = [outcome for outcome in outcomes if not isinstance(outcome, RowError)]
+    users: dict[str, AccountType] = {}
+    for event in events:
+        users.setdefault(event.username, event.account_type)
+    return _StagedChunk(rows=len(outcomes), skipped=len(rows) - len(outcomes),
+                        lines="".join(_staged_record(event) + "\n" for event in events),
+                        staged=len(events), errors=errors,
+                        endpoints=list(dict.fromkeys(event.endpoint for event in events)),
+                        users=users)
 
-def parse_xlsx(data: bytes, *, assume_utc: bool = True) -> ImportResult:
-    """Parse an uploaded .xlsx (first sheet, header row) into an ImportResult.
+
+@dataclass
+class StagedImport:
+    """A validated import held in a staging file until :meth:`commit`.
+
+    ``errors`` keeps the first ``max_errors`` bad rows; ``error_count`` counts
+    them all. ``skipped`` counts records a source-format filter dropped (see
+    :mod:`timeline_creator.plaso`); ``duplicates`` is set by :meth:`commit`.
+    A rejected import has no staging file (``path`` is None).
+    """
+
+    path: Path | None
+    rows: int = 0
+    staged: int = 0
+    skipped: int = 0
+    errors: list[RowError] = field(default_factory=list)
+    error_count: int = 0
+    discovered_endpoints: list[str] = field(default_factory=list)
+    discovered_users: dict[str, AccountType] = field(default_factory=dict)
+    duplicates: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.error_count
+
+    def events(self) -> Iterator[Event]:
+        """Stream the staged events back, in file order."""
+        if self.path is None:
+            return
+        with self.path.open(encoding="utf-8") as handle:
+            for line in handle:
+                yield _staged_event(line)
+
+    def commit(self, name: str, directory: str | Path = ".", *,
+               compress: bool | None = None, duplicates: str = "keep") -> tuple[Path, Path]:
+        """Append the staged events to the saved case ``name`` (created if absent).
+
+        Goes through :func:`io.save_events`, so the case is replaced in one
+        rename and a failure leaves it as it was. ``compress=None`` keeps the
+        case's current compression. The staging file is removed on success.
+
+        ``duplicates`` (one of :data:`DUPLICATES`) checks each staged event
+        against the case's events, keyed as they stream past on their way to
+        the new file, and against the staged events before it; the count is
+        left in :attr:`duplicates`. Endpoints and users are catalogued as
+        staged even when ``"skip"`` drops every event that used them.
+        """
+        return _commit_staged([self], name, directory, compress, duplicates)
+
+    def discard(self) -> None:
+        """Delete the staging file (idempotent)."""
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+            self.path = None
+
+    def __enter__(self) -> "StagedImport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.discard()
+
+
+def stage_csv(source: str | Path | TextIO, *, assume_utc: bool = True,
+              chunk_size: int = CHUNK_ROWS, progress: Progress | None = None,
+              staging_dir: str | Path | None = None,
+              max_errors: int = 1000, workers: int = 1) -> StagedImport:
+    """Validate a CSV file (or open text stream) into a :class:`StagedImport`.
+
+    Same columns, row numbering and messages as :func:`parse_csv`, but rows
+    are read and validated ``chunk_size`` at a time and valid events are
+    written to a temporary file in ``staging_dir`` (the system default when
+    None). ``progress`` is called after every chunk. Once a row fails,
+    staging stops and the rest of the file is only checked, so every error is
+    still counted. ``workers > 1`` validates chunks in a process pool.
+    """
+    with _open_text_source(source) as (text, bytes_read, bytes_total):
+        return _stage(lambda: [_csv_table(text)], assume_utc=assume_utc,
+                      chunk_size=chunk_size, staging_dir=staging_dir,
+                      max_errors=max_errors, workers=workers, progress=progress,
+                      position=lambda: (bytes_read(), bytes_total))
+
+
+def stage_xlsx(source: bytes | str | Path | BinaryIO, *,
+               sheets: str | Sequence[str] | None = None, assume_utc: bool = True,
+               chunk_size: int = CHUNK_ROWS, progress: Progress | None = None,
+               staging_dir: str | Path | None = None,
+               max_errors: int = 1000, workers: int = 1) -> StagedImport:
+    """:func:`stage_csv` for an xlsx workbook; ``sheets`` as in :func:`parse_xlsx`.
+
+    Worksheet rows are streamed from the archive straight into validation,
+    so memory stays flat however long the sheets are.
+    """
+    with _Workbook(source, sheets) as workbook:
+        return _stage(workbook.tables, assume_utc=assume_utc, chunk_size=chunk_size,
+                      staging_dir=staging_dir, max_errors=max_errors, workers=workers,
+                      progress=progress, position=workbook.position)
+
+
+def _stage(tables: Callable[[], Iterable[_Table]], *, assume_utc: bool = True,
+           chunk_size: int = CHUNK_ROWS, staging_dir: str | Path | None = None,
+           max_errors: int = 1000, workers: int = 1, progress: Progress | None = None,
+           position: _Position = lambda: (None, None)) -> StagedImport:
+    """Validate ``tables()`` into a staging file; the body of every ``stage_*``."""
+    handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".staged.jsonl", delete=False, dir=staging_dir)
+    staged = StagedImport(path=Path(handle.name))
+    try:
+        with handle:
+            for table in tables():
+                chunks = _validated_chunks(_stage_chunk, table.columns, table.rows,
+                                           assume_utc, chunk_size, workers, table.convert)
+                for _ in _stage_chunks(staged, handle, chunks, max_errors, table.source):
+                    if progress is not None:
+                        progress(staged.rows, *position())
+    except BaseException:
+        staged.discard()
+        raise
+    if not staged.ok:
+        staged.discard()  # all-or-nothing: do not keep a partial batch
+        staged.discovered_endpoints, staged.discovered_users = [], {}
+    return staged
+
+
+def _commit_staged(stages: Sequence[StagedImport], name: str, directory: str | Path,
+                   compress: bool | None, duplicates: str) -> tuple[Path, Path]:
+    """:meth:`StagedImport.commit` for several stagings at once, in order: one rewrite."""
+    dedup = _Duplicates(duplicates)
+    for staged in stages:
+        if not staged.ok:
+            raise ImportError_(f"import rejected — {staged.error_count} bad row(s); "
+                               "nothing to commit.")
+        if staged.path is None:
+            raise ImportError_("this import was already committed or discarded.")
+    directory = Path(directory)
+    meta = io._read_meta(name, directory) or {}
+    if meta.get("partition"):
+        raise ValueError(f"'{name}' uses the partitioned layout; load it and "
+                         "io.save it to add events.")
+    existing = io._events_path(name, directory)
+    if compress is None:
+        compress = existing.suffix == ".gz"
+    endpoints = dict.fromkeys(meta.get("endpoints", []))
+    users = {user: AccountType(value) for user, value in meta.get("users", {}).items()}
+    for staged in stages:
+        endpoints.update(dict.fromkeys(staged.discovered_endpoints))
+        for user, account_type in staged.discovered_users.items():
+            users.setdefault(user, account_type)
+
+    def kept(staged: StagedImport) -> Iterator[Event]:
+        before = dedup.count
+        yield from (event for event in staged.events() if dedup.keep(event))
+        staged.duplicates = dedup.count - before
+
+    events: Iterable[Event] = chain.from_iterable(kept(staged) for staged in stages)
+    if existing.exists():
+        # unbounded: a bounded window would rewrite far-apart span halves as orphans
+        current = io.iter_events(name, directory, max_pending=None, trusted=True)
+        if dedup.mode != "keep":
+            current = dedup.remember(current)
+        events = chain(current, events)
+    written = io.save_events(name, events, directory, endpoints=list(endpoints), users=users,
+                             compress=compress)
+    for staged in stages:
+        staged.discard()
+    return written
+
+
+def _stage_chunks(staged: StagedImport, handle: TextIO, chunks: Iterable[_StagedChunk],
+                  max_errors: int, source: str | None) -> Iterator[None]:
+    """Write validated chunks to the staging file in order, yielding after each one."""
+    for chunk in chunks:
+        for error in chunk.errors:
+            error.source = source
+        staged.rows += chunk.rows
+        staged.skipped += chunk.skipped
+        staged.error_count += len(chunk.errors)
+        staged.errors += chunk.errors[:max_errors - len(staged.errors)]
+        if staged.ok:
+            handle.write(chunk.lines)
+            staged.staged += chunk.staged
+            staged.discovered_endpoints += [endpoint for endpoint in chunk.endpoints
+                                            if endpoint not in staged.discovered_endpoints]
+            for username, account_type in chunk.users.items():
+                staged.discovered_users.setdefault(username, account_type)
+        yield
+
+
+@contextmanager
+def _open_text_source(source: str | Path | TextIO
+                      ) -> Iterator[tuple[TextIO, Callable[[], int | None], int | None]]:
+    """``(text, bytes read so far, size in bytes)`` for a text file path or open stream."""
+    if not isinstance(source, (str, os.PathLike)):
+        yield source, lambda: None, None
+        return
+    path = Path(source)
+    with path.open("rb") as raw:
+        yield (_io.TextIOWrapper(raw, encoding="utf-8-sig", newline=""), raw.tell,
+               path.stat().st_size)
+
+
+class _Workbook:
+    """The selected worksheets of an xlsx workbook, streamed as tables.
+
+    openpyxl's read-only mode reads rows from the archive as they are
+    iterated, so only the current chunk (plus the shared-strings table) is
+    held. ``rows_read`` counts worksheet rows consumed so far, blanks
+    included, against ``rows_total`` (None if a sheet does not record its
+    size).
+    """
+
+    def __init__(self, source: bytes | str | Path | BinaryIO,
+                 sheets: str | Sequence[str] | None):
+        try:
+            from openpyxl import load_workbook
+            from openpyxl.utils.exceptions import InvalidFileException
+        except ImportError as exc:  # pragma: no cover - env dependent
+            raise ImportError_(
+                "xlsx import needs openpyxl, which is not installed in this environment."
+            ) from exc
+
+        if isinstance(source, (bytes, bytearray)):
+            source = _io.BytesIO(source)
+        try:
+            self._workbook = load_workbook(source, read_only=True, data_only=True)
+        except (zipfile.BadZipFile, InvalidFileException, KeyError) as exc:
+            # KeyError: a zip archive without the workbook parts
+            raise ImportError_(f"not a readable xlsx workbook ({exc}).") from exc
+        self.sheet_names = list(self._workbook.sheetnames)
+        try:
+            self.sheets = _selected_sheets(self._workbook, sheets)
+        except BaseException:
+            self.close()
+            raise
+        sizes = [sheet.max_row for sheet in self.sheets]
+        self.rows_total = None if None in sizes else sum(sizes)
+        self.rows_read = 0
+
+    def tables(self) -> Iterator[_Table]:
+        for sheet in self.sheets:
+            rows = (r for r in self._counted(sheet.iter_rows(values_only=True))
+                    if any(c is not None and str(c).strip() for c in r))
+            header = next(rows, None)
+            if header is None:
+                raise ImportError_(f"no data found in worksheet '{sheet.title}'.")
+            try:
+                columns = _columns([str(c) if c is not None else "" for c in header])
+            except ImportError_ as exc:
+                raise ImportError_(f"worksheet '{sheet.title}': {exc}") from None
+            yield _Table(sheet.title, columns, rows)
+
+    def position(self) -> tuple[int, int | None]:
+        return self.rows_read, self.rows_total
+
+    def _counted(self, rows: Iterable[tuple]) -> Iterator[tuple]:
+        for row in rows:
+            self.rows_read += 1
+            yield row
+
+    def close(self) -> None:
+        self._workbook.close()
+
+    def __enter__(self) -> "_Workbook":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _selected_sheets(workbook, sheets: str | Sequence[str] | None) -> list:
+    if sheets is None:
+        return [workbook.active]
+    names = [sheets] if isinstance(sheets, str) else list(sheets)
+    unknown = [name for name in names if name not in workbook.sheetnames]
+    if unknown:
+        raise ImportError_(f"no worksheet named {', '.join(map(repr, unknown))}; "
+                           f"the workbook has {', '.join(map(repr, workbook.sheetnames))}.")
+    return [workbook[name] for name in names]
+
+
+def xlsx_sheet_names(source: bytes | str | Path | BinaryIO) -> list[str]:
+    """The worksheet names of an xlsx workbook, in workbook order."""
+    with _Workbook(source, None) as workbook:
+        return workbook.sheet_names
+
+
+def parse_xlsx(data: bytes | str | Path | BinaryIO, *, sheets: str | Sequence[str] | None = None,
+               assume_utc: bool = True, workers: int = 1, progress: Progress | None = None,
+               investigation: Investigation | None = None,
+               duplicates: str = "keep") -> ImportResult:
+    """Parse an uploaded .xlsx (header row per sheet) into an ImportResult.
+
+    ``sheets`` names the worksheet(s) to import, in order; by default the
+    active one. Each sheet has its own header and row numbering, and its row
+    errors carry its name as ``RowError.source``. Rows are streamed from the
+    workbook into validation, and ``progress`` is called after every chunk.
+
+    ``duplicates`` is as for :func:`parse_csv`.
 
     Requires openpyxl (confirmed available in the target env). openpyxl returns
     real datetime objects for Excel date cells, which :func:`_parse_dt` accepts.
     """
-    try:
-        from openpyxl import load_workbook
-    except ImportError as exc:  # pragma: no cover - env dependent
-        raise ImportError_(
-            "xlsx import needs openpyxl, which is not installed in this environment."
-        ) from exc
-
-    workbook = load_workbook(_io.BytesIO(data), read_only=True, data_only=True)
-    sheet = workbook.active
-    rows = [list(r) for r in sheet.iter_rows(values_only=True)]
-    rows = [r for r in rows if any(c is not None and str(c).strip() for c in r)]
-    if not rows:
-        raise ImportError_("no data found in the first worksheet.")
-    header = [str(c) if c is not None else "" for c in rows[0]]
-    return _rows_to_result(header, rows[1:], assume_utc)
+    dedup = _duplicates(duplicates, investigation)
+    with _Workbook(data, sheets) as workbook:
+        return _collect(workbook.tables(), assume_utc, workers, progress, workbook.position,
+                        dedup)
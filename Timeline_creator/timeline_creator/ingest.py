@@ -0,0 +1,150 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Folder ingestion: every CSV / xlsx export in a directory into one case.
+
+Triage hands over a folder of per-host exports. :func:`ingest_folder` finds
+the ``.csv`` and ``.xlsx`` files in it and stages each one with
+:func:`importers.stage_csv` / :func:`importers.stage_xlsx` — the same header
+aliases, timestamp handling and row-aggregated validation as
+:func:`importers.parse_csv` / :func:`importers.parse_xlsx`. With ``workers``
+above 1, files are staged in a process pool, one file per task: a folder has
+far more files than a host has cores, and a worker sends back only its
+:class:`importers.StagedImport` summary (the events stay in its staging file).
+
+Validation stays all-or-nothing per file. A file with a bad row, or one that
+is not an export at all (missing columns: reported as a row 0 error, the
+header row), is left out; every other file is committed in one
+:func:`io.save_events` rewrite, in file-name order whatever order the workers
+finish in.
+
+    result = ingest.ingest_folder("triage/", "case-1", directory, workers=8,
+                                  duplicates="skip")
+    for path, staged in result.files.items():
+        print(path.name, staged.staged if staged.ok else staged.errors)
+"""
+
+from __future__ import annotations
+
+import csv
+import zipfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import importers
+from .importers import ImportError_, RowError, StagedImport
+
+# File suffixes ingest_folder picks up (case-insensitive).
+SUFFIXES = (".csv", ".xlsx")
+
+
+@dataclass
+class IngestResult:
+    """Outcome of :func:`ingest_folder`: one staged-import summary per file."""
+
+    files: dict[Path, StagedImport] = field(default_factory=dict)  # file-name order
+    written: tuple[Path, Path] | None = None  # the case's (jsonl, meta); None if nothing was
+    events: int = 0  # committed, after any skipped duplicates
+
+    @property
+    def ok(self) -> bool:
+        return all(staged.ok for staged in self.files.values())
+
+    @property
+    def rejected(self) -> list[Path]:
+        return [path for path, staged in self.files.items() if not staged.ok]
+
+
+def discover(folder: str | Path, *, recursive: bool = False) -> list[Path]:
+    """The exports :func:`ingest_folder` would read, sorted by path.
+
+    Excel's ``~$`` lock files are not exports and are passed over.
+    """
+    folder = Path(folder)
+    if not folder.is_dir():
+        raise FileNotFoundError(f"No folder {folder}")
+    candidates = folder.rglob("*") if recursive else folder.iterdir()
+    return sorted(path for path in candidates
+                  if path.suffix.lower() in SUFFIXES and path.is_file()
+                  and not path.name.startswith("~$"))
+
+
+def _stage_file(path: Path, assume_utc: bool, sheets: str | Sequence[str] | None,
+                staging_dir: str | Path | None, max_errors: int) -> StagedImport:
+    """Stage one export; a batch-level problem becomes a row 0 error.
+
+    That includes a file that cannot be read or is not what its suffix says
+    (a corrupt or renamed workbook), so one bad file never stops the folder.
+    """
+    try:
+        if path.suffix.lower() == ".xlsx":
+            return importers.stage_xlsx(path, sheets=sheets, assume_utc=assume_utc,
+                                        staging_dir=staging_dir, max_errors=max_errors)
+        return importers.stage_csv(path, assume_utc=assume_utc, staging_dir=staging_dir,
+                                   max_errors=max_errors)
+    except (ImportError_, OSError, UnicodeDecodeError, csv.Error, zipfile.BadZipFile) as exc:
+        return StagedImport(path=None, errors=[RowError(0, str(exc))], error_count=1)
+
+
+def ingest_folder(folder: str | Path, name: str, directory: str | Path = ".", *,
+                  recursive: bool = False, workers: int = 1, assume_utc: bool = True,
+                  sheets: str | Sequence[str] | None = None,
+                  duplicates: str = "keep", compress: bool | None = None,
+                  staging_dir: str | Path | None = None, max_errors: int = 1000,
+                  progress: Callable[[Path, StagedImport], None] | None = None
+                  ) -> IngestResult:
+    """Import every export in ``folder`` into the saved case ``name``.
+
+    Files that validate are appended to the case (created if absent) in one
+    :meth:`importers.StagedImport.commit`-style rewrite, with ``duplicates``
+    and ``compress`` as there; the rest are only reported. ``sheets`` applies
+    to every workbook. ``progress(path, staged)`` is called as each file
+    finishes staging.
+    """
+    paths = discover(folder, recursive=recursive)
+    importers._Duplicates(duplicates)  # reject a bad mode before staging anything
+    staged: dict[Path, StagedImport] = {}
+    try:
+        if workers <= 1 or len(paths) <= 1:
+            for path in paths:
+                staged[path] = _stage_file(path, assume_utc, sheets, staging_dir, max_errors)
+                if progress is not None:
+                    progress(path, staged[path])
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                futures = {pool.submit(_stage_file, path, assume_utc, sheets, staging_dir,
+                                       max_errors): path for path in paths}
+                try:
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        staged[path] = future.result()
+                        if progress is not None:
+                            progress(path, staged[path])
+                finally:  # on failure, clean up the stagings not yet collected
+                    for future, path in futures.items():
+                        if (path not in staged and not future.cancel()
+                                and future.exception() is None):
+                            future.result().discard()
+        result = IngestResult(files={path: staged[path] for path in paths})
+        good = [summary for summary in result.files.values() if summary.ok]
+        if good:
+            result.written = importers._commit_staged(good, name, directory, compress,
+                                                      duplicates)
+            result.events = sum(summary.staged for summary in good)
+            if duplicates == "skip":
+                result.events -= sum(summary.duplicates for summary in good)
+        return result
+    finally:
+        for summary in staged.values():
+            summary.discard()
@@ -15,7 +15,18 @@
 Layout per investigation (D10, D14):
 
   <name>.jsonl       one Timesketch-style event record per line
+                     (or <name>.jsonl.gz: the same, gzip-compressed)
   <name>.meta.json   sidecar: name, endpoints[], users->account_type, schema_version
+  <name>.journal     optional: changes since the last full save (see Journal)
+  <name>.events.bin  optional: columnar cache of the .jsonl (see event_cache)
+
+or, for very long cases, the partitioned layout (``save(..., partition="day")``):
+
+  <name>/<bucket>.jsonl  one shard per time bucket, e.g. <name>/2025-01-03.jsonl
+  <name>.meta.json       as above, plus the partition and each shard's time range
+
+Per directory, ``.catalogue.json`` caches a summary of every case (see
+:func:`catalogue`) so they can be listed without opening any events file.
 
 Spans are point-event models in Timesketch/plaso, so a span is DECOMPOSED on
 disk into two linked point records sharing a ``span_id`` — one
@@ -25,15 +36,32 @@ a single :class:`Event` on load. A point event is a single record
 
 KEEP-EVERY-LABEL ethos applies to loading too: an orphaned span half (a Start
 with no End, or vice versa) is promoted to a point event with a warning rather
-than dropped.
+than dropped. A span id seen again — a repeated half, or a reuse after its
+pair completed — starts a new span, so no record is overwritten.
+
+:func:`iter_events` streams a case line by line (bounded memory, for batch
+jobs over cases larger than RAM); :func:`load` is built on it. Its
+``max_pending`` bound is for such direct streaming only: :func:`load`,
+:func:`load_window` and the importers' commit pair halves however far apart
+they are, so they all read a case the same way.
+:func:`load_window` reads only what a time window needs (for a partitioned
+case, only the shards whose time range intersects it).
 """
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
+from datetime import datetime as _DateTime
+from io import TextIOWrapper
 from pathlib import Path
+from typing import TextIO
 
+from . import event_cache, filters
 from .models import AccountType, Event, Investigation, SCHEMA_VERSION
 
 # On-disk timestamp_desc values.
@@ -41,6 +69,18 @@ DESC_EVENT = "Event"
 DESC_START = "Start"
 DESC_END = "End"
 
+# Records a span's halves may lie apart before streaming gives up on pairing.
+DEFAULT_MAX_PENDING = 100_000
+
+# Directory-level summary index (see catalogue()).
+CATALOGUE_NAME = ".catalogue.json"
+CATALOGUE_VERSION = 1
+
+# Partition buckets: shard file stem format, applied to a record's UTC timestamp.
+PARTITIONS = {"hour": "%Y-%m-%dT%H", "day": "%Y-%m-%d", "month": "%Y-%m"}
+
+EventBuilder = Callable[..., Event]  # (record, *, end=None, span_id=None) -> Event
+
 
 @dataclass
 class LoadResult:
@@ -50,14 +90,55 @@ class LoadResult:
     warnings: list[str] = field(default_factory=list)
 
 
-def _jsonl_path(name: str, directory: Path) -> Path:
-    return directory / f"{name}.jsonl"
+@dataclass
+class CaseSummary:
+    """One investigation as listed by :func:`catalogue`, without loading it."""
+
+    name: str
+    events: int
+    spans: int
+    first: _DateTime | None  # earliest start
+    last: _DateTime | None  # latest end (or point time)
+    endpoints: list[str] = field(default_factory=list)
+    users: dict[str, AccountType] = field(default_factory=dict)
+    error: str | None = None  # set when the case could not be read
+
+
+def _jsonl_path(name: str, directory: Path, compressed: bool = False) -> Path:
+    return directory / (f"{name}.jsonl.gz" if compressed else f"{name}.jsonl")
+
+
+def _events_path(name: str, directory: Path) -> Path:
+    """The single-file layout's events file, ``<name>.jsonl`` or ``<name>.jsonl.gz``."""
+    compressed = _jsonl_path(name, directory, compressed=True)
+    return compressed if compressed.exists() else _jsonl_path(name, directory)
+
+
+def _open_text(path: Path, mode: str, compressed: bool | None = None) -> TextIO:
+    """Open a (``.gz``-aware) JSONL file for streaming text reads or writes.
+
+    Compressed writes use a zero gzip mtime so an unchanged case saves to the
+    same bytes (and SHA-256) every time. ``compressed`` overrides the suffix
+    test (for temporary names).
+    """
+    if compressed if compressed is not None else path.suffix == ".gz":
+        return TextIOWrapper(gzip.GzipFile(path, mode + "b", compresslevel=6, mtime=0),
+                             encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
 
 
 def _meta_path(name: str, directory: Path) -> Path:
     return directory / f"{name}.meta.json"
 
 
+def _journal_path(name: str, directory: Path) -> Path:
+    return directory / f"{name}.journal"
+
+
+def _partition_dir(name: str, directory: Path) -> Path:
+    return directory / name
+
+
 def _event_to_records(event: Event, span_id: str) -> list[dict]:
     """Serialise one Event to one (point) or two (span) on-disk records."""
     base = {
@@ -76,35 +157,206 @@ def _event_to_records(event: Event, span_id: str) -> list[dict]:
     ]
 
 
-def save(investigation: Investigation, directory: str | Path = ".") -> tuple[Path, Path]:
+def _write_meta(investigation: Investigation, directory: Path,
+                jsonl_sha256: str | None, layout: dict | None = None) -> Path:
+    meta = {
+        "name": investigation.name,
+        "endpoints": investigation.endpoints,
+        "users": {user: at.value for user, at in investigation.users.items()},
+        "schema_version": investigation.schema_version,
+        "jsonl_sha256": jsonl_sha256,
+        **(layout or {}),
+    }
+    meta_path = _meta_path(investigation.name, directory)
+    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return meta_path
+
+
+def save(investigation: Investigation, directory: str | Path = ".", *,
+         cache: bool = False, partition: str | None = None,
+         compress: bool = False) -> tuple[Path, Path]:
     """Write ``<name>.jsonl`` + ``<name>.meta.json``. Returns both paths.
 
     Spans without an explicit ``span_id`` get a deterministic synthesised one
-    (``span-<index>``) so the file is stable run-to-run.
+    (``span-<index>``) so the file is stable run-to-run. A full save supersedes
+    any ``<name>.journal`` (see :class:`Journal`), which is removed.
+
+    ``cache=True`` also writes the ``<name>.events.bin`` columnar cache (see
+    :mod:`timeline_creator.event_cache`) that :func:`load` reopens from;
+    otherwise any existing cache is removed. The meta sidecar records the
+    ``.jsonl``'s SHA-256 so a trusted :func:`load` can skip re-validation.
+
+    ``partition`` (a :data:`PARTITIONS` key) writes the partitioned layout
+    instead; the first returned path is then the ``<name>/`` shard folder.
+    Saving either layout removes the other.
+
+    ``compress=True`` gzips the events file(s) (``<name>.jsonl.gz``, or
+    ``.jsonl.gz`` shards), written line by line as the plain files are; every
+    reader here accepts either form, and a save removes the other form.
     """
     directory = Path(directory)
     directory.mkdir(parents=True, exist_ok=True)
+    if partition is not None:
+        if cache:
+            raise ValueError("the columnar cache is only written for the single-file layout")
+        return _save_partitioned(investigation, directory, partition, compress)
+    _remove_shards(investigation.name, directory)
+
+    jsonl = _jsonl_path(investigation.name, directory, compressed=compress)
+    with _open_text(jsonl, "w") as handle:
+        for index, event in enumerate(investigation.events):
+            span_id = event.span_id or f"span-{index}"
+            for record in _event_to_records(event, span_id):
+                handle.write(json.dumps(record) + "\n")
+    _jsonl_path(investigation.name, directory, compressed=not compress).unlink(missing_ok=True)
+    _journal_path(investigation.name, directory).unlink(missing_ok=True)
+    jsonl_sha256 = event_cache.file_sha256(jsonl)
+    cache_path = event_cache.cache_path(investigation.name, directory)
+    if cache:
+        event_cache.write_cache(cache_path, _as_loaded(investigation.events), jsonl_sha256)
+    else:
+        cache_path.unlink(missing_ok=True)
+    meta_path = _write_meta(investigation, directory, jsonl_sha256)
+    _record_in_catalogue(investigation, directory)
+    return jsonl, meta_path
+
 
-    lines: list[str] = []
+def _save_partitioned(investigation: Investigation, directory: Path, partition: str,
+                      compress: bool) -> tuple[Path, Path]:
+    """One JSONL shard per ``partition`` bucket under ``<name>/``.
+
+    Each record goes to the bucket of its own timestamp, so a span crossing a
+    bucket boundary has its Start and End in different shards; both carry the
+    span_id and a ``seq`` (the event's index), which pair them and restore the
+    event order on load. Per shard the meta records ``start``/``end`` (its
+    records' time range) and ``reach``: the latest end of any event starting
+    in it, so a window load also opens the shard a long span started in.
+    """
+    if partition not in PARTITIONS:
+        raise ValueError(f"unknown partition {partition!r}; expected one of {sorted(PARTITIONS)}")
+    stem_format = PARTITIONS[partition]
+    shards: dict[str, dict] = {}
     for index, event in enumerate(investigation.events):
         span_id = event.span_id or f"span-{index}"
-        for record in _event_to_records(event, span_id):
-            lines.append(json.dumps(record))
+        reach = event.end if event.is_span else event.datetime
+        times = [event.datetime, event.end] if event.is_span else [event.datetime]
+        for when, record in zip(times, _event_to_records(event, span_id)):
+            shard = shards.setdefault(when.strftime(stem_format),
+                                      {"lines": [], "start": when, "end": when, "reach": when})
+            shard["lines"].append(json.dumps({**record, "seq": index}))
+            shard["start"] = min(shard["start"], when)
+            shard["end"] = max(shard["end"], when)
+            if record["timestamp_desc"] != DESC_END:
+                shard["reach"] = max(shard["reach"], reach)
 
-    jsonl = _jsonl_path(investigation.name, directory)
-    jsonl.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+    folder = _partition_dir(investigation.name, directory)
+    folder.mkdir(exist_ok=True)
+    entries = []
+    for stem in sorted(shards):
+        shard = shards[stem]
+        path = folder / (f"{stem}.jsonl.gz" if compress else f"{stem}.jsonl")
+        with _open_text(path, "w") as handle:
+            handle.writelines(line + "\n" for line in shard["lines"])
+        entries.append({"file": path.name, "start": shard["start"].isoformat(),
+                        "end": shard["end"].isoformat(),
+                        "reach": max(shard["reach"], shard["end"]).isoformat(),
+                        "records": len(shard["lines"]), "sha256": event_cache.file_sha256(path)})
+    written = {entry["file"] for entry in entries}
+    for stale in _shard_files(folder):
+        if stale.name not in written:
+            stale.unlink()
+    for flat in (_jsonl_path(investigation.name, directory),
+                 _jsonl_path(investigation.name, directory, compressed=True),
+                 _journal_path(investigation.name, directory),
+                 event_cache.cache_path(investigation.name, directory)):
+        flat.unlink(missing_ok=True)
+    meta_path = _write_meta(investigation, directory, None,
+                            {"partition": partition, "shards": entries})
+    _record_in_catalogue(investigation, directory)
+    return folder, meta_path
 
-    meta = {
-        "name": investigation.name,
-        "endpoints": investigation.endpoints,
-        "users": {user: at.value for user, at in investigation.users.items()},
-        "schema_version": investigation.schema_version,
-    }
-    meta_path = _meta_path(investigation.name, directory)
-    meta_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+def _shard_files(folder: Path) -> list[Path]:
+    return [*folder.glob("*.jsonl"), *folder.glob("*.jsonl.gz")]
+
+
+def _remove_shards(name: str, directory: Path) -> None:
+    """Delete a partitioned layout's shards (and the folder, once empty)."""
+    folder = _partition_dir(name, directory)
+    if not folder.is_dir():
+        return
+    for shard in _shard_files(folder):
+        shard.unlink()
+    try:
+        folder.rmdir()
+    except OSError:  # holds something that is not ours
+        pass
+
+
+def save_events(name: str, events: Iterable[Event], directory: str | Path = ".", *,
+                endpoints: Iterable[str] = (), users: dict[str, AccountType] | None = None,
+                compress: bool = False) -> tuple[Path, Path]:
+    """Stream ``events`` into a new single-file case without holding them.
+
+    The on-disk result is what :func:`save` writes for an investigation with
+    these events and catalogues (``endpoints``/``users``, backfilled from the
+    events as :func:`load` would). Any existing case of that name is replaced,
+    atomically: events go to a temporary file that is renamed over the old one
+    only once ``events`` is exhausted, so the iterator may read that very case
+    (an append) and a failure part-way leaves it untouched.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    shell = Investigation(name=name, endpoints=list(endpoints), users=dict(users or {}))
+    count = spans = 0
+    first = last = None
+    jsonl = _jsonl_path(name, directory, compressed=compress)
+    staging = jsonl.with_name(jsonl.name + ".tmp")
+    try:
+        with _open_text(staging, "w", compressed=compress) as handle:
+            for index, event in enumerate(events):
+                for record in _event_to_records(event, event.span_id or f"span-{index}"):
+                    handle.write(json.dumps(record) + "\n")
+                shell.add_endpoint(event.endpoint)
+                shell.add_user(event.username, event.account_type)
+                stop = event.end if event.is_span else event.datetime
+                first = event.datetime if first is None else min(first, event.datetime)
+                last = stop if last is None else max(last, stop)
+                count += 1
+                spans += event.is_span
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    os.replace(staging, jsonl)
+    for stale in (_jsonl_path(name, directory, compressed=not compress),
+                  _journal_path(name, directory), event_cache.cache_path(name, directory)):
+        stale.unlink(missing_ok=True)
+    _remove_shards(name, directory)
+    meta_path = _write_meta(shell, directory, event_cache.file_sha256(jsonl))
+    _record_in_catalogue(shell, directory, summary={
+        **_summary_entry(shell), "events": count, "spans": spans,
+        "first": first.isoformat() if first else None,
+        "last": last.isoformat() if last else None})
     return jsonl, meta_path
 
 
+def _read_meta(name: str, directory: Path) -> dict | None:
+    meta_path = _meta_path(name, directory)
+    if not meta_path.exists():
+        return None
+    return json.loads(meta_path.read_text(encoding="utf-8"))
+
+
+def _as_loaded(events: list[Event]) -> list[Event]:
+    """``events`` as :func:`load` will return them (synthesised span ids applied)."""
+    loaded = []
+    for index, event in enumerate(events):
+        span_id = (event.span_id or f"span-{index}") if event.is_span else None
+        loaded.append(event if span_id == event.span_id
+                      else event.model_copy(update={"span_id": span_id}))
+    return loaded
+
+
 def _point_event_from_record(record: dict, *, end: str | None = None,
                              span_id: str | None = None) -> Event:
     return Event(
@@ -118,71 +370,324 @@ def _point_event_from_record(record: dict, *, end: str | None = None,
     )
 
 
-def _reconstitute(records: list[dict], warnings: list[str]) -> list[Event]:
-    """Rebuild Events from raw records, pairing spans and promoting orphans."""
-    # Group span halves by span_id, preserving first-seen order via line index.
-    span_groups: dict[str, dict] = {}
-    ordered: list[tuple[int, str]] = []  # (line_index, kind) where kind is "point" or span_id
-    points: dict[int, dict] = {}
+_ACCOUNT_TYPES = {member.value: member for member in AccountType}
+
+
+def _trusted_event_from_record(record: dict, *, end: str | None = None,
+                               span_id: str | None = None) -> Event:
+    """As :func:`_point_event_from_record`, for records from a hash-verified file.
+
+    ``save`` writes timestamps with ``isoformat()`` from UTC-normalised events,
+    so ``fromisoformat`` restores them exactly and validation can be skipped.
+    """
+    return Event.construct_trusted(
+        _DateTime.fromisoformat(record["datetime"]),
+        record["message"],
+        record["endpoint"],
+        record["username"],
+        _ACCOUNT_TYPES[record["account_type"]],
+        _DateTime.fromisoformat(end) if end is not None else None,
+        span_id,
+    )
+
+
+def _span_records(span_id: str, halves: dict[str, dict],
+                  warnings: list[str]) -> tuple[dict, dict | None]:
+    """A span's ``(Start, End)`` records; an orphan half is ``(half, None)``, with a warning.
 
-    for index, record in enumerate(records):
+    The one place an orphan is promoted, for :func:`load` and the lazy view alike.
+    """
+    start = halves.get(DESC_START)
+    end = halves.get(DESC_END)
+    if start and end:
+        return start, end
+    if start:
+        warnings.append(
+            f"span '{span_id}' has a Start but no End; promoted to a point event."
+        )
+        return start, None
+    warnings.append(
+        f"span '{span_id}' has an End but no Start; promoted to a point event."
+    )
+    return end, None
+
+
+def _event_from_halves(span_id: str, halves: dict[str, dict], warnings: list[str],
+                       build: EventBuilder = _point_event_from_record) -> Event:
+    """One Event from a span's Start/End halves, promoting an orphan with a warning."""
+    first, end = _span_records(span_id, halves, warnings)
+    if end is None:
+        return build(first, span_id=span_id)
+    return build(first, end=end["datetime"], span_id=span_id)
+
+
+def _pair_slots(records: Iterable[dict],
+                max_pending: int | None) -> Iterator[tuple[str | None, dict]]:
+    """Pair span halves in one pass; yield final ``(None, point)`` or ``(span_id, halves)``.
+
+    First-seen order: every point record and every span (at its first-seen
+    half) takes one slot in a queue, and ``open_spans`` finds a span's slot in
+    O(1) whichever half arrives first. Slots are yielded from the head as soon
+    as they are complete, so only the records between a span's two halves are
+    held. With ``max_pending`` set, a head slot more than that many records
+    old is given up: an incomplete span there is yielded as is (an orphan; its
+    late partner, if any, becomes another orphan). A repeated half, or a span
+    id seen again after its pair completed, starts a new span.
+
+    Only ``timestamp_desc`` and ``span_id`` are read from each record.
+    """
+    queue: deque[tuple[str | None, dict]] = deque()  # (None, point) | (span_id, halves)
+    open_spans: dict[str, dict[str, dict]] = {}
+
+    def pop_head() -> tuple[str | None, dict]:
+        span_id, item = queue.popleft()
+        if span_id is not None and open_spans.get(span_id) is item:  # forced out
+            del open_spans[span_id]
+        return span_id, item
+
+    for record in records:
         desc = record.get("timestamp_desc", DESC_EVENT)
         span_id = record.get("span_id")
         if desc in (DESC_START, DESC_END) and span_id:
-            group = span_groups.setdefault(span_id, {"first_index": index})
-            group[desc] = record
-            if span_id not in {sid for _, sid in ordered}:
-                ordered.append((index, span_id))
+            halves = open_spans.get(span_id)
+            if halves is None or desc in halves:
+                halves = open_spans[span_id] = {}
+                queue.append((span_id, halves))
+            halves[desc] = record
+            if len(halves) == 2:
+                del open_spans[span_id]
         else:
-            points[index] = record
-            ordered.append((index, "point"))
+            queue.append((None, record))
+        # the head is final once it is a point or no longer the open slot for its id
+        while queue and (open_spans.get(queue[0][0]) is not queue[0][1]
+                         or (max_pending is not None and len(queue) > max_pending)):
+            yield pop_head()
+    while queue:
+        yield pop_head()
 
-    events: list[Event] = []
-    for index, key in ordered:
-        if key == "point":
-            events.append(_point_event_from_record(points[index]))
+
+def _pair_records(records: Iterable[dict], warnings: list[str], max_pending: int | None,
+                  build: EventBuilder = _point_event_from_record) -> Iterator[Event]:
+    """Rebuild Events from raw records, pairing spans and promoting orphans."""
+    for span_id, item in _pair_slots(records, max_pending):
+        if span_id is None:
+            yield build(item)
+        else:
+            yield _event_from_halves(span_id, item, warnings, build)
+
+
+def _reconstitute(records: Iterable[dict], warnings: list[str]) -> list[Event]:
+    """All Events from ``records`` (unbounded pairing window)."""
+    return list(_pair_records(records, warnings, max_pending=None))
+
+
+def _iter_records(path: Path) -> Iterator[dict]:
+    with _open_text(path, "r") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _verified_sha256(name: str, directory: Path, warnings: list[str]) -> str | None:
+    """The events file's hash if it matches the one ``save`` recorded, else None."""
+    meta = _read_meta(name, directory)
+    expected = meta.get("jsonl_sha256") if meta else None
+    if not expected:
+        return None
+    path = _events_path(name, directory)
+    actual = event_cache.file_sha256(path)
+    if actual != expected:
+        warnings.append(f"'{path.name}' changed since it was saved; "
+                        "every record was validated.")
+        return None
+    return actual
+
+
+def _shards_verified(name: str, folder: Path, entries: list[dict],
+                     warnings: list[str]) -> bool:
+    """Whether every shard in ``entries`` still has the SHA-256 ``save`` recorded."""
+    changed = [entry["file"] for entry in entries
+               if event_cache.file_sha256(folder / entry["file"]) != entry.get("sha256")]
+    if changed:
+        warnings.append(f"shards of '{name}' changed since they were saved "
+                        f"({', '.join(changed)}); every record was validated.")
+    return not changed
+
+
+def _shard_events(name: str, directory: Path, meta: dict, warnings: list[str], *,
+                  start: _DateTime | None = None, end: _DateTime | None = None,
+                  trusted: bool = False) -> list[Event]:
+    """A partitioned case's events in saved order, optionally only those in a window.
+
+    Opens the shards whose ``[start, reach]`` intersects the window; spans
+    from those shards that still lack their End then pick it up from the later
+    shards (only matching End records are kept). Halves pair on
+    ``(span_id, seq)``. Orphan warnings are kept only for events in the window.
+    """
+    folder = _partition_dir(name, directory)
+    shards = meta.get("shards", [])
+    opened = [index for index, entry in enumerate(shards)
+              if (start is None or _DateTime.fromisoformat(entry["reach"]) >= start)
+              and (end is None or _DateTime.fromisoformat(entry["start"]) <= end)]
+    points: dict[int, dict] = {}
+    spans: dict[tuple[str, int], dict[str, dict]] = {}
+    for index in opened:
+        for record in _iter_records(folder / shards[index]["file"]):
+            desc = record.get("timestamp_desc", DESC_EVENT)
+            if desc in (DESC_START, DESC_END) and record.get("span_id"):
+                spans.setdefault((record["span_id"], record["seq"]), {})[desc] = record
+            else:
+                points[record["seq"]] = record
+
+    pending = {key for key, halves in spans.items() if DESC_END not in halves}
+    for index in range(opened[0] + 1 if opened else len(shards), len(shards)):
+        if not pending:
+            break
+        if index in opened:
             continue
-        group = span_groups[key]
-        start = group.get(DESC_START)
-        end = group.get(DESC_END)
-        if start and end:
-            events.append(_point_event_from_record(start, end=end["datetime"], span_id=key))
-        elif start:
-            warnings.append(
-                f"span '{key}' has a Start but no End; promoted to a point event."
-            )
-            events.append(_point_event_from_record(start, span_id=key))
-        elif end:
-            warnings.append(
-                f"span '{key}' has an End but no Start; promoted to a point event."
-            )
-            events.append(_point_event_from_record(end, span_id=key))
+        opened.append(index)
+        for record in _iter_records(folder / shards[index]["file"]):
+            key = (record.get("span_id"), record.get("seq"))
+            if record.get("timestamp_desc") == DESC_END and key in pending:
+                spans[key][DESC_END] = record
+                pending.discard(key)
+
+    build = _point_event_from_record
+    if trusted and _shards_verified(name, folder, [shards[i] for i in opened], warnings):
+        build = _trusted_event_from_record
+    slots = [(seq, None, record) for seq, record in points.items()]
+    slots += [(seq, span_id, halves) for (span_id, seq), halves in spans.items()]
+    events: list[Event] = []
+    for _, span_id, item in sorted(slots, key=lambda slot: slot[0]):
+        slot_warnings: list[str] = []
+        event = (build(item) if span_id is None
+                 else _event_from_halves(span_id, item, slot_warnings, build))
+        if filters.intersects(event, start, end):
+            events.append(event)
+            warnings.extend(slot_warnings)
     return events
 
 
-def load(name: str, directory: str | Path = ".") -> LoadResult:
-    """Load an investigation by name. Returns the model plus any warnings.
+def iter_events(name: str, directory: str | Path = ".", *, warnings: list[str] | None = None,
+                max_pending: int | None = DEFAULT_MAX_PENDING,
+                trusted: bool = False) -> Iterator[Event]:
+    """Stream an investigation's events from ``<name>.jsonl`` in file order.
 
-    The ``.jsonl`` is the source of truth for events; ``.meta.json`` supplies
-    the endpoint/user catalogues. If the sidecar is missing, catalogues are
-    derived from the events themselves.
+    Reads one line at a time and yields validated :class:`Event` objects, so
+    memory is bounded by ``max_pending`` (how many records apart a span's
+    Start and End may be before the first is treated as an orphan), not by
+    the case size. Orphan warnings are appended to ``warnings`` if given.
+    Catalogues are not read; use :func:`load` for the full model.
+
+    ``trusted=True`` skips per-record validation when the file still matches
+    the SHA-256 that :func:`save` recorded in the meta sidecar; on a mismatch
+    (or no recorded hash) every record is validated as usual.
+
+    A pending ``<name>.journal`` can insert anywhere, so when one exists the
+    events are materialised and replayed first; :meth:`Journal.compact`
+    restores streaming. A partitioned case is materialised too (its shards
+    are in time order, not saved order); use :func:`load_window` on those.
     """
     directory = Path(directory)
-    jsonl = _jsonl_path(name, directory)
+    jsonl = _events_path(name, directory)
     if not jsonl.exists():
+        meta = _read_meta(name, directory)
+        if meta is not None and meta.get("partition"):
+            warnings = warnings if warnings is not None else []
+            return iter(_shard_events(name, directory, meta, warnings, trusted=trusted))
         raise FileNotFoundError(f"No events file for investigation '{name}' at {jsonl}")
+    warnings = warnings if warnings is not None else []
+    build = _point_event_from_record
+    if trusted and _verified_sha256(name, directory, warnings):
+        build = _trusted_event_from_record
+    events = _pair_records(_iter_records(jsonl), warnings, max_pending, build)
+    if _journal_path(name, directory).exists():
+        return iter(_replay_journal(list(events), name, directory, warnings))
+    return events
+
+
+def _journal_warning(name: str) -> str:
+    """The prefix of every :func:`_replay_journal` warning about ``name``'s journal."""
+    return f"journal for '{name}'"
+
+
+def _replay_journal(events: list[Event], name: str, directory: Path,
+                    warnings: list[str]) -> list[Event]:
+    """Apply ``<name>.journal`` (if any) to the canonical ``events`` in place.
+
+    The journal's first line records how many events it was written against
+    and the SHA-256 of that ``.jsonl``; a mismatch means the ``.jsonl`` was
+    replaced underneath it, so the journal is ignored. A torn last line
+    (interrupted save) ends the replay.
+    """
+    path = _journal_path(name, directory)
+    if not path.exists():
+        return events
+    with path.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                op = json.loads(line)
+            except ValueError:
+                warnings.append(f"{_journal_warning(name)} is damaged at line {line_number}; "
+                                "later changes were not applied.")
+                break
+            kind = op.get("op")
+            if line_number == 1:
+                recorded = op.get("jsonl_sha256")  # absent from older journals
+                if (kind != "base" or op.get("events") != len(events)
+                        or (recorded is not None and recorded != event_cache.file_sha256(
+                            _events_path(name, directory)))):
+                    warnings.append(f"{_journal_warning(name)} does not match its events file; "
+                                    "journal ignored.")
+                    break
+            elif kind == "add":
+                at = op["at"]
+                events[at:at] = [event for records in op["events"]
+                                 for event in _reconstitute(records, warnings)]
+            elif kind == "delete":
+                del events[op["at"]:op["at"] + op["count"]]
+    return events
+
+
+def _cached_events(name: str, directory: Path, warnings: list[str]) -> list[Event] | None:
+    """Canonical events from a fresh ``<name>.events.bin``, else None."""
+    cache_path = event_cache.cache_path(name, directory)
+    jsonl = _events_path(name, directory)
+    if not (cache_path.exists() and jsonl.exists()):
+        return None
+    cached = event_cache.read_cache(cache_path, event_cache.file_sha256(jsonl))
+    if cached is None:
+        return None
+    events, cached_warnings = cached
+    warnings.extend(cached_warnings)
+    return events
 
+
+def load(name: str, directory: str | Path = ".", *, trusted: bool = False) -> LoadResult:
+    """Load an investigation by name. Returns the model plus any warnings.
+
+    The ``.jsonl`` is the source of truth for events; ``.meta.json`` supplies
+    the endpoint/user catalogues. If the sidecar is missing, catalogues are
+    derived from the events themselves. Events come from the columnar cache
+    when it matches the ``.jsonl``'s hash, otherwise they are streamed through
+    :func:`iter_events`, so raw lines and record dicts are never all in memory.
+    ``trusted=True`` skips re-validating records of an unchanged saved file
+    (see :func:`iter_events`).
+    """
+    directory = Path(directory)
     warnings: list[str] = []
-    records = [
-        json.loads(line)
-        for line in jsonl.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    ]
-    events = _reconstitute(records, warnings)
+    meta = _read_meta(name, directory)
+    if meta is not None and meta.get("partition"):
+        events = _shard_events(name, directory, meta, warnings, trusted=trusted)
+    elif (events := _cached_events(name, directory, warnings)) is not None:
+        events = _replay_journal(events, name, directory, warnings)
+    else:  # journal replayed by iter_events; all events are held anyway, so pair unbounded
+        events = list(iter_events(name, directory, warnings=warnings, max_pending=None,
+                                  trusted=trusted))
 
-    meta_path = _meta_path(name, directory)
-    if meta_path.exists():
-        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta is not None:
         endpoints = meta.get("endpoints", [])
         users = {u: AccountType(a) for u, a in meta.get("users", {}).items()}
         schema_version = meta.get("schema_version", SCHEMA_VERSION)
@@ -209,9 +714,365 @@ def load(name: str, directory: str | Path = ".") -> LoadResult:
     return LoadResult(investigation=investigation, warnings=warnings)
 
 
+def load_window(name: str, directory: str | Path = ".", start: _DateTime | None = None,
+                end: _DateTime | None = None, *, clip: bool = True,
+                warnings: list[str] | None = None, trusted: bool = False) -> list[Event]:
+    """Events intersecting ``[start, end]`` (``None`` bounds are open), in saved order.
+
+    A partitioned case reads only the shards the window needs; a single-file
+    case is streamed through :func:`iter_events`, keeping only the window.
+    Spans are clipped as by :func:`filters.by_time_window`.
+    """
+    directory = Path(directory)
+    warnings = warnings if warnings is not None else []
+    meta = _read_meta(name, directory)
+    if meta is not None and meta.get("partition"):
+        events = _shard_events(name, directory, meta, warnings, start=start, end=end,
+                               trusted=trusted)
+    else:  # pair unbounded, as load does; only the window's events are kept
+        events = iter_events(name, directory, warnings=warnings, max_pending=None,
+                             trusted=trusted)
+    return filters.by_time_window(events, start, end, clip=clip)
+
+
 def list_investigations(directory: str | Path = ".") -> list[str]:
-    """Return the sorted names of investigations (files ending in ``.jsonl``)."""
+    """Return the sorted names of investigations in either layout.
+
+    A ``<name>.jsonl`` (or ``.jsonl.gz``), or a ``<name>.meta.json`` beside a ``<name>/`` shard
+    folder (the partitioned layout).
+    """
     directory = Path(directory)
     if not directory.exists():
         return []
-    return sorted(p.name[: -len(".jsonl")] for p in directory.glob("*.jsonl"))
+    names = {p.name[: -len(".jsonl")] for p in directory.glob("*.jsonl")}
+    names.update(p.name[: -len(".jsonl.gz")] for p in directory.glob("*.jsonl.gz"))
+    names.update(name for name in (p.name[: -len(".meta.json")]
+                                   for p in directory.glob("*.meta.json"))
+                 if _partition_dir(name, directory).is_dir())
+    return sorted(names)
+
+
+def _case_files(name: str, directory: Path) -> list[Path]:
+    """Every existing file of a case, in either layout."""
+    files = [_jsonl_path(name, directory), _jsonl_path(name, directory, compressed=True),
+             _meta_path(name, directory), _journal_path(name, directory)]
+    folder = _partition_dir(name, directory)
+    if folder.is_dir():
+        files += sorted(_shard_files(folder))
+    return [path for path in files if path.exists()]
+
+
+def _case_stamp(name: str, directory: Path) -> dict[str, list[int]]:
+    """``{relative path: [size, mtime_ns]}`` over a case's files."""
+    stamp = {}
+    for path in _case_files(name, directory):
+        stat = path.stat()
+        stamp[path.relative_to(directory).as_posix()] = [stat.st_size, stat.st_mtime_ns]
+    return stamp
+
+
+def _summary_entry(investigation: Investigation) -> dict:
+    """Catalogue fields for ``investigation`` as :func:`load` would return it."""
+    events = investigation.events
+    endpoints = list(investigation.endpoints)
+    seen = set(endpoints)
+    users = {user: at.value for user, at in investigation.users.items()}
+    for event in events:  # the catalogue backfill load() applies
+        if event.endpoint not in seen:
+            seen.add(event.endpoint)
+            endpoints.append(event.endpoint)
+        users[event.username] = event.account_type.value
+    return {
+        "events": len(events),
+        "spans": sum(event.is_span for event in events),
+        "first": min(e.datetime for e in events).isoformat() if events else None,
+        "last": max(e.end if e.is_span else e.datetime for e in events).isoformat()
+        if events else None,
+        "endpoints": endpoints,
+        "users": users,
+    }
+
+
+def _patched_summary(previous: dict, investigation: Investigation, removed: list[Event],
+                     added: list[Event]) -> dict | None:
+    """``previous`` updated for a journalled change, or None if it needs a full pass.
+
+    Counts and the time range follow from the removed/added events alone
+    unless a removed event sat on the range's edge. Endpoints and users keep
+    the previous entry's, then take the catalogues and the added events.
+    """
+    if "error" in previous or not previous.get("first"):
+        return None
+    first = _DateTime.fromisoformat(previous["first"])
+    last = _DateTime.fromisoformat(previous["last"])
+    if any(e.datetime <= first or (e.end if e.is_span else e.datetime) >= last
+           for e in removed):
+        return None
+    first = min([first, *(e.datetime for e in added)])
+    last = max([last, *(e.end if e.is_span else e.datetime for e in added)])
+    endpoints = list(investigation.endpoints)
+    seen = set(endpoints)
+    endpoints += [e for e in previous["endpoints"] if e not in seen]
+    seen.update(endpoints)
+    users = {**previous["users"], **{u: at.value for u, at in investigation.users.items()}}
+    for event in added:
+        if event.endpoint not in seen:
+            seen.add(event.endpoint)
+            endpoints.append(event.endpoint)
+        users[event.username] = event.account_type.value
+    return {
+        "events": previous["events"] + len(added) - len(removed),
+        "spans": previous["spans"] + sum(e.is_span for e in added)
+        - sum(e.is_span for e in removed),
+        "first": first.isoformat(),
+        "last": last.isoformat(),
+        "endpoints": endpoints,
+        "users": users,
+    }
+
+
+def _read_catalogue(directory: Path) -> dict[str, dict]:
+    try:
+        data = json.loads((directory / CATALOGUE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CATALOGUE_VERSION:
+        return {}
+    return data.get("investigations", {})
+
+
+def _write_catalogue(directory: Path, entries: dict[str, dict]) -> None:
+    path = directory / CATALOGUE_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"version": CATALOGUE_VERSION, "investigations": entries}),
+                   encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _record_in_catalogue(investigation: Investigation, directory: Path,
+                         changes: tuple[list[Event], list[Event]] | None = None,
+                         summary: dict | None = None) -> None:
+    """Refresh one case's catalogue entry after it was written.
+
+    ``changes`` (removed, added) lets a journalled save patch the entry
+    instead of re-summarising every event; a streamed save passes the
+    ``summary`` it accumulated.
+    """
+    entries = _read_catalogue(directory)
+    previous = entries.get(investigation.name)
+    if summary is None and changes is not None and previous is not None:
+        summary = _patched_summary(previous, investigation, *changes)
+    entries[investigation.name] = {"stamp": _case_stamp(investigation.name, directory),
+                                   **(summary or _summary_entry(investigation))}
+    _write_catalogue(directory, entries)
+
+
+def catalogue(directory: str | Path = ".", *, rebuild: bool = False) -> list[CaseSummary]:
+    """Summaries of every investigation in ``directory``, sorted by name.
+
+    Served from ``.catalogue.json``, which :func:`save` and :class:`Journal`
+    keep current. An entry is trusted while the size and mtime of every file
+    of its case are unchanged; a stale or missing entry (a case copied in, or
+    a concurrent save that lost the race to write the index) is rebuilt by
+    loading that one case. ``rebuild=True`` rebuilds every entry. A case that
+    fails to load is listed with its ``error``.
+    """
+    directory = Path(directory)
+    entries = {} if rebuild else _read_catalogue(directory)
+    fresh: dict[str, dict] = {}
+    for name in list_investigations(directory):
+        stamp = _case_stamp(name, directory)
+        entry = entries.get(name)
+        if entry is None or entry.get("stamp") != stamp:
+            try:
+                entry = {"stamp": stamp, **_summary_entry(load(name, directory).investigation)}
+            except (OSError, ValueError, KeyError) as exc:
+                entry = {"stamp": stamp, "error": str(exc)}
+        fresh[name] = entry
+    if fresh != entries:
+        _write_catalogue(directory, fresh)
+    return [CaseSummary(
+        name=name,
+        events=entry.get("events", 0),
+        spans=entry.get("spans", 0),
+        first=_DateTime.fromisoformat(entry["first"]) if entry.get("first") else None,
+        last=_DateTime.fromisoformat(entry["last"]) if entry.get("last") else None,
+        endpoints=list(entry.get("endpoints", [])),
+        users={u: AccountType(a) for u, a in entry.get("users", {}).items()},
+        error=entry.get("error"),
+    ) for name, entry in fresh.items()]
+
+
+def _runs(positions: list[int]) -> list[tuple[int, int]]:
+    """Group ascending positions into ``(start, length)`` runs."""
+    runs: list[tuple[int, int]] = []
+    for position in positions:
+        if runs and runs[-1][0] + runs[-1][1] == position:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((position, 1))
+    return runs
+
+
+def _add_op(at: int, events: list[Event]) -> dict:
+    return {"op": "add", "at": at, "events": [
+        _event_to_records(event, event.span_id or f"span-{at + offset}")
+        for offset, event in enumerate(events)]}
+
+
+def _diff_ops(old: list[Event], new: list[Event]) -> list[dict]:
+    """Journal ops turning ``old`` into ``new``, matching events by identity.
+
+    This tool edits an event by replacing the object (``Event`` is not
+    frozen, but nothing here mutates one), so membership is decided by
+    ``is``/``id()`` — no serialisation or field compares; see :class:`Journal`. The common prefix and suffix are skipped; inside the window
+    between them, removed runs are deleted back to front, then added runs
+    inserted front to back. If the survivors there were reordered (or an
+    object appears twice) the whole window is replaced instead.
+    """
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] is new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] is new[-1 - suffix]:
+        suffix += 1
+    old_window = old[prefix:len(old) - suffix]
+    new_window = new[prefix:len(new) - suffix]
+
+    old_ids = {id(event) for event in old_window}
+    new_ids = {id(event) for event in new_window}
+    ordered = len(old_ids) == len(old_window) and len(new_ids) == len(new_window) and all(
+        a is b for a, b in zip((e for e in old_window if id(e) in new_ids),
+                               (e for e in new_window if id(e) in old_ids)))
+    if not ordered:
+        removed = [(prefix, len(old_window))]
+        added = [(prefix, len(new_window))]
+    else:
+        removed = _runs([prefix + i for i, e in enumerate(old_window) if id(e) not in new_ids])
+        added = _runs([prefix + i for i, e in enumerate(new_window) if id(e) not in old_ids])
+    ops = [{"op": "delete", "at": at, "count": count}
+           for at, count in reversed(removed) if count]
+    ops += [_add_op(at, new[at:at + count]) for at, count in added if count]
+    return ops
+
+
+class Journal:
+    """Journalled saves: O(changes) appends instead of full rewrites.
+
+    The first :meth:`save` of an investigation (or one not opened through
+    :meth:`load`) is a full :func:`save`. After that, only what changed since
+    the last save is appended to ``<name>.journal`` as ``add``/``delete`` ops
+    keyed by position; :func:`load` replays them over the canonical
+    ``<name>.jsonl``. Once the journal outgrows ``compact_ratio`` of the
+    canonical file (and ``compact_min_bytes``), the save compacts: a full
+    rewrite of the Timesketch-aligned JSONL, which removes the journal.
+
+    Ops appended after a damaged or mismatched journal would never be
+    replayed, so the save after a load that warned about the journal — or
+    one finding the journal or the ``.jsonl`` changed since this object last
+    saw them (another writer's :func:`save`, :func:`save_events` or import
+    commit) — compacts instead of appending. The journal's header records
+    the SHA-256 of the ``.jsonl`` it applies to, so a journal that outlives
+    its events file is never replayed onto another.
+
+    Changes are found by object identity, not by value: replace an event to
+    edit it (``events[i] = event.model_copy(update=...)``). An event changed
+    in place is the same object to the journal, so only a full :func:`save`
+    or :meth:`compact` writes that change.
+
+    The small meta sidecar and the directory catalogue are rewritten on
+    every save. With ``cache=True``
+    compactions also write the columnar cache; journal appends leave the
+    ``.jsonl`` untouched, so the cache stays fresh underneath the journal.
+    A partitioned case is always saved in full; compactions keep the case's
+    layout and compression.
+    """
+
+    def __init__(self, directory: str | Path = ".", *, compact_ratio: float = 0.25,
+                 compact_min_bytes: int = 1 << 20, cache: bool = False):
+        self.directory = Path(directory)
+        self.cache = cache
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self._name: str | None = None
+        self._persisted: list[Event] = []  # the events as of the last save/load
+        self._journal_bytes: int | None = 0  # journal size as last seen; None: unusable
+        self._jsonl_stamp: tuple[int, int] | None = None  # (size, mtime_ns) as last seen
+        self._jsonl_sha256: str | None = None  # of that .jsonl, for a new journal's header
+
+    def load(self, name: str, *, trusted: bool = False) -> LoadResult:
+        result = load(name, self.directory, trusted=trusted)
+        jsonl = _events_path(name, self.directory)
+        self._track(result.investigation,
+                    event_cache.file_sha256(jsonl) if jsonl.exists() else None)
+        if any(w.startswith(_journal_warning(name)) for w in result.warnings):
+            self._journal_bytes = None
+        return result
+
+    def save(self, investigation: Investigation) -> tuple[Path, Path]:
+        """Persist ``investigation``. Returns (file written, meta sidecar)."""
+        jsonl = _events_path(investigation.name, self.directory)
+        path = _journal_path(investigation.name, self.directory)
+        if (investigation.name != self._name or not jsonl.exists()
+                or self._journal_bytes != _size(path) or self._jsonl_stamp != _stamp(jsonl)
+                or self._jsonl_sha256 is None):
+            return self.compact(investigation)
+
+        ops = _diff_ops(self._persisted, investigation.events)
+        removed = [event for op in ops if op["op"] == "delete"
+                   for event in self._persisted[op["at"]:op["at"] + op["count"]]]
+        added = [event for op in ops if op["op"] == "add"
+                 for event in investigation.events[op["at"]:op["at"] + len(op["events"])]]
+        if ops:
+            is_new = not path.exists()
+            with path.open("a", encoding="utf-8") as handle:
+                if is_new:
+                    handle.write(json.dumps({"op": "base", "events": len(self._persisted),
+                                             "jsonl_sha256": self._jsonl_sha256}) + "\n")
+                for op in ops:
+                    handle.write(json.dumps(op) + "\n")
+        self._track(investigation, self._jsonl_sha256)
+        if path.exists() and self._should_compact(path.stat().st_size, jsonl.stat().st_size):
+            return self.compact(investigation)
+        meta = _read_meta(investigation.name, self.directory) or {}
+        meta_path = _write_meta(investigation, self.directory,
+                                meta.get("jsonl_sha256"))  # .jsonl unchanged
+        _record_in_catalogue(investigation, self.directory, (removed, added))
+        return (path if path.exists() else jsonl), meta_path
+
+    def compact(self, investigation: Investigation) -> tuple[Path, Path]:
+        """Fold everything into the canonical JSONL (a full :func:`save`)."""
+        meta = _read_meta(investigation.name, self.directory) or {}
+        partition = meta.get("partition")
+        if partition:
+            compress = any(entry["file"].endswith(".gz") for entry in meta.get("shards", []))
+        else:
+            compress = _events_path(investigation.name, self.directory).suffix == ".gz"
+        paths = save(investigation, self.directory, cache=self.cache and partition is None,
+                     partition=partition, compress=compress)
+        meta = _read_meta(investigation.name, self.directory) or {}
+        self._track(investigation, meta.get("jsonl_sha256"))  # just computed by save
+        return paths
+
+    def _should_compact(self, journal_bytes: int, jsonl_bytes: int) -> bool:
+        return journal_bytes >= max(self.compact_min_bytes, self.compact_ratio * jsonl_bytes)
+
+    def _track(self, investigation: Investigation, jsonl_sha256: str | None) -> None:
+        self._name = investigation.name
+        self._persisted = list(investigation.events)
+        self._journal_bytes = _size(_journal_path(investigation.name, self.directory))
+        self._jsonl_stamp = _stamp(_events_path(investigation.name, self.directory))
+        self._jsonl_sha256 = jsonl_sha256
+
+
+def _size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """``(size, mtime_ns)`` of ``path``: a rewrite changes it without reading the file."""
+    if not path.exists():
+        return None
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
@@ -37,9 +37,10 @@ costs a real overlap — so the estimator always rounds up.)
 
 from __future__ import annotations
 
+import heapq
 import itertools
 import textwrap
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -198,6 +199,12 @@ class LayoutResult:
     split_suggestions: list[SplitSuggestion] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
 
+    def iter_placed(self) -> Iterator[PlacedLabel]:
+        return iter(self.placed)
+
+    def iter_bars(self) -> Iterator[PlacedBar]:
+        return iter(self.bars)
+
 
 # --- internal box representation --------------------------------------------
 
@@ -226,6 +233,8 @@ def _wrap_to_fit(label: str, font: FontSpec, params: LayoutParams,
     per_char = max(1e-6, font.avg_char_width_ratio * font.size_px * params.width_fudge)
     max_chars_canvas = max(1, int(usable / per_char))
     effective_wrap = max(1, min(params.wrap_chars, max_chars_canvas))
+    if 0 < len(label) <= effective_wrap and label.isprintable() and label == label.strip():
+        return [label], effective_wrap  # what textwrap returns, minus its cost
     lines = textwrap.wrap(label, effective_wrap, break_long_words=True,
                           break_on_hyphens=True) or [""]
     return lines, effective_wrap
@@ -266,25 +275,58 @@ def _build_box(event: LayoutEvent, projection: AxisProjection, font: FontSpec,
     return box, warnings
 
 
+class _LevelPacker:
+    """Lowest-free-level interval packer — the engine behind the colouring.
+
+    Intervals must arrive sorted by left edge. Occupied levels sit in a min-heap
+    keyed by their running right edge, so every level an interval clears is
+    released in O(log L); released levels wait in a second min-heap so the
+    LOWEST free level is always taken first. That keeps the old linear scan's
+    determinism (and so its exact levels) at O(n log L) instead of O(n·L).
+    """
+
+    def __init__(self, gap: float = 0.0):
+        self._gap = gap
+        self._busy: list[tuple[float, int]] = []  # (right edge + gap, level)
+        self._free: list[int] = []                # released levels
+        self._edge: list[float] = []              # level -> right edge + gap
+
+    @property
+    def n_levels(self) -> int:
+        return len(self._edge)
+
+    def place(self, left: float, right: float) -> int:
+        """Assign the interval ``[left, right]`` to a level and return it."""
+        busy, free, edge = self._busy, self._free, self._edge
+        while busy and busy[0][0] <= left:
+            heapq.heappush(free, heapq.heappop(busy)[1])
+        # Callers sort on a rounded left edge, so a released level can sit a
+        # hair past this interval's exact left; skip those like the scan did.
+        skipped: list[int] = []
+        while free and edge[free[0]] > left:
+            skipped.append(heapq.heappop(free))
+        if free:
+            level = heapq.heappop(free)
+        else:
+            level = len(edge)
+            edge.append(0.0)
+        for other in skipped:
+            heapq.heappush(free, other)
+        edge[level] = right + self._gap
+        heapq.heappush(busy, (edge[level], level))
+        return level
+
+
 def _colour_levels(boxes: list[_Box], h_pad: float) -> int:
     """Assign each box a level (interval-graph colouring). Mutates box.level.
 
-    Boxes must be sorted by left edge. Each level stores its running rightmost
-    occupied edge; a box takes the lowest level whose edge clears its left.
+    Boxes must be sorted by left edge. A box takes the lowest level whose
+    running rightmost edge clears its left (see :class:`_LevelPacker`).
     """
-    level_right_edge: list[float] = []
+    packer = _LevelPacker(h_pad)
     for box in boxes:
-        assigned = None
-        for level in range(len(level_right_edge)):
-            if box.left >= level_right_edge[level]:
-                assigned = level
-                break
-        if assigned is None:
-            assigned = len(level_right_edge)
-            level_right_edge.append(0.0)
-        level_right_edge[assigned] = box.right + h_pad
-        box.level = assigned
-    return len(level_right_edge)
+        box.level = packer.place(box.left, box.right)
+    return packer.n_levels
 
 
 def _stack_vertically(boxes: list[_Box], n_levels: int, params: LayoutParams) -> float:
@@ -324,62 +366,57 @@ def _lane_pack_bars(events: Sequence[LayoutEvent], projection: AxisProjection,
         (e for e in events if e.is_span),
         key=lambda e: (projection.to_px(e.anchor_dt), e.id),
     )
-    lane_right_edge: list[float] = []
+    packer = _LevelPacker(gap_px)
     bars: list[PlacedBar] = []
     for event in spans:
         start_x = projection.to_px(event.anchor_dt)
         end_x = max(start_x, projection.to_px(event.end_dt))  # type: ignore[arg-type]
-        assigned = None
-        for lane in range(len(lane_right_edge)):
-            if start_x >= lane_right_edge[lane]:
-                assigned = lane
-                break
-        if assigned is None:
-            assigned = len(lane_right_edge)
-            lane_right_edge.append(0.0)
-        lane_right_edge[assigned] = end_x + gap_px
-        bars.append(PlacedBar(event.id, start_x, end_x, assigned))
-    return bars, len(lane_right_edge)
-
-
-def _suggest_splits(boxes: list[_Box], projection: AxisProjection,
+        bars.append(PlacedBar(event.id, start_x, end_x, packer.place(start_x, end_x)))
+    return bars, packer.n_levels
+
+
+def _suggest_splits(intervals: Iterable[tuple[float, float]], projection: AxisProjection,
                     params: LayoutParams, max_levels_fit: int) -> list[SplitSuggestion]:
     """Greedily cut the timeline into windows that each fit under the cap.
 
-    Works entirely on clones so it never disturbs the real boxes' levels.
+    ``intervals`` are the boxes' ``(left, right)`` pixel edges in layout order.
+    One sweep: boxes are already sorted by left edge, so appending a box to the
+    open window only ever extends that window's colouring — a running
+    :class:`_LevelPacker` holds it incrementally. When a box would push the
+    window past ``max_levels_fit`` the window closes and the box opens the next
+    one. O(n log L) overall, and the real boxes' levels are never touched.
     """
     suggestions: list[SplitSuggestion] = []
-    window: list[_Box] = []
-
-    def close_window() -> None:
-        if not window:
-            return
-        local_levels = _colour_levels([_clone(b) for b in window], params.box_h_pad_px)
-        left = min(b.left for b in window)
-        right = max(b.right for b in window)
+    packer = _LevelPacker(params.box_h_pad_px)
+    left = right = 0.0
+    size = 0
+
+    def close_window(peak_levels: int) -> None:
         suggestions.append(SplitSuggestion(
             window_start_dt=projection.to_dt(left),
             window_end_dt=projection.to_dt(right),
-            peak_levels=local_levels,
+            peak_levels=peak_levels,
         ))
 
-    for box in (_clone(b) for b in boxes):  # already sorted by left
-        trial = sorted(window + [box], key=lambda b: b.left)
-        trial_levels = _colour_levels([_clone(b) for b in trial], params.box_h_pad_px)
-        if window and trial_levels > max_levels_fit:
-            close_window()
-            window = [box]
+    for box_left, box_right in intervals:
+        packer.place(box_left, box_right)
+        if size and packer.n_levels > max_levels_fit:
+            # placing a box adds at most one level, so the window without it
+            # peaked one lower
+            close_window(packer.n_levels - 1)
+            packer = _LevelPacker(params.box_h_pad_px)
+            packer.place(box_left, box_right)
+            size = 0
+        if size:
+            left, right = min(left, box_left), max(right, box_right)
         else:
-            window.append(box)
-    close_window()
+            left, right = box_left, box_right
+        size += 1
+    if size:
+        close_window(packer.n_levels)
     return suggestions
 
 
-def _clone(box: _Box) -> _Box:
-    return _Box(box.id, box.anchor_x, box.left, box.right, box.width, box.height,
-                box.n_lines, box.wrapped_text, box.anchor_iso)
-
-
 def compute_layout(events: Sequence[LayoutEvent], projection: AxisProjection,
                    font: FontSpec | None = None, params: LayoutParams | None = None,
                    measurer: Measurer | None = None) -> LayoutResult:
@@ -414,7 +451,8 @@ def compute_layout(events: Sequence[LayoutEvent], projection: AxisProjection,
         tallest = max(b.height for b in boxes)
         usable = max(1.0, params.max_fig_height_px - params.baseline_offset_px)
         max_levels_fit = max(1, int(usable / (tallest + params.inter_box_vgap_px)))
-        split_suggestions = _suggest_splits(boxes, projection, params, max_levels_fit)
+        split_suggestions = _suggest_splits(((b.left, b.right) for b in boxes),
+                                            projection, params, max_levels_fit)
         warnings.append(
             f"{n_levels} stacked levels need {required_height_px:.0f}px, over the "
             f"{params.max_fig_height_px:.0f}px cap; suggest splitting into "
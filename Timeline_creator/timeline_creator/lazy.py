@@ -0,0 +1,286 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy, memory-mapped view of a saved investigation's events.
+
+Rendering one window of a multi-week case should not parse the whole case.
+:class:`LazyInvestigation` memory-maps ``<name>.jsonl`` and keeps a binary
+sidecar index, ``<name>.index``, with one entry per *event* (spans already
+paired, in :func:`io.load` order):
+
+  * start / end as int64 epoch microseconds (end = start for point events);
+  * the byte offset of the event's record (a span's Start) and of its End;
+  * a start-sorted permutation, plus the longest event duration, so a window
+    query is two bisections.
+
+Only the records of the events that are asked for are parsed and validated.
+Event ``N`` is O(1) once the index exists. The index is rebuilt whenever the
+``.jsonl``'s size or mtime no longer match the ones it was built from.
+
+The view is read-only and reflects the canonical ``.jsonl`` only, so it
+refuses to open a case with a pending ``<name>.journal`` (compact it first)
+or one saved as ``.jsonl.gz`` (byte offsets need the plain file).
+Typical use, feeding the renderer just the visible window::
+
+    with LazyInvestigation.open("case-1", directory) as lazy:
+        events = lazy.window(start, end)          # via filters.by_time_window
+        renderer.render(events, window=(start, end))
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from . import filters, io
+from .models import Event
+
+MAGIC = b"TCIX"
+FORMAT_VERSION = 1
+NO_OFFSET = -1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PREAMBLE = struct.Struct("<4sII")  # magic, format version, header length
+
+
+def index_path(name: str, directory: str | Path = ".") -> Path:
+    return Path(directory) / f"{name}.index"
+
+
+def _epoch_us(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _parse_us(text: str) -> int:
+    value = datetime.fromisoformat(text)
+    if value.tzinfo is None or value.tzinfo.utcoffset(value) is None:
+        raise ValueError(f"naive datetime in saved record: {text!r}")
+    return _epoch_us(value)
+
+
+class LazyInvestigation:
+    """Index-backed random and windowed access to ``<name>.jsonl``."""
+
+    def __init__(self, name: str, directory: Path, data: mmap.mmap | bytes,
+                 columns: dict[str, array], max_duration_us: int, warnings: list[str]):
+        self.name = name
+        self.directory = directory
+        self.warnings = warnings
+        self._data = data
+        self._starts = columns["starts"]
+        self._ends = columns["ends"]
+        self._offsets = columns["offsets"]
+        self._end_offsets = columns["end_offsets"]
+        self._by_start = columns["by_start"]
+        self._sorted_starts = array("q", (self._starts[i] for i in self._by_start))
+        self._max_duration_us = max_duration_us
+
+    # -- opening -------------------------------------------------------------
+
+    @classmethod
+    def open(cls, name: str, directory: str | Path = ".") -> "LazyInvestigation":
+        """Map ``<name>.jsonl``, building or refreshing its index as needed."""
+        directory = Path(directory)
+        jsonl = io._jsonl_path(name, directory)
+        if not jsonl.exists() and io._jsonl_path(name, directory, compressed=True).exists():
+            raise ValueError(f"'{name}' is saved compressed; a lazy view needs the plain "
+                             ".jsonl (save it with compress=False).")
+        if not jsonl.exists():
+            raise FileNotFoundError(f"No events file for investigation '{name}' at {jsonl}")
+        if io._journal_path(name, directory).exists():
+            raise ValueError(f"'{name}' has unsaved journal changes; compact it before "
+                             "opening a lazy view.")
+        with jsonl.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            data = (mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                    if stat.st_size else b"")
+        stamp = {"jsonl_size": stat.st_size, "jsonl_mtime_ns": stat.st_mtime_ns}
+        path = index_path(name, directory)
+        loaded = _read_index(path, stamp)
+        if loaded is None:
+            loaded = _build_index(data)
+            _write_index(path, stamp, *loaded)
+        columns, max_duration_us, warnings = loaded
+        return cls(name, directory, data, columns, max_duration_us, warnings)
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self) -> "LazyInvestigation":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # -- access --------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> Event:
+        """Event ``index`` (load order), parsed from its one or two records."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("event index out of range")
+        record = self._record(self._offsets[index])
+        end_offset = self._end_offsets[index]
+        if end_offset != NO_OFFSET:
+            halves = {io.DESC_START: record, io.DESC_END: self._record(end_offset)}
+        elif (desc := record.get("timestamp_desc", io.DESC_EVENT)) in (
+                io.DESC_START, io.DESC_END) and record.get("span_id"):
+            halves = {desc: record}  # an orphan, warned about when the index was built
+        else:
+            return io._point_event_from_record(record)
+        return io._event_from_halves(record["span_id"], halves, [])
+
+    def __iter__(self) -> Iterator[Event]:
+        return (self[i] for i in range(len(self)))
+
+    def _record(self, offset: int) -> dict:
+        newline = self._data.find(b"\n", offset)
+        return json.loads(self._data[offset:newline if newline != -1 else len(self._data)])
+
+    def time_range(self) -> tuple[datetime, datetime] | None:
+        """Earliest start and latest end over all events (None if empty)."""
+        if not len(self):
+            return None
+        return (_EPOCH + timedelta(microseconds=self._sorted_starts[0]),
+                _EPOCH + timedelta(microseconds=max(self._ends)))
+
+    def window_indices(self, start: datetime | None = None,
+                       end: datetime | None = None) -> list[int]:
+        """Indices (load order) of events intersecting ``[start, end]``.
+
+        Events starting after ``end`` are cut by bisection; events ending
+        before ``start`` are cut by bisecting at ``start`` minus the longest
+        duration, then checking the few candidates' ends.
+        """
+        return sorted(self._by_start_indices(start, end))
+
+    def _by_start_indices(self, start: datetime | None, end: datetime | None) -> list[int]:
+        start_us = _epoch_us(start) if start is not None else None
+        lo = 0 if start_us is None else bisect_left(
+            self._sorted_starts, start_us - self._max_duration_us)
+        hi = len(self) if end is None else bisect_right(self._sorted_starts, _epoch_us(end))
+        ends = self._ends
+        return [i for i in self._by_start[lo:hi] if start_us is None or ends[i] >= start_us]
+
+    def iter_by_start(self, start: datetime | None = None,
+                      end: datetime | None = None) -> Iterator[Event]:
+        """Events intersecting ``[start, end]``, unclipped, in start-time order.
+
+        Ties keep load order. Each event is parsed as it is reached, so this
+        streams a case in time order whatever order it was saved in.
+        """
+        return (self[i] for i in self._by_start_indices(start, end))
+
+    def window(self, start: datetime | None = None, end: datetime | None = None, *,
+               clip: bool = True) -> list[Event]:
+        """Events intersecting ``[start, end]``, parsing only those records.
+
+        The result goes through :func:`filters.by_time_window`, so spans are
+        clipped to the window exactly as for an eagerly loaded case.
+        """
+        events = [self[i] for i in self.window_indices(start, end)]
+        return filters.by_time_window(events, start, end, clip=clip)
+
+
+# --- the index sidecar ---------------------------------------------------------
+
+def _iter_index_records(data) -> Iterator[dict]:
+    """Minimal pairing records (desc, span_id, datetime, offset) for every line."""
+    position, size = 0, len(data)
+    while position < size:
+        newline = data.find(b"\n", position)
+        line_end = newline if newline != -1 else size
+        line = data[position:line_end]
+        if line.strip():
+            record = json.loads(line)
+            yield {"timestamp_desc": record.get("timestamp_desc", io.DESC_EVENT),
+                   "span_id": record.get("span_id"),
+                   "datetime": record["datetime"], "offset": position}
+        position = line_end + 1
+
+
+def _build_index(data) -> tuple[dict[str, array], int, list[str]]:
+    starts, ends = array("q"), array("q")
+    offsets, end_offsets = array("q"), array("q")
+    warnings: list[str] = []
+    for span_id, item in io._pair_slots(_iter_index_records(data), max_pending=None):
+        if span_id is None:
+            first, last = item, None
+        else:
+            first, last = io._span_records(span_id, item, warnings)
+        start_us = _parse_us(first["datetime"])
+        starts.append(start_us)
+        ends.append(_parse_us(last["datetime"]) if last is not None else start_us)
+        offsets.append(first["offset"])
+        end_offsets.append(last["offset"] if last is not None else NO_OFFSET)
+    by_start = array("q", sorted(range(len(starts)), key=starts.__getitem__))
+    max_duration_us = max((e - s for s, e in zip(starts, ends)), default=0)
+    columns = {"starts": starts, "ends": ends, "offsets": offsets,
+               "end_offsets": end_offsets, "by_start": by_start}
+    return columns, max_duration_us, warnings
+
+
+_COLUMNS = ("starts", "ends", "offsets", "end_offsets", "by_start")
+
+
+def _write_index(path: Path, stamp: dict, columns: dict[str, array], max_duration_us: int,
+                 warnings: list[str]) -> None:
+    header = json.dumps({**stamp, "count": len(columns["starts"]),
+                         "byteorder": sys.byteorder, "max_duration_us": max_duration_us,
+                         "warnings": warnings}).encode("utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("wb") as handle:
+        handle.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+        handle.write(header)
+        for name in _COLUMNS:
+            columns[name].tofile(handle)
+    os.replace(tmp, path)
+
+
+def _read_index(path: Path, stamp: dict) -> tuple[dict[str, array], int, list[str]] | None:
+    """The stored index if it was built from a file with this size/mtime."""
+    try:
+        data = path.read_bytes()
+        magic, version, header_length = _PREAMBLE.unpack_from(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            return None
+        header = json.loads(data[_PREAMBLE.size:_PREAMBLE.size + header_length])
+        if any(header.get(key) != value for key, value in stamp.items()):
+            return None
+        offset = _PREAMBLE.size + header_length
+        count = header["count"]
+        columns: dict[str, array] = {}
+        for name in _COLUMNS:
+            column = array("q")
+            column.frombytes(data[offset:offset + count * column.itemsize])
+            if len(column) != count:
+                return None
+            if header["byteorder"] != sys.byteorder:
+                column.byteswap()
+            columns[name] = column
+            offset += count * column.itemsize
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    return columns, header["max_duration_us"], list(header["warnings"])
@@ -0,0 +1,224 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Text measurement support for the layout's injectable ``measurer``.
+
+Accurate export measures every wrapped line against true font metrics, and a
+zoom session re-lays out the same labels over and over. :class:`MeasureCache`
+memoises those widths keyed by ``(line text, font family, font size, dpi)``:
+
+  * in memory, with LRU eviction past ``maxsize`` entries;
+  * optionally on disk (a small JSON file next to the investigation, see
+    :func:`cache_path_for`) so a reopened case starts warm.
+
+Hit/miss counters are exposed so the effect on a session can be inspected.
+
+:class:`GlyphAdvanceMeasurer` avoids the matplotlib Text/renderer path
+altogether: it reads glyph advances and kerning once from the font matplotlib
+would use and measures lines by table lookup. It is the only part of this
+module that touches matplotlib, and imports it lazily.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from .layout import FontSpec, Measurer, default_font
+
+MeasureKey = tuple[str, str, float, float]  # (text, family, font size, dpi)
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def cache_path_for(name: str, directory: str | Path = ".") -> Path:
+    """Where the on-disk measurement store for investigation ``name`` lives."""
+    return Path(directory) / f"{name}.measure.json"
+
+
+class MeasureCache:
+    """LRU cache of measured line widths, optionally persisted to ``path``."""
+
+    def __init__(self, maxsize: int = 100_000, path: str | Path | None = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.path = Path(path) if path is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[MeasureKey, float] = OrderedDict()
+        self._dirty = False
+        if self.path is not None and self.path.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = 0
+
+    def get(self, key: MeasureKey) -> float | None:
+        width = self._entries.get(key)
+        if width is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return width
+
+    def put(self, key: MeasureKey, width: float) -> None:
+        self._entries[key] = width
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def wrap(self, measurer: Measurer, family: str, size: float, dpi: float) -> Measurer:
+        """Return ``measurer`` with lookups routed through this cache.
+
+        ``family``/``size``/``dpi`` describe what ``measurer`` actually renders
+        with; they complete the cache key alongside the line text.
+        """
+
+        def cached(text: str, font: FontSpec) -> float:
+            key = (text, family, float(size), float(dpi))
+            width = self.get(key)
+            if width is None:
+                width = measurer(text, font)
+                self.put(key, width)
+            return width
+
+        cached.cache = self  # type: ignore[attr-defined]
+        return cached
+
+    # -- persistence ---------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return  # a damaged cache is just a cold cache
+        if data.get("version") != _CACHE_FORMAT_VERSION:
+            return
+        for text, family, size, dpi, width in data.get("entries", [])[-self.maxsize:]:
+            self._entries[(text, family, float(size), float(dpi))] = float(width)
+
+    def save(self) -> Path | None:
+        """Write the cache to ``path`` if it changed. Returns the path written."""
+        if self.path is None or not self._dirty:
+            return None
+        payload = {
+            "version": _CACHE_FORMAT_VERSION,
+            "entries": [[*key, width] for key, width in self._entries.items()],
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+        return self.path
+
+
+class GlyphAdvanceMeasurer:
+    """Artist-free line measurer calibrated from the real font's glyph metrics.
+
+    Plug-compatible with the layout's ``Measurer`` (``measurer(text, font)``).
+    Advances are the hinted ones matplotlib's Agg text layout uses, read via its
+    font manager + FT2Font, plus pair kerning and the last glyph's ink overhang.
+    Agg snaps its text extents to the pixel grid, so a small margin
+    (``1 px + 0.5 %``) keeps this an over-estimate — never below the artist
+    measurement, which is what preserves the SVG non-overlap guarantee.
+
+    Lines containing a glyph the font lacks (matplotlib would fall back to
+    another font) are handed to ``fallback`` if given.
+    """
+
+    MARGIN_PX = 1.0
+    MARGIN_RATIO = 1.005
+
+    def __init__(self, font_size_pt: float, dpi: float, family: str | None = None,
+                 fallback: Measurer | None = None):
+        from matplotlib import font_manager, ft2font  # lazy: keeps the module pure
+        from matplotlib.backends.backend_agg import get_hinting_flag
+
+        props = font_manager.FontProperties(family=family)
+        self.path = font_manager.findfont(props)
+        self._font = ft2font.FT2Font(self.path)
+        self._font.set_size(font_size_pt, dpi)
+        self._flags = get_hinting_flag()
+        self._kerning_mode = ft2font.Kerning.DEFAULT
+        self.family = font_manager.FontProperties(fname=self.path).get_name()
+        self.font_size_pt = font_size_pt
+        self.dpi = dpi
+        self.size_px = font_size_pt * dpi / 72.0
+        self.fallback = fallback
+        self._glyphs: dict[str, tuple[int, float, float]] = {}  # index, advance, overhang
+        self._kerning: dict[tuple[int, int], float] = {}
+        for code in range(0x20, 0x17F):  # Basic Latin + Latin-1 + Latin Extended-A
+            if chr(code).isprintable():
+                self._glyph(chr(code))
+
+    def _glyph(self, ch: str) -> tuple[int, float, float]:
+        glyph = self._glyphs.get(ch)
+        if glyph is None:
+            index = self._font.get_char_index(ord(ch))
+            if index == 0:  # not in this font; measure() defers to the fallback
+                glyph = self._glyphs[ch] = (0, self.size_px, 0.0)
+                return glyph
+            loaded = self._font.load_char(ord(ch), flags=self._flags)
+            advance = loaded.horiAdvance / 64.0
+            overhang = max(0.0, (loaded.horiBearingX + loaded.width) / 64.0 - advance)
+            glyph = self._glyphs[ch] = (index, advance, overhang)
+        return glyph
+
+    def _kern(self, left: int, right: int) -> float:
+        pair = (left, right)
+        kern = self._kerning.get(pair)
+        if kern is None:
+            kern = self._kerning[pair] = (
+                self._font.get_kerning(left, right, self._kerning_mode) / 64.0)
+        return kern
+
+    def measure(self, text: str, font: FontSpec | None = None) -> float:
+        """Width in pixels of one line of ``text``."""
+        text = text or " "
+        total = 0.0
+        previous = None
+        for ch in text:
+            index, advance, _ = self._glyph(ch)
+            if index == 0 and self.fallback is not None:
+                return self.fallback(text, font or default_font())
+            if previous is not None:
+                total += self._kern(previous, index)
+            total += advance
+            previous = index
+        total += self._glyph(text[-1])[2]
+        return total * self.MARGIN_RATIO + self.MARGIN_PX
+
+    def __call__(self, text: str, font: FontSpec) -> float:
+        return self.measure(text, font)
+
+    def char_width_table(self) -> dict[str, float]:
+        """Advances as ``FontSpec.char_width_table`` ratios (× ``size_px``)."""
+        return {ch: advance / self.size_px
+                for ch, (index, advance, _) in self._glyphs.items() if index}
+
+    def font_spec(self) -> FontSpec:
+        """A :class:`FontSpec` for the pure estimator, calibrated to this font."""
+        return FontSpec(size_px=self.size_px, line_height_px=round(self.size_px * 1.35, 3),
+                        char_width_table=self.char_width_table())
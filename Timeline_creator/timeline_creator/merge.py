@@ -0,0 +1,170 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Super-timelines: k-way streaming merge of several investigations.
+
+One investigation per host is the usual shape of a case; the combined view is
+a merge on ``datetime``. Each input is streamed in start-time order through
+its :class:`lazy.LazyInvestigation` offset index (a plain saved ``.jsonl``
+with no pending journal), so only one event per input is in memory while
+:func:`heapq.merge` interleaves them. Inputs the lazy view cannot map (a
+journal, gzip, or the partitioned layout) are read with
+:func:`io.load_window` and sorted in memory — only the window's events.
+
+Span ids are per investigation, and the synthesised ``span-<index>`` ones
+collide across hosts almost always; a span whose id an earlier input already
+used is renamed ``<investigation>:<span_id>``. Ties keep input order.
+
+    events = merge.window(["host-a", "host-b"], directory, start, end)
+    renderer.render(events, window=(start, end))          # merged, on the fly
+    merge.merge(["host-a", "host-b"], "all-hosts", directory)   # written out
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterator, Sequence
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from . import filters, io
+from .lazy import LazyInvestigation
+from .models import AccountType, Event
+
+
+@dataclass
+class MergeResult:
+    """Outcome of :func:`merge` — the files written plus what had to change."""
+
+    jsonl: Path
+    meta: Path
+    events: int = 0
+    remapped_span_ids: int = 0
+    warnings: list[str] = field(default_factory=list)
+
+
+class _SpanIds:
+    """First input to use a span id keeps it; later ones get a prefixed id."""
+
+    def __init__(self) -> None:
+        self._owner: dict[str, int] = {}
+        self.remapped = 0
+
+    def claim(self, event: Event, source: int, name: str) -> Event:
+        if not event.is_span:
+            return event
+        span_id = event.span_id
+        if self._owner.setdefault(span_id, source) == source:
+            return event
+        renamed = f"{name}:{span_id}"
+        while self._owner.setdefault(renamed, source) != source:
+            renamed += "'"
+        self.remapped += 1
+        return event.model_copy(update={"span_id": renamed})
+
+
+def _in_time_order(name: str, directory: Path, start: datetime | None, end: datetime | None,
+                   warnings: list[str], stack: ExitStack) -> Iterator[Event]:
+    try:
+        lazy = stack.enter_context(LazyInvestigation.open(name, directory))
+    except (FileNotFoundError, ValueError):  # journal, gzip or partitioned: no offset index
+        events = io.load_window(name, directory, start, end, clip=False, warnings=warnings)
+        return iter(sorted(events, key=lambda event: event.datetime))
+    warnings.extend(lazy.warnings)
+    return lazy.iter_by_start(start, end)
+
+
+def _merged(names: Sequence[str], directory: Path, start: datetime | None,
+            end: datetime | None, warnings: list[str], span_ids: _SpanIds) -> Iterator[Event]:
+    def claimed(source: int, name: str, events: Iterator[Event]) -> Iterator[Event]:
+        return (span_ids.claim(event, source, name) for event in events)
+
+    with ExitStack() as stack:
+        streams = [claimed(source, name,
+                           _in_time_order(name, directory, start, end, warnings, stack))
+                   for source, name in enumerate(names)]
+        yield from heapq.merge(*streams, key=lambda event: event.datetime)
+
+
+def iter_merged(names: Sequence[str], directory: str | Path = ".", *,
+                start: datetime | None = None, end: datetime | None = None,
+                warnings: list[str] | None = None) -> Iterator[Event]:
+    """Stream the investigations ``names`` as one timeline in start-time order.
+
+    With ``start``/``end`` only events intersecting that window are read
+    (unclipped; :func:`window` clips). Load warnings go to ``warnings``.
+    """
+    warnings = warnings if warnings is not None else []
+    return _merged(list(names), Path(directory), start, end, warnings, _SpanIds())
+
+
+def window(names: Sequence[str], directory: str | Path = ".", start: datetime | None = None,
+           end: datetime | None = None, *, clip: bool = True,
+           warnings: list[str] | None = None) -> list[Event]:
+    """The merged events of ``[start, end]``, ready for ``TimelineRenderer.render``."""
+    events = list(iter_merged(names, directory, start=start, end=end, warnings=warnings))
+    return filters.by_time_window(events, start, end, clip=clip)
+
+
+def _union_catalogues(names: Sequence[str], directory: Path,
+                      warnings: list[str]) -> tuple[list[str], dict[str, AccountType]]:
+    """Endpoints in first-seen order; a user keeps the first input's account type."""
+    endpoints: list[str] = []
+    users: dict[str, AccountType] = {}
+    for name in names:
+        meta = io._read_meta(name, directory) or {}
+        endpoints += [e for e in meta.get("endpoints", []) if e not in endpoints]
+        for user, value in meta.get("users", {}).items():
+            account_type = AccountType(value)
+            if users.setdefault(user, account_type) != account_type:
+                warnings.append(f"user '{user}' is {users[user].value} in an earlier "
+                                f"investigation but {value} in '{name}'; kept "
+                                f"{users[user].value}.")
+    return endpoints, users
+
+
+class _Counted:
+    """Pass-through iterator that counts what went by."""
+
+    def __init__(self, events: Iterator[Event]):
+        self._events = events
+        self.count = 0
+
+    def __iter__(self) -> Iterator[Event]:
+        for event in self._events:
+            self.count += 1
+            yield event
+
+
+def merge(names: Sequence[str], output: str, directory: str | Path = ".", *,
+          output_directory: str | Path | None = None, compress: bool = False) -> MergeResult:
+    """Write the merge of ``names`` as the new investigation ``output``.
+
+    Events are streamed from the inputs to :func:`io.save_events`; the
+    catalogues are the union of the inputs' (see :func:`_union_catalogues`).
+    """
+    directory = Path(directory)
+    output_directory = Path(output_directory) if output_directory is not None else directory
+    names = list(names)
+    if output in names and output_directory.resolve() == directory.resolve():
+        raise ValueError(f"cannot merge into '{output}': it is one of the inputs")
+    warnings: list[str] = []
+    endpoints, users = _union_catalogues(names, directory, warnings)
+    span_ids = _SpanIds()
+    counted = _Counted(_merged(names, directory, None, None, warnings, span_ids))
+    jsonl, meta = io.save_events(output, counted, output_directory, endpoints=endpoints,
+                                 users=users, compress=compress)
+    return MergeResult(jsonl=jsonl, meta=meta, events=counted.count,
+                       remapped_span_ids=span_ids.remapped, warnings=warnings)
+
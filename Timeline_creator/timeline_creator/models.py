@@ -28,13 +28,18 @@ records lives in :mod:`timeline_creator.io`, not here.
 
 from __future__ import annotations
 
-from datetime import datetime as _DateTime, timezone
+from collections import Counter
+from datetime import datetime as _DateTime, timedelta, timezone
 from enum import Enum
+from hashlib import blake2b
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 SCHEMA_VERSION = 1
 
+_EPOCH = _DateTime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class AccountType(str, Enum):
     """Account types an analyst attributes events to.
@@ -123,12 +128,119 @@ class Event(BaseModel):
     def is_span(self) -> bool:
         return self.end is not None
 
+    def content_key(self) -> bytes:
+        """16-byte blake2b digest of everything but ``span_id``.
+
+        Equal for the same event imported twice, whatever span id either copy
+        was given; the deduplication key of :meth:`Investigation.has_event`.
+        Times go in as epoch microseconds (exact, and far cheaper than
+        ``isoformat``).
+        """
+        end = (self.end - _EPOCH) // _MICROSECOND if self.end is not None else None
+        fields = ((self.datetime - _EPOCH) // _MICROSECOND, end, self.message, self.endpoint,
+                  self.username, self.account_type.value)
+        return blake2b(repr(fields).encode(), digest_size=16).digest()
+
+    @classmethod
+    def construct_trusted(cls, datetime: _DateTime, message: str, endpoint: str,
+                          username: str, account_type: AccountType,
+                          end: _DateTime | None = None, span_id: str | None = None) -> "Event":
+        """Build an Event WITHOUT validation from values that already passed it.
+
+        Only for storage paths that can prove provenance — data this tool wrote
+        from validated events and has integrity-checked since. Everything else
+        goes through the normal constructor. Equivalent to ``model_construct``
+        with every field given, minus its per-field alias/default handling —
+        which is most of its cost on the cache and JSONL load paths. It fills
+        pydantic's instance slots directly, so
+        ``test_construct_trusted_matches_model_construct`` pins the two together
+        across pydantic upgrades.
+        """
+        event = cls.__new__(cls)
+        object.__setattr__(event, "__dict__", {
+            "datetime": datetime, "message": message, "endpoint": endpoint,
+            "username": username, "account_type": account_type, "end": end,
+            "span_id": span_id,
+        })
+        object.__setattr__(event, "__pydantic_fields_set__", set(cls.__pydantic_fields__))
+        object.__setattr__(event, "__pydantic_extra__", None)
+        object.__setattr__(event, "__pydantic_private__", None)
+        return event
+
+
+class _EventList(list):
+    """``Investigation.events``: a list that drops its duplicate index on any change.
+
+    The index (:meth:`Event.content_key` counts) lives on the list it
+    describes, so it is never compared as model state, and every mutating
+    list method — item assignment included — invalidates it. Only
+    :class:`Investigation` updates it in place.
+    """
+
+    _content: "Counter[bytes] | None" = None
+
+    def _changed(self) -> None:
+        self._content = None
+
+    def __setitem__(self, index, value):
+        self._changed()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._changed()
+        super().__delitem__(index)
+
+    def __iadd__(self, other):
+        self._changed()
+        return super().__iadd__(other)
+
+    def __imul__(self, other):
+        self._changed()
+        return super().__imul__(other)
+
+    def append(self, event):
+        self._changed()
+        super().append(event)
+
+    def extend(self, events):
+        self._changed()
+        super().extend(events)
+
+    def insert(self, index, event):
+        self._changed()
+        super().insert(index, event)
+
+    def pop(self, index=-1):
+        self._changed()
+        return super().pop(index)
+
+    def remove(self, event):
+        self._changed()
+        super().remove(event)
+
+    def clear(self):
+        self._changed()
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self._changed()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self._changed()
+        super().reverse()
+
 
 class Investigation(BaseModel):
     """A named collection of events plus the endpoints/users seen in it.
 
     ``endpoints`` and ``users`` are the catalogues the UI offers for quick
     entry; events may reference values auto-added on import (D18).
+
+    :meth:`has_event` looks events up by :meth:`Event.content_key` in an
+    index built on first use and kept current by :meth:`add_event` and
+    :meth:`remove_event`. Any other change to ``events`` (see
+    :class:`_EventList`) drops it, to be rebuilt on the next lookup.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -136,9 +248,14 @@ class Investigation(BaseModel):
     name: str = Field(min_length=1)
     endpoints: list[str] = Field(default_factory=list)
     users: dict[str, AccountType] = Field(default_factory=dict)
-    events: list[Event] = Field(default_factory=list)
+    events: list[Event] = Field(default_factory=list, validate_default=True)
     schema_version: int = SCHEMA_VERSION
 
+    @field_validator("events")
+    @classmethod
+    def _event_list(cls, events: list[Event]) -> list[Event]:
+        return _EventList(events)
+
     def add_endpoint(self, endpoint: str) -> bool:
         """Add an endpoint if new. Returns True if it was added."""
         endpoint = endpoint.strip()
@@ -158,8 +275,50 @@ class Investigation(BaseModel):
         self.users[username] = account_type
         return True
 
-    def add_event(self, event: Event) -> None:
-        """Append an event, auto-cataloguing its endpoint and user (D18)."""
+    def add_event(self, event: Event, *, skip_duplicate: bool = False) -> bool:
+        """Append an event, auto-cataloguing its endpoint and user (D18).
+
+        With ``skip_duplicate`` an event :meth:`has_event` already finds is
+        not added. Returns True if the event was added.
+        """
+        if skip_duplicate and self.has_event(event):
+            return False
+        events = self._events()
+        content = events._content
         self.add_endpoint(event.endpoint)
         self.add_user(event.username, event.account_type)
-        self.events.append(event)
+        events.append(event)
+        if content is not None:
+            content[event.content_key()] += 1
+            events._content = content
+        return True
+
+    def remove_event(self, index: int) -> Event:
+        """Remove and return ``events[index]``, keeping the duplicate index current."""
+        events = self._events()
+        content = events._content
+        event = events.pop(index)
+        if content is not None:
+            key = event.content_key()
+            content[key] -= 1
+            if not content[key]:
+                del content[key]
+            events._content = content
+        return event
+
+    def has_event(self, event: Event) -> bool:
+        """Whether an event with the same :meth:`Event.content_key` is already here."""
+        return event.content_key() in self.content_keys()
+
+    def content_keys(self) -> Counter[bytes]:
+        """The duplicate index: content key -> number of events with it. Do not modify."""
+        events = self._events()
+        if events._content is None:
+            events._content = Counter(event.content_key() for event in events)
+        return events._content
+
+    def _events(self) -> _EventList:
+        """``events`` as an :class:`_EventList` (a plain list assigned directly is wrapped)."""
+        if not isinstance(self.events, _EventList):
+            self.events = _EventList(self.events)
+        return self.events
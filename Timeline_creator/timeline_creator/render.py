@@ -20,6 +20,9 @@ pixel geometry into a figure:
   * colour/marker -> concrete styles mapped from the symbolic colour tokens
   * legend        -> grouped by account-type family
 
+Markers, leader lines and bars are drawn as batched collections; only the
+labels are per-event artists, which keeps 10k-event figures workable.
+
 The DPI<->pixel bridge lives here: the axes pixel width drives the layout
 projection, and the layout's required pixel height drives the figure height, so
 1 y-unit == 1 pixel and the layout's non-overlap guarantee survives into the
@@ -27,8 +30,10 @@ rendered output. Export re-runs the layout with a matplotlib-backed text
 measurer so the vector SVG is collision-free against true font metrics.
 
 Primary export is SVG (vector, crisp in reports); PNG is a convenience
-fallback. An interactive ipympl view supports zoom/pan with a "re-layout for
-current view" button (button-press, not reactive).
+fallback. :meth:`TimelineRenderer.export_svg_direct` skips the figure and
+streams the layout through :mod:`timeline_creator.svg` for large reports. An
+interactive ipympl view supports zoom/pan with a "re-layout for current view"
+button (button-press, not reactive).
 """
 
 from __future__ import annotations
@@ -39,31 +44,25 @@ from datetime import datetime, timezone, tzinfo
 import matplotlib
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib import font_manager
+from matplotlib.collections import LineCollection
 from matplotlib.lines import Line2D
 
 from . import colour as colour_mod
 from . import filters
-from .colour import SHADES_PER_FAMILY, ColourToken
+from .array_layout import ArrayLayoutResult, compute_layout_arrays
+from .colour import FAMILY_RAMPS, ColourToken, hex_for  # noqa: F401 - FAMILY_RAMPS re-exported
 from .layout import (AxisProjection, LayoutParams, LayoutResult, compute_layout,
                      default_font, layout_events_from)
+from .measure import GlyphAdvanceMeasurer, MeasureCache
 from .models import AccountType, Event
-
-# Concrete colour ramps per family (light -> dark), SHADES_PER_FAMILY entries each.
-FAMILY_RAMPS: dict[str, list[str]] = {
-    "reds":    ["#fcae91", "#fb6a4a", "#de2d26", "#a50f15"],
-    "blues":   ["#9ecae1", "#4292c6", "#2171b5", "#084594"],
-    "greys":   ["#bdbdbd", "#969696", "#636363", "#252525"],
-    "oranges": ["#fdbe85", "#fd8d3c", "#e6550d", "#a63603"],
-    "greens":  ["#a1d99b", "#41ab5d", "#238b45", "#005a32"],
-    "purples": ["#bcbddc", "#807dba", "#6a51a3", "#4a1486"],
-    "neutral": ["#bdbdbd", "#737373", "#525252", "#252525"],
-}
+from .svg import export_svg_direct as _export_svg_direct
 
 
 def colour_for(token: ColourToken) -> str:
     """Concrete matplotlib colour string for a symbolic token."""
-    ramp = FAMILY_RAMPS.get(token.family, FAMILY_RAMPS["neutral"])
-    return ramp[token.shade_index % SHADES_PER_FAMILY]
+    return hex_for(token)
 
 
 @dataclass
@@ -77,6 +76,7 @@ class RenderStyle:
     top_frac: float = 0.04
     bar_area_px: float = 26.0    # vertical pixels reserved below baseline for bars
     lane_height_px: float = 7.0
+    text_measurer: str = "glyph"  # accurate widths: "glyph" (font tables) | "artist"
 
 
 def _axes_pixel_width(style: RenderStyle) -> float:
@@ -84,11 +84,18 @@ def _axes_pixel_width(style: RenderStyle) -> float:
     return frac * style.fig_width_in * style.dpi
 
 
-def _make_measurer(style: RenderStyle):
+def _font_family() -> str:
+    """Name of the font matplotlib actually resolves for label text."""
+    path = font_manager.findfont(font_manager.FontProperties())
+    return font_manager.FontProperties(fname=path).get_name()
+
+
+def _make_measurer(style: RenderStyle, cache: MeasureCache | None = None):
     """A matplotlib-backed text measurer (px width of one line at the font).
 
     Uses a scratch Agg figure at the target dpi; width depends only on dpi and
     font, not on the final figure size, so this is safe to build up front.
+    With a ``cache``, only lines it has not seen before are measured.
     """
     scratch = plt.figure(dpi=style.dpi)
     canvas = scratch.canvas
@@ -101,27 +108,79 @@ def _make_measurer(style: RenderStyle):
         return width
 
     measurer._scratch = scratch  # keep a reference alive
-    return measurer
+    if cache is None:
+        return measurer
+    wrapped = cache.wrap(measurer, _font_family(), style.font_size, style.dpi)
+    wrapped._scratch = scratch
+    return wrapped
+
+
+def _make_glyph_measurer(style: RenderStyle, cache: MeasureCache | None = None):
+    """A font-table measurer; lines with glyphs outside the font use the artist path.
+
+    With a ``cache``, every line goes through it, fallback lines included. It
+    shares keys with :func:`_make_measurer`'s: both measurers are exact or
+    over-estimate, so either's stored width keeps labels apart.
+    """
+    artist = None
+
+    def fallback(text: str, font) -> float:
+        nonlocal artist
+        if artist is None:
+            artist = _make_measurer(style)  # the cache already sits in front
+        return artist(text, font)
+
+    measurer = GlyphAdvanceMeasurer(style.font_size, style.dpi, fallback=fallback)
+    if cache is None:
+        return measurer
+    return cache.wrap(measurer, measurer.family, style.font_size, style.dpi)
 
 
 @dataclass
 class RenderedTimeline:
     figure: matplotlib.figure.Figure
     axes: matplotlib.axes.Axes
-    layout: LayoutResult
+    layout: LayoutResult | ArrayLayoutResult
     window: tuple[datetime, datetime]
 
 
 class TimelineRenderer:
-    """Render filtered events into a matplotlib figure using the pure layout."""
+    """Render filtered events into a matplotlib figure using the pure layout.
+
+    ``engine="array"`` lays out with the numpy-backed
+    :func:`~timeline_creator.array_layout.compute_layout_arrays` (same levels,
+    far cheaper for 100k-event investigations); the default ``"python"`` engine
+    is the pure reference.
+
+    Accurate text widths are memoised in ``measure_cache`` for the renderer's
+    lifetime, so re-renders and re-layouts only measure lines they have not
+    seen. Give the cache a ``path`` to persist it between sessions. With
+    ``RenderStyle.text_measurer="glyph"`` (the default) the lines it has not
+    seen are measured from font tables, and most never reach the artist path
+    at all — see :class:`~timeline_creator.measure.GlyphAdvanceMeasurer`.
+    """
 
     def __init__(self, style: RenderStyle | None = None,
                  layout_params: LayoutParams | None = None,
-                 display_tz: tzinfo = timezone.utc):
+                 display_tz: tzinfo = timezone.utc, engine: str = "python",
+                 measure_cache: MeasureCache | None = None):
+        if engine not in ("python", "array"):
+            raise ValueError(f"unknown layout engine {engine!r}; use 'python' or 'array'")
         self.style = style or RenderStyle()
         self.layout_params = layout_params or LayoutParams()
         self.display_tz = display_tz
+        self.engine = engine
         self.font = default_font(self.style.font_size)
+        self.measure_cache = measure_cache if measure_cache is not None else MeasureCache()
+        self._measurer = None  # built on first accurate render, then reused
+
+    def _accurate_measurer(self):
+        if self._measurer is None or self._measurer.cache is not self.measure_cache:
+            if self.style.text_measurer == "artist":
+                self._measurer = _make_measurer(self.style, self.measure_cache)
+            else:
+                self._measurer = _make_glyph_measurer(self.style, self.measure_cache)
+        return self._measurer
 
     # -- projection helpers --------------------------------------------------
 
@@ -142,11 +201,12 @@ class TimelineRenderer:
         return lo, hi
 
     def _layout(self, events: list[Event], window: tuple[datetime, datetime],
-                measurer) -> tuple[LayoutResult, AxisProjection]:
+                measurer) -> tuple[LayoutResult | ArrayLayoutResult, AxisProjection]:
         projection = AxisProjection(window[0], window[1], _axes_pixel_width(self.style))
         layout_events = layout_events_from(events)
-        result = compute_layout(layout_events, projection, self.font,
-                                self.layout_params, measurer=measurer)
+        engine = compute_layout_arrays if self.engine == "array" else compute_layout
+        result = engine(layout_events, projection, self.font,
+                        self.layout_params, measurer=measurer)
         return result, projection
 
     # -- drawing -------------------------------------------------------------
@@ -171,11 +231,13 @@ class TimelineRenderer:
         events = filters.by_time_window(events, win[0], win[1])
         if not events:
             raise ValueError("no events fall within the requested window")
-        measurer = _make_measurer(self.style) if accurate else None
+        measurer = self._accurate_measurer() if accurate else None
         result, projection = self._layout(events, win, measurer)
+        if accurate:
+            self.measure_cache.save()
 
         style = self.style
-        bar_area = style.bar_area_px if result.bars else 0.0
+        bar_area = style.bar_area_px if result.n_bar_lanes else 0.0
         axes_height_px = result.required_height_px + bar_area
         height_frac = 1.0 - style.bottom_frac - style.top_frac
         fig_height_in = max(2.5, axes_height_px / (height_frac * style.dpi))
@@ -194,47 +256,100 @@ class TimelineRenderer:
         ax.set_xlim(x_lo, x_hi)
         ax.set_ylim(-bar_area, result.required_height_px)
 
-        def px_to_x(px: float) -> float:
-            return x_lo + (px / projection.pixel_width) * (x_hi - x_lo)
-
         assignment = colour_mod.assign(events)
-        event_by_id = {str(i): e for i, e in enumerate(events)}
+        self._draw(ax, result, events, assignment, projection.pixel_width, (x_lo, x_hi))
+
+        self._style_axes(ax, win)
+        self._legend(ax, assignment)
+        return RenderedTimeline(figure=fig, axes=ax, layout=result, window=win)
 
-        def token_for(event: Event) -> ColourToken:
-            return assignment[(event.account_type, event.username)]
+    def _draw(self, ax, result: LayoutResult | ArrayLayoutResult, events: list[Event],
+              assignment, pixel_width: float, xlim: tuple[float, float]) -> None:
+        """Draw bars, markers, leaders and labels with as few artists as possible.
+
+        Bars and leader lines are one LineCollection each and point markers are
+        one PathCollection per marker shape, so only the labels (text + box)
+        remain per-event artists. Array layouts are read column-wise.
+        """
+        style = self.style
+        x_lo, x_hi = xlim
+        scale = (x_hi - x_lo) / pixel_width
+        colours = [colour_for(assignment[(e.account_type, e.username)]) for e in events]
+        markers = [assignment[(e.account_type, e.username)].marker_token for e in events]
+
+        if isinstance(result, ArrayLayoutResult):
+            bar_index = result.bar_ids.astype(int)
+            bar_start, bar_end = result.bar_start_x_px, result.bar_end_x_px
+            bar_y = -(result.bar_lane + 1) * style.lane_height_px
+            label_index = result.ids.astype(int)
+            box_left, box_bottom = result.box_left_px, result.box_bottom_px
+            texts = result.wrapped_text
+        else:
+            bars = result.bars
+            bar_index = np.array([int(b.id) for b in bars], dtype=int)
+            bar_start = np.array([b.start_x_px for b in bars])
+            bar_end = np.array([b.end_x_px for b in bars])
+            bar_y = -(np.array([b.lane for b in bars]) + 1) * style.lane_height_px
+            placed = result.placed
+            label_index = np.array([int(p.id) for p in placed], dtype=int)
+            box_left = np.array([p.box_left_px for p in placed])
+            box_bottom = np.array([p.box_bottom_px for p in placed])
+            texts = [p.wrapped_text for p in placed]
 
         # span bars (lane-packed below the baseline)
-        for bar in result.bars:
-            event = event_by_id[bar.id]
-            y = -(bar.lane + 1) * style.lane_height_px
-            ax.hlines(y, px_to_x(bar.start_x_px), px_to_x(bar.end_x_px),
-                      color=colour_for(token_for(event)), linewidth=4,
-                      capstyle="round", alpha=0.9)
-
-        # point markers at the baseline
-        for placed in result.placed:
-            event = event_by_id[placed.id]
-            token = token_for(event)
-            if not event.is_span:
-                ax.plot(mdates.date2num(event.datetime), 0, token.marker_token,
-                        color=colour_for(token), markersize=4, zorder=5)
+        if len(bar_index):
+            segments = np.stack([
+                np.column_stack([x_lo + bar_start * scale, bar_y]),
+                np.column_stack([x_lo + bar_end * scale, bar_y]),
+            ], axis=1)
+            ax.add_collection(LineCollection(
+                segments, colors=[colours[i] for i in bar_index.tolist()], linewidths=4,
+                capstyle="round", alpha=0.9), autolim=False)
+
+        # point markers at the baseline, one collection per marker shape
+        anchor_x = mdates.date2num([e.datetime for e in events])
+        by_marker: dict[str, list[int]] = {}
+        for index in label_index.tolist():
+            if not events[index].is_span:
+                by_marker.setdefault(markers[index], []).append(index)
+        for marker, members in by_marker.items():
+            ax.scatter(anchor_x[members], np.zeros(len(members)), marker=marker,
+                       c=[colours[i] for i in members], s=4 ** 2, linewidths=1.0,
+                       edgecolors="face", zorder=5)
 
         # leader lines + stacked labels
-        for placed in result.placed:
-            event = event_by_id[placed.id]
-            colour = colour_for(token_for(event))
-            anchor_x = mdates.date2num(event.datetime)
-            ax.plot([anchor_x, anchor_x], [0, placed.box_bottom_px],
-                    color=colour, linewidth=0.4, alpha=0.6, zorder=1)
-            ax.text(px_to_x(placed.box_left_px), placed.box_bottom_px,
-                    placed.wrapped_text, fontsize=style.font_size,
+        if len(label_index):
+            leader_x = anchor_x[label_index]
+            segments = np.stack([
+                np.column_stack([leader_x, np.zeros(len(label_index))]),
+                np.column_stack([leader_x, box_bottom]),
+            ], axis=1)
+            ax.add_collection(LineCollection(
+                segments, colors=[colours[i] for i in label_index.tolist()],
+                linewidths=0.4, alpha=0.6, zorder=1), autolim=False)
+        text_x = (x_lo + box_left * scale).tolist()
+        for index, x, y, text in zip(label_index.tolist(), text_x, box_bottom.tolist(), texts):
+            ax.text(x, y, text, fontsize=style.font_size,
                     ha="left", va="bottom", color="black", zorder=6,
                     bbox=dict(boxstyle="round,pad=0.2", facecolor="white",
-                              edgecolor=colour, linewidth=0.6, alpha=0.85))
+                              edgecolor=colours[index], linewidth=0.6, alpha=0.85))
 
-        self._style_axes(ax, win)
-        self._legend(ax, assignment)
-        return RenderedTimeline(figure=fig, axes=ax, layout=result, window=win)
+    def export_svg_direct(self, events: list[Event], path: str,
+                          window: tuple[datetime, datetime] | None = None) -> str:
+        """Write ``events`` straight to SVG with :mod:`timeline_creator.svg`.
+
+        No figure is built. Text is set at the layout font's pixel size, so the
+        estimator layout (not the matplotlib measurer) is the consistent one.
+        """
+        win = self._window(events, window)
+        events = filters.by_time_window(events, win[0], win[1])
+        if not events:
+            raise ValueError("no events fall within the requested window")
+        result, projection = self._layout(events, win, None)
+        _export_svg_direct(path, result, events, projection=projection, font=self.font,
+                           params=self.layout_params, bar_area_px=self.style.bar_area_px,
+                           lane_height_px=self.style.lane_height_px)
+        return path
 
     @staticmethod
     def window_from_xlim(ax) -> tuple[datetime, datetime]:
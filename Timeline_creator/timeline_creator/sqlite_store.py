@@ -0,0 +1,246 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite storage backend (stdlib ``sqlite3``) for a shared case server.
+
+Same contract as :mod:`timeline_creator.io` — :func:`save`, :func:`load`,
+:func:`list_investigations` — with a database file in place of a directory,
+so many analysts can work against one store. Every call opens its own
+connection; the database runs in WAL mode, so readers do not block the
+(single, transactional) writer. Only :func:`save` creates the schema; reads
+write nothing, and refuse a store whose ``user_version`` is not
+:data:`SCHEMA_VERSION`.
+
+One row per *event* (spans are not decomposed in the table), with start/end
+as integer epoch microseconds (end = start for point events) and indexes on
+start, end, endpoint and username per investigation. :func:`query` pushes the
+:func:`filters.apply` selection down to SQL and returns the same events; a
+time window becomes a two-sided range on the start index, widened by the
+investigation's longest span so spans reaching into the window are kept.
+
+The canonical JSONL stays the interchange format: :func:`import_jsonl` and
+:func:`export_jsonl` go through :func:`io.load` / :func:`io.save`, so span
+decomposition (and synthesised ``span-<index>`` ids) round-trip exactly.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from . import filters, io
+from .models import AccountType, Event, Investigation
+
+SCHEMA_VERSION = 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS investigations (
+    name           TEXT PRIMARY KEY,
+    endpoints      TEXT NOT NULL,   -- JSON list, catalogue order
+    users          TEXT NOT NULL,   -- JSON object, username -> account_type
+    schema_version INTEGER NOT NULL,
+    max_duration_us INTEGER NOT NULL  -- longest span, bounds window queries on start_us
+);
+CREATE TABLE IF NOT EXISTS events (
+    investigation TEXT NOT NULL REFERENCES investigations(name) ON DELETE CASCADE,
+    seq           INTEGER NOT NULL,  -- position in Investigation.events
+    start_us      INTEGER NOT NULL,
+    end_us        INTEGER NOT NULL,  -- = start_us for point events
+    is_span       INTEGER NOT NULL,
+    message       TEXT NOT NULL,
+    endpoint      TEXT NOT NULL,
+    username      TEXT NOT NULL,
+    account_type  TEXT NOT NULL,
+    span_id       TEXT,
+    PRIMARY KEY (investigation, seq)
+);
+CREATE INDEX IF NOT EXISTS events_start ON events (investigation, start_us);
+CREATE INDEX IF NOT EXISTS events_end ON events (investigation, end_us);
+CREATE INDEX IF NOT EXISTS events_endpoint ON events (investigation, endpoint);
+CREATE INDEX IF NOT EXISTS events_username ON events (investigation, username);
+"""
+
+_COLUMNS = "start_us, end_us, is_span, message, endpoint, username, account_type, span_id"
+
+
+def _epoch_us(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_epoch_us(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _stored_version(connection: sqlite3.Connection, database: str | Path) -> int:
+    """``user_version`` of ``database``: 0 for no store yet, else SCHEMA_VERSION."""
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version not in (0, SCHEMA_VERSION):
+        connection.close()
+        raise ValueError(f"{database} is a version {version} case store; "
+                         f"expected version {SCHEMA_VERSION}")
+    return version
+
+
+def _connect(database: str | Path) -> sqlite3.Connection:
+    """A writer's connection; creates the store (WAL, schema, version) if needed."""
+    connection = sqlite3.connect(database, timeout=30)
+    if _stored_version(connection, database) == 0:
+        connection.execute("PRAGMA journal_mode=WAL")  # persistent, set once
+        connection.executescript(_SCHEMA)
+        connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    connection.execute("PRAGMA foreign_keys=ON")
+    return connection
+
+
+def _open(database: str | Path, name: str | None = None) -> sqlite3.Connection | None:
+    """A reader's connection, which writes nothing.
+
+    With no store at ``database``: None, or FileNotFoundError when reading ``name``.
+    """
+    connection = None
+    if Path(database).exists():
+        connection = sqlite3.connect(database, timeout=30)
+        if _stored_version(connection, database) == 0:
+            connection.close()
+            connection = None
+    if connection is None and name is not None:
+        raise FileNotFoundError(f"No investigation '{name}' in {database}")
+    return connection
+
+
+def _row(investigation: str, seq: int, event: Event) -> tuple:
+    start_us = _epoch_us(event.datetime)
+    span_id = (event.span_id or f"span-{seq}") if event.is_span else None  # as io._as_loaded
+    return (investigation, seq, start_us, _epoch_us(event.end) if event.is_span else start_us,
+            int(event.is_span), event.message, event.endpoint, event.username,
+            event.account_type.value, span_id)
+
+
+def _event(row: tuple) -> Event:
+    start_us, end_us, is_span, message, endpoint, username, account_type, span_id = row
+    return Event(datetime=_from_epoch_us(start_us),
+                 end=_from_epoch_us(end_us) if is_span else None,
+                 message=message, endpoint=endpoint, username=username,
+                 account_type=AccountType(account_type), span_id=span_id)
+
+
+def save(investigation: Investigation, database: str | Path) -> Path:
+    """Replace ``investigation`` in ``database`` in one transaction. Returns the path.
+
+    Events are stored as :func:`io.load` would return them after an
+    :func:`io.save` (spans without an id get ``span-<index>``, point events
+    drop theirs), so a case reads back the same from either backend.
+    """
+    name = investigation.name
+    rows = [_row(name, seq, event) for seq, event in enumerate(investigation.events)]
+    max_duration_us = max((row[3] - row[2] for row in rows), default=0)
+    with closing(_connect(database)) as connection, connection:
+        connection.execute("DELETE FROM events WHERE investigation = ?", (name,))
+        connection.execute(
+            "INSERT OR REPLACE INTO investigations VALUES (?, ?, ?, ?, ?)",
+            (name, json.dumps(investigation.endpoints),
+             json.dumps({user: at.value for user, at in investigation.users.items()}),
+             investigation.schema_version, max_duration_us))
+        connection.executemany(
+            f"INSERT INTO events (investigation, seq, {_COLUMNS}) VALUES (?,?,?,?,?,?,?,?,?,?)",
+            rows)
+    return Path(database)
+
+
+def _catalogue(connection: sqlite3.Connection, name: str, database: str | Path) -> tuple:
+    row = connection.execute(
+        "SELECT endpoints, users, schema_version, max_duration_us FROM investigations "
+        "WHERE name = ?",
+        (name,)).fetchone()
+    if row is None:
+        raise FileNotFoundError(f"No investigation '{name}' in {database}")
+    return row
+
+
+def load(name: str, database: str | Path) -> io.LoadResult:
+    """Load an investigation by name (same result shape as :func:`io.load`)."""
+    with closing(_open(database, name)) as connection:
+        endpoints, users, schema_version, _ = _catalogue(connection, name, database)
+        rows = connection.execute(
+            f"SELECT {_COLUMNS} FROM events WHERE investigation = ? ORDER BY seq", (name,))
+        events = [_event(row) for row in rows]
+    investigation = Investigation(
+        name=name,
+        endpoints=json.loads(endpoints),
+        users={u: AccountType(a) for u, a in json.loads(users).items()},
+        events=events,
+        schema_version=schema_version,
+    )
+    # Backfill catalogues from events, as io.load does.
+    for event in events:
+        investigation.add_endpoint(event.endpoint)
+        investigation.add_user(event.username, event.account_type)
+    return io.LoadResult(investigation=investigation)
+
+
+def list_investigations(database: str | Path) -> list[str]:
+    """Return the sorted names of the investigations in ``database``."""
+    connection = _open(database)
+    if connection is None:
+        return []
+    with closing(connection):
+        return [name for (name,) in connection.execute(
+            "SELECT name FROM investigations ORDER BY name")]
+
+
+def query(name: str, database: str | Path, *, endpoints: Iterable[str] | None = None,
+          users: Iterable[str] | None = None, start: datetime | None = None,
+          end: datetime | None = None, clip: bool = True) -> list[Event]:
+    """:func:`filters.apply` over a stored investigation, evaluated in SQL.
+
+    Only matching rows are read (in saved order); spans crossing a bound are
+    clipped when ``clip`` is True, exactly as :func:`filters.by_time_window`.
+    """
+    clauses, params = ["investigation = ?"], [name]
+    if endpoints is not None:
+        clauses.append("endpoint IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(endpoints)))
+    if users is not None:
+        clauses.append("username IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(list(users)))
+    if end is not None:
+        clauses.append("start_us <= ?")
+        params.append(_epoch_us(end))
+    with closing(_open(database, name)) as connection:
+        max_duration_us = _catalogue(connection, name, database)[3]
+        if start is not None:
+            clauses.append("start_us >= ? AND end_us >= ?")
+            params += [_epoch_us(start) - max_duration_us, _epoch_us(start)]
+        rows = connection.execute(
+            f"SELECT {_COLUMNS} FROM events WHERE {' AND '.join(clauses)} ORDER BY seq",
+            params)
+        events = [_event(row) for row in rows]
+    return filters.by_time_window(events, start, end, clip=clip)
+
+
+def import_jsonl(name: str, directory: str | Path, database: str | Path) -> io.LoadResult:
+    """Copy ``<directory>/<name>.jsonl`` (either io layout) into ``database``."""
+    result = io.load(name, directory)
+    save(result.investigation, database)
+    return result
+
+
+def export_jsonl(name: str, database: str | Path, directory: str | Path = ".",
+                 **save_options) -> tuple[Path, Path]:
+    """Write a stored investigation back out with :func:`io.save`."""
+    return io.save(load(name, database).investigation, directory, **save_options)
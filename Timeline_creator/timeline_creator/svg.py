@@ -0,0 +1,261 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Direct SVG export — streams a laid-out timeline to disk without matplotlib.
+
+The layout already holds exact pixel geometry for every label box, bar and
+anchor, so a report export does not need a figure at all. This writer emits
+SVG elements straight from a :class:`~timeline_creator.layout.LayoutResult`
+(or its array twin) plus the colour assignment:
+
+  * one ``<symbol>`` per marker shape in ``<defs>``, placed with ``<use>``;
+  * one CSS class per colour token (``k-<family>-<shade>``) and shared classes
+    for labels, leaders and bars, instead of inline styles on every element;
+  * elements are written as they are produced, so memory stays bounded by the
+    layout itself rather than by the document (100k labels are fine).
+
+Layers follow the matplotlib render: leaders, bars, markers, then labels. The
+module is pure (no matplotlib), like the layout it consumes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import TextIO
+from xml.sax.saxutils import escape as _xml_escape
+
+from . import colour as colour_mod
+from .colour import ColourToken, hex_for
+from .layout import (AxisProjection, FontSpec, LayoutParams, LayoutResult, PlacedLabel,
+                     default_font)
+from .models import AccountType, Event
+
+# Marker tokens (matplotlib codes, see colour.MARKERS) -> shapes in a 10x10 box.
+_MARKER_SHAPES: dict[str, str] = {
+    "o": '<circle r="4"/>',
+    "s": '<rect x="-3.5" y="-3.5" width="7" height="7"/>',
+    "^": '<path d="M0,-4.5 L4.5,3.5 L-4.5,3.5 Z"/>',
+    "D": '<path d="M0,-4.5 L4,0 L0,4.5 L-4,0 Z"/>',
+    "v": '<path d="M0,4.5 L4.5,-3.5 L-4.5,-3.5 Z"/>',
+    "P": '<path d="M-1.5,-4.5 H1.5 V-1.5 H4.5 V1.5 H1.5 V4.5 H-1.5 V1.5 H-4.5 V-1.5 '
+         'H-1.5 Z"/>',
+    "X": '<path d="M-3,-4.5 L0,-1.5 L3,-4.5 L4.5,-3 L1.5,0 L4.5,3 L3,4.5 L0,1.5 '
+         'L-3,4.5 L-4.5,3 L-1.5,0 L-4.5,-3 Z"/>',
+    "*": '<path d="M0,-4.8 L1.1,-1.5 L4.6,-1.5 L1.8,0.6 L2.8,3.9 L0,1.9 L-2.8,3.9 '
+         'L-1.8,0.6 L-4.6,-1.5 L-1.1,-1.5 Z"/>',
+}
+_MARKER_SIZE_PX = 6.0
+_LEGEND_WIDTH_PX = 160.0
+_AXIS_LABEL_PX = 18.0
+
+# C0 controls XML 1.0 does not allow in character data (tab, LF and CR are
+# fine), plus the two non-characters; each becomes U+FFFD.
+_NOT_XML = dict.fromkeys([*(c for c in range(0x20) if c not in (0x9, 0xA, 0xD)),
+                          0xFFFE, 0xFFFF], "\ufffd")
+
+
+def escape(text: str) -> str:
+    """``text`` as SVG character data: markup escaped, non-XML characters replaced."""
+    return _xml_escape(text.translate(_NOT_XML))
+
+
+def _n(value: float) -> str:
+    """Compact coordinate formatting (2 dp, trailing zeros trimmed)."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
+
+
+def _token_class(token: ColourToken) -> str:
+    return f"k-{token.family}-{token.shade_index}"
+
+
+def _extent(layout) -> float:
+    right = 0.0
+    for placed in layout.iter_placed():
+        right = max(right, placed.box_right_px)
+    for bar in layout.iter_bars():
+        right = max(right, bar.end_x_px)
+    return right
+
+
+def export_svg_direct(path: str | Path, layout: LayoutResult, events: Sequence[Event], *,
+                      assignment: Mapping[tuple[AccountType, str], ColourToken] | None = None,
+                      projection: AxisProjection | None = None, font: FontSpec | None = None,
+                      params: LayoutParams | None = None, legend: bool = True,
+                      margin_px: float = 12.0, bar_area_px: float = 26.0,
+                      lane_height_px: float = 7.0,
+                      font_family: str = "DejaVu Sans, Arial, sans-serif") -> Path:
+    """Stream ``layout`` to an SVG file at ``path`` and return the path.
+
+    ``events`` are the events the layout was computed from (label ids index
+    into them, as produced by :func:`~timeline_creator.layout.layout_events_from`).
+    ``font``/``params`` must match the layout's so text sits inside its boxes.
+    With a ``projection`` the baseline gets dated ticks and the canvas takes
+    its pixel width; otherwise the width is the drawn extent.
+    """
+    font = font or default_font()
+    params = params or LayoutParams()
+    if assignment is None:
+        assignment = colour_mod.assign(events)
+    tokens = [assignment[(e.account_type, e.username)] for e in events]
+    class_of = {token: _token_class(token) for token in set(tokens)}
+    classes = [class_of[token] for token in tokens]
+
+    bar_area = bar_area_px if layout.n_bar_lanes else 0.0
+    plot_width = projection.pixel_width if projection is not None else _extent(layout)
+    x0 = margin_px + (_LEGEND_WIDTH_PX if legend else 0.0)
+    baseline = margin_px + layout.required_height_px
+    width = x0 + plot_width + margin_px
+    height = baseline + bar_area + _AXIS_LABEL_PX + margin_px
+    if legend:
+        height = max(height, margin_px + _legend_height(assignment, font) + margin_px)
+
+    def y(px_up: float) -> float:
+        return baseline - px_up
+
+    path = Path(path)
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as out:
+        out.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{_n(width)}" height="{_n(height)}" viewBox="0 0 {_n(width)} {_n(height)}">\n')
+        _write_defs(out, tokens, font, font_family)
+        out.write(f'<rect class="bg" width="{_n(width)}" height="{_n(height)}"/>\n')
+
+        out.write('<g class="leaders">\n')
+        for placed in layout.iter_placed():
+            x = _n(x0 + placed.anchor_x_px)
+            out.write(f'<line class="{classes[int(placed.id)]}" x1="{x}" '
+                      f'y1="{_n(baseline)}" x2="{x}" y2="{_n(y(placed.box_bottom_px))}"/>\n')
+        out.write('</g>\n<g class="bars">\n')
+        for bar in layout.iter_bars():
+            bar_y = _n(baseline + (bar.lane + 1) * lane_height_px)
+            out.write(f'<line class="{classes[int(bar.id)]}" '
+                      f'x1="{_n(x0 + bar.start_x_px)}" y1="{bar_y}" '
+                      f'x2="{_n(x0 + bar.end_x_px)}" y2="{bar_y}"/>\n')
+        out.write('</g>\n')
+
+        _write_axis(out, x0, plot_width, baseline + bar_area, projection)
+
+        half = _MARKER_SIZE_PX / 2
+        out.write('<g class="markers">\n')
+        for placed in layout.iter_placed():
+            index = int(placed.id)
+            if events[index].is_span:
+                continue
+            out.write(f'<use href="#m-{_marker_id(tokens[index].marker_token)}" '
+                      f'class="{classes[index]}" x="{_n(x0 + placed.anchor_x_px - half)}" '
+                      f'y="{_n(baseline - half)}" width="{_n(_MARKER_SIZE_PX)}" '
+                      f'height="{_n(_MARKER_SIZE_PX)}"/>\n')
+        out.write('</g>\n<g class="labels">\n')
+        for placed in layout.iter_placed():
+            _write_label(out, placed, classes[int(placed.id)], x0, y, font, params)
+        out.write('</g>\n')
+
+        if legend:
+            _write_legend(out, assignment, margin_px, font)
+        out.write('</svg>\n')
+    return path
+
+
+def _marker_id(marker_token: str) -> str:
+    return {"^": "tri-up", "v": "tri-down", "*": "star"}.get(marker_token, marker_token)
+
+
+def _write_defs(out: TextIO, tokens: Sequence[ColourToken], font: FontSpec,
+                font_family: str) -> None:
+    out.write("<defs>\n<style>\n"
+              ".bg{fill:#fff}\n"
+              ".leaders line{stroke-width:0.4;stroke-opacity:0.6}\n"
+              ".bars line{stroke-width:4;stroke-linecap:round;stroke-opacity:0.9}\n"
+              ".markers use,.legend use{fill:currentColor;stroke:none}\n"
+              ".labels rect{fill:#fff;fill-opacity:0.85;stroke-width:0.6}\n"
+              f"text{{fill:#000;stroke:none;font-size:{_n(font.size_px)}px;"
+              f"font-family:{font_family}}}\n"
+              ".axis line{stroke:#000;stroke-width:0.8}\n"
+              ".axis text,.legend text{font-size:"
+              f"{_n(max(1.0, font.size_px - 1))}px}}\n"
+              ".legend .hdr{font-weight:bold}\n")
+    for token_class, colour in sorted({_token_class(t): hex_for(t) for t in tokens}.items()):
+        out.write(f".{token_class}{{stroke:{colour};color:{colour}}}\n")
+    out.write("</style>\n")
+    for marker_token in sorted({t.marker_token for t in tokens} | {"o"}):
+        shape = _MARKER_SHAPES.get(marker_token, _MARKER_SHAPES["o"])
+        out.write(f'<symbol id="m-{_marker_id(marker_token)}" viewBox="-5 -5 10 10">'
+                  f'{shape}</symbol>\n')
+    out.write("</defs>\n")
+
+
+def _write_label(out: TextIO, placed: PlacedLabel, token_class: str, x0: float, y,
+                 font: FontSpec, params: LayoutParams) -> None:
+    top = y(placed.box_top_px)
+    left = x0 + placed.box_left_px
+    text_x = _n(left + params.box_h_pad_px)
+    lines = placed.wrapped_text.split("\n")
+    out.write(f'<g class="{token_class}"><rect x="{_n(left)}" y="{_n(top)}" '
+              f'width="{_n(placed.box_right_px - placed.box_left_px)}" '
+              f'height="{_n(placed.box_top_px - placed.box_bottom_px)}" rx="2"/>'
+              f'<text x="{text_x}" y="{_n(top + params.box_v_pad_px + font.size_px * 0.8)}">'
+              f'{escape(lines[0])}')
+    for line in lines[1:]:
+        out.write(f'<tspan x="{text_x}" dy="{_n(font.line_height_px)}">{escape(line)}</tspan>')
+    out.write("</text></g>\n")
+
+
+def _write_axis(out: TextIO, x0: float, plot_width: float, axis_y: float,
+                projection: AxisProjection | None, n_ticks: int = 8) -> None:
+    out.write(f'<g class="axis"><line x1="{_n(x0)}" y1="{_n(axis_y)}" '
+              f'x2="{_n(x0 + plot_width)}" y2="{_n(axis_y)}"/>\n')
+    if projection is not None and not projection.is_degenerate:
+        for i in range(n_ticks + 1):
+            px = plot_width * i / n_ticks
+            x = _n(x0 + px)
+            label = projection.to_dt(px).strftime("%Y-%m-%d %H:%M")
+            anchor = "start" if i == 0 else "end" if i == n_ticks else "middle"
+            out.write(f'<line x1="{x}" y1="{_n(axis_y)}" x2="{x}" y2="{_n(axis_y + 3)}"/>'
+                      f'<text x="{x}" y="{_n(axis_y + 13)}" text-anchor="{anchor}">'
+                      f'{label}</text>\n')
+    out.write("</g>\n")
+
+
+def _legend_row(font: FontSpec) -> float:
+    return max(font.line_height_px, _MARKER_SIZE_PX + 2)
+
+
+def _legend_height(assignment: Mapping[tuple[AccountType, str], ColourToken],
+                   font: FontSpec) -> float:
+    """Height the legend takes: one row per account-type header and per user."""
+    groups = colour_mod.legend_groups(dict(assignment))
+    rows = sum(1 + len(group.entries) for group in groups)
+    return rows * _legend_row(font)
+
+
+def _write_legend(out: TextIO, assignment: Mapping[tuple[AccountType, str], ColourToken],
+                  margin_px: float, font: FontSpec) -> None:
+    row = _legend_row(font)
+    y_pos = margin_px + row
+    out.write('<g class="legend">\n')
+    for group in colour_mod.legend_groups(dict(assignment)):
+        out.write(f'<text class="hdr" x="{_n(margin_px)}" y="{_n(y_pos)}">'
+                  f'{escape(group.account_type.value)}</text>\n')
+        y_pos += row
+        for entry in group.entries:
+            token = entry.token
+            out.write(f'<use href="#m-{_marker_id(token.marker_token)}" '
+                      f'class="{_token_class(token)}" '
+                      f'x="{_n(margin_px)}" y="{_n(y_pos - _MARKER_SIZE_PX)}" '
+                      f'width="{_n(_MARKER_SIZE_PX)}" height="{_n(_MARKER_SIZE_PX)}"/>'
+                      f'<text x="{_n(margin_px + _MARKER_SIZE_PX + 4)}" y="{_n(y_pos)}">'
+                      f'{escape(entry.username)}</text>\n')
+            y_pos += row
+    out.write("</g>\n")
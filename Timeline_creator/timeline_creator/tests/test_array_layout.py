@@ -0,0 +1,115 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The array engine must reproduce the pure reference engine's layout."""
+
+import importlib.util
+from datetime import timedelta
+
+import pytest
+
+from timeline_creator.layout import (
+    AxisProjection, LayoutEvent, LayoutParams, assert_no_overlaps, compute_layout,
+    default_font, estimate_text_width,
+)
+from .conftest import utc
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec("numpy") is None,
+                                reason="numpy not installed in this dev env")
+
+
+def _projection(start=None, end=None, width=1000.0):
+    return AxisProjection(start or utc(2025, 1, 1, 9, 0, 0),
+                          end or utc(2025, 1, 1, 17, 0, 0), width)
+
+
+def _ev(i, dt, label="event", end=None, placement="right"):
+    return LayoutEvent(id=str(i), anchor_dt=dt, label=label, end_dt=end, placement=placement)
+
+
+NOON = utc(2025, 1, 1, 12, 0, 0)
+
+CASES = {
+    "spread": ([_ev(i, utc(2025, 1, 1, 9 + i)) for i in range(8)], {}),
+    "identical": ([_ev(i, NOON, label=f"simultaneous event {i}") for i in range(10)], {}),
+    "burst": ([_ev(i, NOON + timedelta(milliseconds=i), label=f"burst {i}")
+               for i in range(15)], {}),
+    "mixed_heights": ([
+        _ev(0, NOON, label="short"),
+        _ev(1, NOON, label="this is a much longer label that will wrap onto "
+                           "several lines making a tall box " * 2),
+        _ev(2, NOON, label="medium length label here"),
+    ], {}),
+    "two_clusters": ([_ev(i, utc(2025, 1, 1, 9), label=f"L{i}") for i in range(3)]
+                     + [_ev(10 + i, utc(2025, 1, 1, 16), label=f"R{i}") for i in range(3)], {}),
+    "spans": ([
+        _ev(0, utc(2025, 1, 1, 10), label="span A", end=utc(2025, 1, 1, 14)),
+        _ev(1, utc(2025, 1, 1, 11), label="span B", end=utc(2025, 1, 1, 15)),
+        _ev(2, utc(2025, 1, 1, 12), label="point"),
+        _ev(3, utc(2025, 1, 1, 15), label="span C", end=utc(2025, 1, 1, 16)),
+    ], {}),
+    "over_cap": ([_ev(i, NOON, label=f"dense burst event number {i}") for i in range(40)],
+                 {"params": LayoutParams(max_fig_height_px=200.0)}),
+    "degenerate": ([_ev(i, NOON, label=f"e{i}") for i in range(4)],
+                   {"projection": _projection(start=NOON, end=NOON)}),
+    "long_label": ([_ev(0, NOON, label="x" * 4000)], {"projection": _projection(width=300.0)}),
+    "wide_glyphs": ([_ev(0, NOON, label="W" * 200)], {"projection": _projection(width=300.0)}),
+    "left_right": ([_ev(0, NOON, label="L", placement="left"),
+                    _ev(1, NOON, label="R", placement="right")], {}),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_array_engine_matches_reference(name):
+    from timeline_creator.array_layout import compute_layout_arrays
+    events, kwargs = CASES[name]
+    projection = kwargs.get("projection", _projection())
+    params = kwargs.get("params")
+    reference = compute_layout(events, projection, params=params)
+    result = compute_layout_arrays(events, projection, params=params)
+
+    assert [(p.id, p.level) for p in result.iter_placed()] == \
+           [(p.id, p.level) for p in reference.placed]
+    assert [(b.id, b.lane) for b in result.iter_bars()] == \
+           [(b.id, b.lane) for b in reference.bars]
+    assert result.n_levels == reference.n_levels
+    assert result.n_bar_lanes == reference.n_bar_lanes
+    assert result.required_height_px == pytest.approx(reference.required_height_px)
+    assert result.exceeds_cap == reference.exceeds_cap
+    assert len(result.split_suggestions) == len(reference.split_suggestions)
+    assert result.warnings == reference.warnings
+    assert [p.wrapped_text for p in result.iter_placed()] == \
+           [p.wrapped_text for p in reference.placed]
+    assert_no_overlaps(result.to_layout_result())
+
+
+def test_vectorised_widths_match_estimator():
+    from timeline_creator.array_layout import estimate_line_widths
+    font = default_font()
+    lines = ["", "abc", "Wide @ glyphs %", "ünïcödé → ✓", "x" * 50]
+    widths = estimate_line_widths(lines, font, 1.1)
+    assert widths.tolist() == pytest.approx(
+        [estimate_text_width(line, font, 1.1) for line in lines])
+
+
+def test_injected_measurer_is_used():
+    from timeline_creator.array_layout import compute_layout_arrays
+    events = [_ev(i, NOON, label="abc") for i in range(2)]
+    result = compute_layout_arrays(events, _projection(), measurer=lambda text, font: 500.0)
+    assert result.n_levels == 2
+    assert (result.box_right_px - result.box_left_px).tolist() == pytest.approx([508.0] * 2)
+
+
+def test_empty_input():
+    from timeline_creator.array_layout import compute_layout_arrays
+    result = compute_layout_arrays([], _projection())
+    assert result.n_levels == 0 and result.placed == [] and result.bars == []
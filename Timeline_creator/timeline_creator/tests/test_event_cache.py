@@ -0,0 +1,128 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar event cache: loads must match the JSONL exactly, or not be used."""
+
+import json
+
+import pytest
+
+from timeline_creator import event_cache, io
+from timeline_creator.models import AccountType, Investigation
+from .conftest import make_event, sample_investigation, utc
+
+
+def _case():
+    inv = sample_investigation()
+    inv.add_event(make_event(message="ünïcode ✓ — 日本", endpoint="HÖST",
+                             dt=utc(2025, 1, 2, 3, 4, 5)))
+    inv.add_event(make_event(message="no id span", username="svc",
+                             account_type=AccountType.SERVICE,
+                             dt=utc(2025, 1, 3), end=utc(2025, 1, 3, 1)))
+    return inv
+
+
+def test_cached_load_matches_jsonl_load(tmp_path):
+    inv = _case()
+    io.save(inv, tmp_path, cache=True)
+    assert event_cache.cache_path(inv.name, tmp_path).exists()
+    cached = io.load(inv.name, tmp_path)
+
+    event_cache.cache_path(inv.name, tmp_path).unlink()
+    parsed = io.load(inv.name, tmp_path)
+    assert cached.investigation.model_dump() == parsed.investigation.model_dump()
+    assert cached.investigation.events[-1].span_id == "span-4"
+    assert cached.warnings == parsed.warnings == []
+
+
+def test_stale_cache_is_ignored(tmp_path):
+    inv = _case()
+    io.save(inv, tmp_path, cache=True)
+    jsonl = tmp_path / f"{inv.name}.jsonl"
+    jsonl.write_text("\n".join(jsonl.read_text().splitlines()[:1]) + "\n")
+    assert len(io.load(inv.name, tmp_path).investigation.events) == 1
+
+
+def test_damaged_cache_falls_back_to_jsonl(tmp_path):
+    inv = _case()
+    io.save(inv, tmp_path, cache=True)
+    path = event_cache.cache_path(inv.name, tmp_path)
+    path.write_bytes(path.read_bytes()[:-10])
+    assert event_cache.read_cache(path, event_cache.file_sha256(
+        tmp_path / f"{inv.name}.jsonl")) is None
+    assert len(io.load(inv.name, tmp_path).investigation.events) == len(inv.events)
+
+
+def _damage(header, body, count):
+    """Damage modes that leave the preamble and the jsonl hash intact."""
+    codes = 16 * count  # endpoint codes follow the start and end columns
+    invalid_utf8 = body.rindex(b"\xe2")  # inside the "✓" of the last messages
+    return {
+        "unknown account type": ({**header, "account_types": ["Robot account"]}, body),
+        "code out of range": (header, body[:codes] + b"\xff" * 4 + body[codes + 4:]),
+        "bad utf-8": (header, body[:invalid_utf8] + b"\xff" + body[invalid_utf8 + 1:]),
+        "count too large": ({**header, "count": count + 1}, body),
+        "offsets past the blob": ({**header, "blob_lengths": [
+            header["blob_lengths"][0] - 4, header["blob_lengths"][1] + 4]}, body),
+        "count not a number": ({**header, "count": "many"}, body),
+    }
+
+
+@pytest.mark.parametrize("mode", ["unknown account type", "code out of range", "bad utf-8",
+                                  "count too large", "offsets past the blob",
+                                  "count not a number"])
+def test_corrupted_cache_falls_back_to_jsonl(tmp_path, mode):
+    inv = _case()
+    io.save(inv, tmp_path, cache=True)
+    path = event_cache.cache_path(inv.name, tmp_path)
+    data = path.read_bytes()
+    magic, version, header_length = event_cache._PREAMBLE.unpack_from(data)
+    offset = event_cache._PREAMBLE.size + header_length
+    header = json.loads(data[event_cache._PREAMBLE.size:offset])
+    header, body = _damage(header, data[offset:], len(inv.events))[mode]
+    encoded = json.dumps(header).encode("utf-8")
+    path.write_bytes(event_cache._PREAMBLE.pack(magic, version, len(encoded)) + encoded + body)
+
+    digest = event_cache.file_sha256(tmp_path / f"{inv.name}.jsonl")
+    assert event_cache.read_cache(path, digest) is None
+    loaded = io.load(inv.name, tmp_path).investigation
+    assert [e.message for e in loaded.events] == [e.message for e in inv.events]
+
+
+def test_cache_keeps_load_warnings(tmp_path):
+    events = [make_event(message="orphan", span_id="s1")]
+    jsonl = tmp_path / "c.jsonl"
+    jsonl.write_text("{}\n")
+    event_cache.write_cache(event_cache.cache_path("c", tmp_path), events,
+                            event_cache.file_sha256(jsonl), ["a warning"])
+    result = io.load("c", tmp_path)
+    assert [e.message for e in result.investigation.events] == ["orphan"]
+    assert "a warning" in result.warnings
+
+
+def test_journal_replays_on_top_of_cache(tmp_path):
+    journal = io.Journal(tmp_path, cache=True)
+    inv = Investigation(name="j")
+    inv.add_event(make_event(message="base"))
+    journal.save(inv)
+    inv.add_event(make_event(message="journalled"))
+    journal.save(inv)
+    assert (tmp_path / "j.journal").exists()
+    assert [e.message for e in io.load("j", tmp_path).investigation.events] == [
+        "base", "journalled"]
+
+
+def test_plain_save_drops_cache(tmp_path):
+    inv = _case()
+    io.save(inv, tmp_path, cache=True)
+    io.save(inv, tmp_path)
+    assert not event_cache.cache_path(inv.name, tmp_path).exists()
@@ -11,13 +11,16 @@
 # limitations under the License.
 
 import importlib.util
-from datetime import timezone
+import re
+from datetime import datetime, timezone
+from io import StringIO
 
 import pytest
 
-from timeline_creator import importers
-from timeline_creator.importers import ImportError_, parse_csv
-from timeline_creator.models import AccountType
+from timeline_creator import importers, io
+from timeline_creator.importers import ImportError_, parse_csv, stage_csv
+from timeline_creator.models import AccountType, Investigation
+from .conftest import make_event, utc
 
 HEADER = "datetime,message,endpoint,username,account_type"
 
@@ -47,6 +50,66 @@ def test_naive_rejected_when_assume_utc_false():
     assert "naive" in result.errors[0].message
 
 
+@pytest.mark.parametrize("cells,parsers", [
+    (["2025-01-01T09:00:00+02:00", "2025-01-01T10:00:00.5-05:00"], ["_iso_aware"]),
+    (["2025-01-01T09:00:00Z"], ["_iso_aware", "_iso_z"]),  # by Python version
+    (["2025-01-01 09:00:00", "2025-01-01T09:30"], ["_iso_naive_as_utc"]),
+    (["2025-01-02", "2025-01-03"], ["_iso_naive_as_utc"]),  # date only: midnight UTC
+    (["2025-01-02Z", "2025-01-03T09:00:00Z"], []),  # date-only Z: per cell, as _parse_dt
+    (["2025-01-01 9:00:00", "2025-01-02 10:00:00"], ["_COMPILED_FALLBACKS"]),
+    (["01/02/2025 09:00"], []),
+])
+def test_column_parser_matches_per_cell_parsing(cells, parsers):
+    chosen = importers._column_parser(cells, assume_utc=True)
+    if parsers == ["_COMPILED_FALLBACKS"]:
+        assert chosen in importers._COMPILED_FALLBACKS
+    elif not parsers:
+        assert chosen is None
+    else:
+        assert chosen in [getattr(importers, name) for name in parsers]
+    # a column's odd cells fall back to per-cell parsing: same values, same errors
+    for cell in cells + ["2025-01-01T09:00:00+01:00", "2025-01-01 9:05", "2025-01-04", "",
+                         "soon"]:
+        try:
+            expected = importers._parse_dt(cell, True)
+        except ValueError as exc:
+            with pytest.raises(ValueError, match=re.escape(str(exc))):
+                importers._parse_cell(cell, chosen, True)
+        else:
+            parsed = importers._parse_cell(f" {cell} ", chosen, True)
+            assert parsed == expected and parsed.tzinfo is not None
+
+
+EDGE_CELLS = [
+    "2025-01-01T09:00:00Z", "2025-01-01T09:00Z", "2025-01-01 09:00Z", "20250101T0900Z",
+    "2025-01-01Z", "2025-01-01", "2025-01-01+00:00", "2025-01-01T09:00:00ZZ",
+    "Z", "2025-01-01T09:00:00+02:00", "2025-01-01T09:00:00-00:00", "2025-01-01T24:00:00Z",
+    "2025-01-01 09:00:00", "2025-01-01 9:00:00", "2025-02-30 09:00:00", "2025-1-2 3:04:05",
+    "01/02/2025 09:00", "2025-01-01T09:00:00.123456+01:00", "", "  ", "soon",
+]
+
+
+@pytest.mark.parametrize("assume_utc", [True, False])
+def test_every_candidate_parser_agrees_with_parse_dt(assume_utc):
+    for parser in [None, *importers._candidate_parsers(assume_utc)]:
+        for cell in EDGE_CELLS:
+            try:
+                expected = importers._parse_dt(cell, assume_utc)
+            except ValueError as exc:
+                with pytest.raises(ValueError, match=re.escape(str(exc))):
+                    importers._parse_cell(cell, parser, assume_utc)
+            else:
+                parsed = importers._parse_cell(cell, parser, assume_utc)
+                assert (parsed, parsed.utcoffset()) == (expected, expected.utcoffset()), (
+                    parser, cell)
+
+
+def test_naive_column_still_rejected_when_assume_utc_false():
+    assert importers._column_parser(["2025-01-01 09:00:00"], assume_utc=False) is None
+    csv = HEADER + ",end\n" + "2025-01-01T09:00:00Z,a,H,u,User account,2025-01-01 10:00\n"
+    assert "naive" in parse_csv(csv, assume_utc=False).errors[0].message
+
+
 def test_all_or_nothing_one_bad_row_blocks_batch():
     csv = (HEADER + "\n"
            + "2025-01-01T09:00:00+00:00,good,HOST1,alice,User account\n"
@@ -122,3 +185,179 @@ def test_xlsx_round_trips_basic():
     result = importers.parse_xlsx(buf.getvalue())
     assert result.ok
     assert result.events[0].message == "login"
+
+
+def _big_csv(tmp_path, rows=25, bad=()):
+    lines = [HEADER + ",end,span_id", ""]
+    for i in range(rows):
+        hour = "xx" if i + 1 in bad else f"{i % 24:02d}"
+        end = f"2025-01-02T{i % 24:02d}:30:00Z" if i % 5 == 0 else ""
+        lines.append(f"2025-01-02T{hour}:00:00Z,event {i},HOST{i % 3},user{i % 4},"
+                     f"User account,{end},")
+        if i % 7 == 0:
+            lines.append(",,,,,,")  # blank rows do not count
+    path = tmp_path / "export.csv"
+    path.write_text("\ufeff" + "\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10_000])
+def test_stage_then_commit_matches_parse_csv(tmp_path, chunk_size):
+    path = _big_csv(tmp_path)
+    expected = parse_csv(path.read_text(encoding="utf-8-sig"))
+    with stage_csv(path, chunk_size=chunk_size, staging_dir=tmp_path) as staged:
+        assert staged.ok and staged.rows == staged.staged == 25
+        assert list(staged.events()) == expected.events
+        assert staged.discovered_endpoints == expected.discovered_endpoints
+        assert staged.discovered_users == expected.discovered_users
+        staged.commit("imported", tmp_path / "staged")
+        assert staged.path is None
+    io.save(Investigation(name="imported", events=expected.events), tmp_path / "pasted")
+    assert ((tmp_path / "staged" / "imported.jsonl").read_bytes()
+            == (tmp_path / "pasted" / "imported.jsonl").read_bytes())
+
+
+def test_staged_errors_block_commit_and_match_parse_csv(tmp_path):
+    path = _big_csv(tmp_path, bad=(3, 11, 12))
+    expected = parse_csv(path.read_text(encoding="utf-8-sig"))
+    staged = stage_csv(path, chunk_size=4, staging_dir=tmp_path, max_errors=2)
+    assert not staged.ok and staged.path is None and staged.staged == 0
+    assert staged.error_count == 3
+    assert staged.errors == expected.errors[:2]
+    assert list(tmp_path.glob("*.staged.jsonl")) == []
+    with pytest.raises(ImportError_):
+        staged.commit("imported", tmp_path)
+    assert io.list_investigations(tmp_path) == []
+
+
+def test_stage_reports_progress_per_chunk(tmp_path):
+    path = _big_csv(tmp_path)
+    calls = []
+    with stage_csv(path, chunk_size=10, staging_dir=tmp_path,
+                   progress=lambda *args: calls.append(args)):
+        pass
+    assert [rows for rows, _, _ in calls] == [10, 20, 25]
+    assert calls[-1][1] == calls[-1][2] == path.stat().st_size
+
+
+def test_commit_appends_to_an_existing_case(tmp_path):
+    inv = Investigation(name="case", endpoints=["DC1"], users={"alice": AccountType.PRIVILEGED})
+    inv.add_event(make_event(message="before", endpoint="DC1", dt=utc(2025, 1, 1),
+                             end=utc(2025, 1, 1, 1)))
+    io.save(inv, tmp_path, compress=True)
+    csv = HEADER + "\n2025-01-03T00:00:00Z,after,HOST9,bob,Service account\n"
+    with stage_csv(StringIO(csv, newline=""), staging_dir=tmp_path) as staged:
+        staged.commit("case", tmp_path)
+    loaded = io.load("case", tmp_path).investigation
+    assert [e.message for e in loaded.events] == ["before", "after"]
+    assert loaded.endpoints == ["DC1", "HOST9"]
+    assert loaded.users["bob"] == AccountType.SERVICE
+    assert (tmp_path / "case.jsonl.gz").exists() and not (tmp_path / "case.jsonl").exists()
+
+    io.save(inv, tmp_path / "p", partition="day")
+    with stage_csv(StringIO(csv, newline=""), staging_dir=tmp_path) as staged:
+        with pytest.raises(ValueError, match="partitioned"):
+            staged.commit("case", tmp_path / "p")
+
+
+def test_duplicates_are_skipped_or_reported_against_the_investigation():
+    inv = Investigation(name="case")
+    inv.add_event(make_event(message="seen", endpoint="HOST1", dt=utc(2025, 1, 1, 9)))
+    csv = HEADER + "\n" + "\n".join([
+        "2025-01-01T09:00:00Z,seen,HOST1,alice,User account",
+        "2025-01-01T10:00:00Z,new,HOST1,alice,User account",
+        "2025-01-01 10:00:00,new,HOST1,alice,User account",  # same event, other spelling
+    ]) + "\n"
+    assert parse_csv(csv, investigation=inv).duplicates == 0
+    skipped = parse_csv(csv, investigation=inv, duplicates="skip")
+    assert ([e.message for e in skipped.events], skipped.duplicates) == (["new"], 2)
+    reported = parse_csv(csv, investigation=inv, duplicates="report")
+    assert (len(reported.events), reported.duplicates) == (3, 2)
+    assert parse_csv(csv, duplicates="skip").duplicates == 1  # within the batch only
+    with pytest.raises(ValueError, match="duplicates"):
+        parse_csv(csv, duplicates="drop")
+
+
+def test_commit_skips_events_already_in_the_case(tmp_path):
+    path = _big_csv(tmp_path)
+    with stage_csv(path, staging_dir=tmp_path) as staged:
+        staged.commit("case", tmp_path)
+    with stage_csv(path, staging_dir=tmp_path) as staged:
+        staged.commit("case", tmp_path, duplicates="skip")
+        assert staged.duplicates == 25
+    assert len(io.load("case", tmp_path).investigation.events) == 25
+    with stage_csv(path, staging_dir=tmp_path) as staged:
+        staged.commit("case", tmp_path, duplicates="report")
+        assert staged.duplicates == 25
+    assert len(io.load("case", tmp_path).investigation.events) == 50
+
+
+def test_process_pool_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(importers, "CHUNK_ROWS", 3)
+    path = _big_csv(tmp_path, bad=(2, 9, 23))
+    text = path.read_text(encoding="utf-8-sig")
+    serial, parallel = parse_csv(text), parse_csv(text, workers=2)
+    assert serial.errors and parallel.errors == serial.errors
+    assert [e.row for e in parallel.errors] == [2, 9, 23]
+
+    clean = _big_csv(tmp_path).read_text(encoding="utf-8-sig")
+    assert parse_csv(clean, workers=2).events == parse_csv(clean).events
+    with stage_csv(path.parent / "export.csv", chunk_size=4, workers=2,
+                   staging_dir=tmp_path) as staged:
+        assert list(staged.events()) == parse_csv(clean).events
+
+
+needs_openpyxl = pytest.mark.skipif(importlib.util.find_spec("openpyxl") is None,
+                                    reason="openpyxl not installed in this dev env")
+
+
+def _workbook(tmp_path):
+    from openpyxl import Workbook
+    wb = Workbook()
+    hosts = wb.active
+    hosts.title = "hosts"
+    hosts.append(["datetime", "message", "endpoint", "username", "account_type", "end"])
+    hosts.append([datetime(2025, 1, 1, 9), "login", "HOST1", "alice", "User account", None])
+    hosts.append([None, None, None, None, None, None])
+    hosts.append(["2025-01-01 10:00", "session", "HOST1", "alice", "User account",
+                  "2025-01-01 11:00"])
+    network = wb.create_sheet("network")
+    network.append(["Host", "User", "Timestamp", "Description", "account_type"])
+    network.append(["FW1", "svc", "2025-01-01T12:00:00Z", "allow", "Service account"])
+    network.append(["FW1", "svc", "later", "deny", "Service account"])
+    wb.create_sheet("empty")
+    path = tmp_path / "case.xlsx"
+    wb.save(path)
+    return path
+
+
+@needs_openpyxl
+def test_xlsx_sheets_are_chosen_by_name_and_imported_in_one_pass(tmp_path):
+    path = _workbook(tmp_path)
+    assert importers.xlsx_sheet_names(path) == ["hosts", "network", "empty"]
+    assert [e.message for e in importers.parse_xlsx(path.read_bytes()).events] == [
+        "login", "session"]
+    result = importers.parse_xlsx(path, sheets=["hosts", "network"])
+    assert [(e.row, e.source) for e in result.errors] == [(2, "network")]
+    with pytest.raises(ImportError_, match="'nope'"):
+        importers.parse_xlsx(path, sheets="nope")
+    with pytest.raises(ImportError_, match="'empty'"):
+        importers.parse_xlsx(path, sheets=["hosts", "empty"])
+
+
+@needs_openpyxl
+def test_stage_xlsx_matches_parse_xlsx_with_progress(tmp_path):
+    from openpyxl import load_workbook
+    path = _workbook(tmp_path)
+    wb = load_workbook(path)
+    wb["network"].delete_rows(3)
+    wb.save(path)
+    calls = []
+    expected = importers.parse_xlsx(path, sheets=["hosts", "network"])
+    with importers.stage_xlsx(path, sheets=["hosts", "network"], chunk_size=1,
+                              staging_dir=tmp_path,
+                              progress=lambda *args: calls.append(args)) as staged:
+        assert list(staged.events()) == expected.events
+        assert staged.discovered_endpoints == ["HOST1", "FW1"]
+    assert [rows for rows, _, _ in calls] == [1, 2, 3]
+    assert calls[-1][1:] == (6, 6)  # worksheet rows read, blank ones included
@@ -0,0 +1,117 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Folder ingestion: discovery, per-file all-or-nothing, one ordered commit."""
+
+import importlib.util
+from datetime import datetime
+
+import pytest
+
+from timeline_creator import ingest, io
+from timeline_creator.importers import parse_csv
+
+HEADER = "Timestamp,Description,Hostname,User,account_type"  # aliases, as parse_csv takes
+
+
+def _export(folder, name, host, hours, bad=False):
+    rows = [f"2025-01-01 {hour:02d}:00:00,{host} {hour},{host},alice,User account"
+            for hour in hours]
+    if bad:
+        rows.append("yesterday,broken,HOST,alice,User account")
+    path = folder / name
+    path.write_text("\n".join([HEADER, *rows]) + "\n", encoding="utf-8")
+    return path
+
+
+def _triage(tmp_path):
+    folder = tmp_path / "triage"
+    folder.mkdir()
+    _export(folder, "b-host.csv", "B", [3, 1])
+    _export(folder, "a-host.CSV", "A", [2])
+    _export(folder, "c-host.csv", "C", [4], bad=True)
+    (folder / "notes.txt").write_text("not an export\n")
+    (folder / "~$a-host.xlsx").write_bytes(b"lock")
+    (folder / "other.csv").write_text("foo,bar\n1,2\n", encoding="utf-8")
+    return folder
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_ingest_folder_commits_good_files_in_name_order(tmp_path, workers):
+    folder = _triage(tmp_path)
+    seen = []
+    result = ingest.ingest_folder(folder, "case", tmp_path, workers=workers,
+                                  staging_dir=tmp_path,
+                                  progress=lambda path, staged: seen.append(path.name))
+    assert [path.name for path in result.files] == ["a-host.CSV", "b-host.csv",
+                                                    "c-host.csv", "other.csv"]
+    assert sorted(seen) == sorted(path.name for path in result.files)
+    assert [path.name for path in result.rejected] == ["c-host.csv", "other.csv"]
+    assert result.files[folder / "c-host.csv"].errors[0].row == 2
+    assert result.files[folder / "other.csv"].errors[0].row == 0  # not an export
+    loaded = io.load("case", tmp_path).investigation
+    assert [e.message for e in loaded.events] == ["A 2", "B 3", "B 1"]
+    assert loaded.endpoints == ["A", "B"] and result.events == 3
+    assert list(tmp_path.glob("*.staged.jsonl")) == []
+
+
+def test_ingest_matches_parse_csv_and_skips_reingested_duplicates(tmp_path):
+    folder = tmp_path / "triage"
+    folder.mkdir()
+    path = _export(folder, "host.csv", "A", [1, 2])
+    ingest.ingest_folder(folder, "case", tmp_path)
+    expected = parse_csv(path.read_text(encoding="utf-8")).events
+    assert io.load("case", tmp_path).investigation.events == expected
+    result = ingest.ingest_folder(folder, "case", tmp_path, duplicates="skip")
+    assert (result.events, result.files[path].duplicates) == (0, 2)
+    assert len(io.load("case", tmp_path).investigation.events) == 2
+
+
+def test_ingest_with_no_good_files_writes_nothing(tmp_path):
+    folder = tmp_path / "triage"
+    folder.mkdir()
+    _export(folder, "bad.csv", "A", [], bad=True)
+    result = ingest.ingest_folder(folder, "case", tmp_path)
+    assert not result.ok and result.written is None
+    assert io.list_investigations(tmp_path) == []
+    with pytest.raises(FileNotFoundError):
+        ingest.ingest_folder(tmp_path / "missing", "case", tmp_path)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_a_corrupt_workbook_is_reported_not_fatal(tmp_path, workers):
+    folder = tmp_path / "triage"
+    folder.mkdir()
+    _export(folder, "a.csv", "A", [1])
+    (folder / "bad.xlsx").write_bytes(b"not a zip archive" * 8)
+    (folder / "renamed.xlsx").write_text(HEADER + "\n", encoding="utf-8")
+    result = ingest.ingest_folder(folder, "case", tmp_path, workers=workers)
+    assert [path.name for path in result.rejected] == ["bad.xlsx", "renamed.xlsx"]
+    assert [result.files[path].errors[0].row for path in result.rejected] == [0, 0]
+    assert [e.message for e in io.load("case", tmp_path).investigation.events] == ["A 1"]
+
+
+@pytest.mark.skipif(importlib.util.find_spec("openpyxl") is None,
+                    reason="openpyxl not installed")
+def test_ingest_reads_workbooks_recursively(tmp_path):
+    from openpyxl import Workbook
+    folder = tmp_path / "triage"
+    (folder / "dc").mkdir(parents=True)
+    _export(folder, "a.csv", "A", [1])
+    workbook = Workbook()
+    workbook.active.append(HEADER.split(","))
+    workbook.active.append([datetime(2025, 1, 1, 9), "DC logon", "DC1", "bob", "User account"])
+    workbook.save(folder / "dc" / "dc1.xlsx")
+    assert ingest.discover(folder) == [folder / "a.csv"]
+    result = ingest.ingest_folder(folder, "case", tmp_path, recursive=True)
+    assert result.ok and result.events == 2
+    assert io.load("case", tmp_path).investigation.endpoints == ["A", "DC1"]
@@ -10,7 +10,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gzip
 import json
+from io import StringIO
+
+import pytest
 
 from timeline_creator import io
 from timeline_creator.models import AccountType, Event, Investigation
@@ -101,3 +105,475 @@ def test_event_order_preserved_with_mixed_points_and_spans(tmp_path):
     io.save(inv, tmp_path)
     result = io.load("c", tmp_path)
     assert [e.message for e in result.investigation.events] == ["first", "span", "third"]
+
+
+def _record(desc, dt, span_id=None, message="m"):
+    record = {"datetime": dt, "timestamp_desc": desc, "message": message, "endpoint": "H",
+              "username": "u", "account_type": "User account"}
+    if span_id:
+        record["span_id"] = span_id
+    return record
+
+
+def test_out_of_order_halves_pair_at_first_seen_position(tmp_path):
+    records = [
+        _record("End", "2025-01-01T03:00:00+00:00", "s1", "span"),
+        _record("Event", "2025-01-01T01:00:00+00:00", message="point"),
+        _record("Start", "2025-01-01T02:00:00+00:00", "s1", "span"),
+        _record("End", "2025-01-01T05:00:00+00:00", "s2", "orphan"),
+    ]
+    (tmp_path / "c.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records))
+    result = io.load("c", tmp_path)
+    events = result.investigation.events
+    assert [e.message for e in events] == ["span", "point", "orphan"]
+    assert events[0].is_span and events[0].end == utc(2025, 1, 1, 3)
+    assert events[2].is_span is False
+    assert result.warnings[0] == "span 's2' has an End but no Start; promoted to a point event."
+
+
+def test_iter_events_streams_the_same_events_as_load(tmp_path):
+    inv = sample_investigation()
+    io.save(inv, tmp_path)
+    stream = io.iter_events(inv.name, tmp_path)
+    assert next(stream) == inv.events[0]
+    assert [inv.events[0], *stream] == io.load(inv.name, tmp_path).investigation.events
+
+
+def test_iter_events_missing_file_raises_immediately(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        io.iter_events("nope", tmp_path)
+
+
+def test_max_pending_gives_up_on_far_apart_halves(tmp_path):
+    records = [_record("Start", "2025-01-01T01:00:00+00:00", "s1", "span")]
+    records += [_record("Event", f"2025-01-01T02:00:0{i}+00:00", message=f"p{i}")
+                for i in range(3)]
+    records.append(_record("End", "2025-01-01T03:00:00+00:00", "s1", "span"))
+    (tmp_path / "c.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    paired = list(io.iter_events("c", tmp_path, max_pending=5))
+    assert [e.is_span for e in paired] == [True, False, False, False]
+
+    warnings = []
+    bounded = list(io.iter_events("c", tmp_path, warnings=warnings, max_pending=2))
+    assert [e.message for e in bounded] == ["span", "p0", "p1", "p2", "span"]
+    assert not any(e.is_span for e in bounded)
+    assert len(warnings) == 2
+
+
+def _far_apart_span(tmp_path, between):
+    """A case whose one span has ``between`` point records between its halves."""
+    point = json.dumps(_record("Event", "2025-01-01T02:00:00+00:00", message="p"))
+    with (tmp_path / "c.jsonl").open("w") as handle:
+        handle.write(json.dumps(_record("Start", "2025-01-01T01:00:00+00:00", "s1", "span"))
+                     + "\n")
+        handle.writelines(point + "\n" for _ in range(between))
+        handle.write(json.dumps(_record("End", "2025-01-01T03:00:00+00:00", "s1", "span"))
+                     + "\n")
+
+
+def test_load_pairs_spans_however_far_apart(tmp_path):
+    _far_apart_span(tmp_path, 3)
+    assert not any(e.is_span for e in io.iter_events("c", tmp_path, max_pending=2))
+    result = io.load("c", tmp_path)
+    assert [e.is_span for e in result.investigation.events] == [True, False, False, False]
+    assert result.warnings == ["No metadata sidecar for 'c'; catalogues derived from events."]
+
+
+def test_every_reader_pairs_past_the_streaming_bound(tmp_path):
+    from timeline_creator import importers
+
+    _far_apart_span(tmp_path, io.DEFAULT_MAX_PENDING + 1)
+    assert not next(io.iter_events("c", tmp_path)).is_span  # the default bound gives up
+    window = io.load_window("c", tmp_path, utc(2025, 1, 1, 2, 30), utc(2025, 1, 1, 2, 40))
+    assert [e.message for e in window] == ["span"]
+    with importers.stage_csv(StringIO("datetime,message,endpoint,username,account_type\n"
+                                      "2025-01-02T00:00:00Z,new,H,u,User account\n"),
+                             staging_dir=tmp_path) as staged:
+        staged.commit("c", tmp_path)
+    warnings = []
+    first = next(io.iter_events("c", tmp_path, warnings=warnings, max_pending=None))
+    assert first.is_span and warnings == []
+
+
+def test_repeated_half_starts_a_new_span(tmp_path):
+    records = [
+        _record("Start", "2025-01-01T01:00:00+00:00", "s1", "first"),
+        _record("Start", "2025-01-01T02:00:00+00:00", "s1", "second"),
+        _record("End", "2025-01-01T03:00:00+00:00", "s1", "second"),
+    ]
+    (tmp_path / "c.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records))
+    warnings = []
+    events = list(io.iter_events("c", tmp_path, warnings=warnings))
+    assert [(e.message, e.is_span) for e in events] == [("first", False), ("second", True)]
+    assert len(warnings) == 1
+
+
+def _journalled_case(tmp_path, n=5):
+    inv = Investigation(name="j")
+    for i in range(n):
+        inv.add_event(make_event(message=f"e{i}", dt=utc(2025, 1, 1, i)))
+    journal = io.Journal(tmp_path)
+    journal.save(inv)  # first save is a full write
+    return inv, journal
+
+
+def test_journal_appends_only_the_change(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    canonical = (tmp_path / "j.jsonl").read_text()
+    inv.add_event(make_event(message="new", dt=utc(2025, 1, 2),
+                             end=utc(2025, 1, 3)))
+    written, _ = journal.save(inv)
+    assert written == tmp_path / "j.journal"
+    assert (tmp_path / "j.jsonl").read_text() == canonical
+    ops = [json.loads(line) for line in written.read_text().splitlines()]
+    assert [op["op"] for op in ops] == ["base", "add"]
+    assert ops[1]["at"] == 5 and len(ops[1]["events"][0]) == 2  # a span: two records
+    loaded = io.load("j", tmp_path).investigation.events
+    assert [e.message for e in loaded] == ["e0", "e1", "e2", "e3", "e4", "new"]
+    assert loaded[-1].is_span
+
+
+def test_journal_replays_deletes_and_inserts_in_order(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    del inv.events[1]
+    journal.save(inv)
+    inv.events.insert(2, make_event(message="mid"))
+    inv.events[0] = make_event(message="replaced")
+    journal.save(inv)
+    assert journal.save(inv)[0] == tmp_path / "j.journal"  # no change, nothing appended
+    expected = ["replaced", "e2", "mid", "e3", "e4"]
+    assert [e.message for e in io.load("j", tmp_path).investigation.events] == expected
+    assert [e.message for e in io.iter_events("j", tmp_path)] == expected
+
+
+def test_journal_compacts_into_the_canonical_file(tmp_path):
+    inv = Investigation(name="j")
+    journal = io.Journal(tmp_path, compact_ratio=0.5, compact_min_bytes=0)
+    inv.add_event(make_event(message="e0"))
+    journal.save(inv)
+    inv.add_event(make_event(message="e1"))
+    written, _ = journal.save(inv)  # journal >= half the canonical file: compact
+    assert written == tmp_path / "j.jsonl"
+    assert not (tmp_path / "j.journal").exists()
+    assert len((tmp_path / "j.jsonl").read_text().splitlines()) == 2
+
+
+def test_full_save_supersedes_journal(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    inv.add_event(make_event(message="new"))
+    journal.save(inv)
+    io.save(inv, tmp_path)
+    assert not (tmp_path / "j.journal").exists()
+    assert len(io.load("j", tmp_path).investigation.events) == 6
+
+
+def test_damaged_journal_tail_is_ignored_with_warning(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    inv.add_event(make_event(message="kept"))
+    journal.save(inv)
+    with (tmp_path / "j.journal").open("a") as handle:
+        handle.write('{"op": "add", "at": 0, "ev')  # interrupted write
+    result = io.load("j", tmp_path)
+    assert result.investigation.events[-1].message == "kept"
+    assert any("damaged at line 3" in w for w in result.warnings)
+
+
+def test_journal_for_a_replaced_events_file_is_ignored(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    inv.add_event(make_event(message="new"))
+    journal.save(inv)
+    lines = (tmp_path / "j.jsonl").read_text().splitlines()
+    (tmp_path / "j.jsonl").write_text("\n".join(lines[:3]) + "\n")
+    result = io.load("j", tmp_path)
+    assert len(result.investigation.events) == 3
+    assert any("does not match" in w for w in result.warnings)
+
+
+def test_save_after_a_damaged_journal_compacts(tmp_path):
+    inv, journal = _journalled_case(tmp_path, n=3)
+    inv.add_event(make_event(message="kept"))
+    journal.save(inv)
+    with (tmp_path / "j.journal").open("a") as handle:
+        handle.write('{"op": "add", "at": 0, "ev')  # interrupted write
+    reopened = io.Journal(tmp_path)
+    inv = reopened.load("j").investigation
+    inv.add_event(make_event(message="after-crash"))
+    assert reopened.save(inv)[0] == tmp_path / "j.jsonl"
+    result = io.load("j", tmp_path)
+    assert [e.message for e in result.investigation.events] == ["e0", "e1", "e2", "kept",
+                                                               "after-crash"]
+    assert result.warnings == [] and not (tmp_path / "j.journal").exists()
+
+
+def test_save_after_a_mismatched_journal_compacts(tmp_path):
+    inv, journal = _journalled_case(tmp_path, n=3)
+    inv.add_event(make_event(message="lost"))
+    journal.save(inv)
+    lines = (tmp_path / "j.jsonl").read_text().splitlines()
+    (tmp_path / "j.jsonl").write_text("\n".join(lines[:2]) + "\n")
+    reopened = io.Journal(tmp_path)
+    inv = reopened.load("j").investigation
+    inv.add_event(make_event(message="new"))
+    reopened.save(inv)
+    assert [e.message for e in io.load("j", tmp_path).investigation.events] == ["e0", "e1",
+                                                                               "new"]
+
+    inv.add_event(make_event(message="other writer"))  # journal changed behind our back
+    io.Journal(tmp_path).save(inv)
+    inv.add_event(make_event(message="mine"))
+    (tmp_path / "j.journal").write_text('{"op": "base", "events": 99}\n')
+    assert reopened.save(inv)[0] == tmp_path / "j.jsonl"
+    assert io.load("j", tmp_path).investigation.events[-1].message == "mine"
+
+
+def test_save_after_another_writer_rewrote_the_events_file_compacts(tmp_path):
+    inv, journal = _journalled_case(tmp_path, n=3)
+    # another writer replaces the case with the same number of events
+    io.save_events("j", [make_event(message=f"theirs{i}") for i in range(3)], tmp_path)
+    inv.add_event(make_event(message="mine"))
+    assert journal.save(inv)[0] == tmp_path / "j.jsonl"  # not appended at a stale base
+    result = io.load("j", tmp_path)
+    assert [e.message for e in result.investigation.events] == ["e0", "e1", "e2", "mine"]
+    assert result.warnings == []
+
+
+def test_journal_is_not_replayed_onto_an_edited_events_file(tmp_path):
+    inv, journal = _journalled_case(tmp_path, n=3)
+    inv.add_event(make_event(message="new"))
+    journal.save(inv)
+    jsonl = tmp_path / "j.jsonl"
+    jsonl.write_text(jsonl.read_text().replace('"e0"', '"edited"'))  # same event count
+    result = io.load("j", tmp_path)
+    assert [e.message for e in result.investigation.events] == ["edited", "e1", "e2"]
+    assert any("does not match" in w for w in result.warnings)
+
+
+def test_journal_writes_only_changed_runs(tmp_path):
+    inv, journal = _journalled_case(tmp_path, n=8)
+    inv.events.pop(1)  # an edit: delete + re-add at the end
+    inv.events.pop(4)
+    inv.add_event(make_event(message="edited"))
+    journal.save(inv)
+    ops = [json.loads(line) for line in (tmp_path / "j.journal").read_text().splitlines()]
+    assert ops[1:] == [
+        {"op": "delete", "at": 5, "count": 1},
+        {"op": "delete", "at": 1, "count": 1},
+        {"op": "add", "at": 6, "events": [ops[3]["events"][0]]},
+    ]
+    assert len(ops[3]["events"]) == 1
+    expected = ["e0", "e2", "e3", "e4", "e6", "e7", "edited"]
+    assert [e.message for e in io.load("j", tmp_path).investigation.events] == expected
+
+
+def test_journal_handles_reordered_events(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    inv.events.reverse()
+    journal.save(inv)
+    expected = ["e4", "e3", "e2", "e1", "e0"]
+    assert [e.message for e in io.load("j", tmp_path).investigation.events] == expected
+
+
+def test_trusted_load_matches_validated_load(tmp_path):
+    inv = sample_investigation()
+    inv.add_event(make_event(message="orphan-free span", end=utc(2025, 1, 1, 13)))
+    io.save(inv, tmp_path)
+    meta = json.loads((tmp_path / f"{inv.name}.meta.json").read_text())
+    assert len(meta["jsonl_sha256"]) == 64
+    trusted = io.load(inv.name, tmp_path, trusted=True)
+    validated = io.load(inv.name, tmp_path)
+    assert trusted.warnings == validated.warnings == []
+    assert trusted.investigation.model_dump() == validated.investigation.model_dump()
+
+
+def test_trusted_load_validates_a_modified_file(tmp_path):
+    inv = sample_investigation()
+    io.save(inv, tmp_path)
+    jsonl = tmp_path / f"{inv.name}.jsonl"
+    jsonl.write_text(jsonl.read_text().replace('"login"', '"logon"'))
+    result = io.load(inv.name, tmp_path, trusted=True)
+    assert result.investigation.events[0].message == "logon"
+    assert any("changed since it was saved" in w for w in result.warnings)
+
+    jsonl.write_text(jsonl.read_text().replace("+00:00", "", 1))  # now invalid (naive)
+    with pytest.raises(ValueError, match="timezone-aware"):
+        io.load(inv.name, tmp_path, trusted=True)
+
+
+def test_journal_save_keeps_the_integrity_hash(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    digest = json.loads((tmp_path / "j.meta.json").read_text())["jsonl_sha256"]
+    inv.add_event(make_event(message="new"))
+    journal.save(inv)
+    assert json.loads((tmp_path / "j.meta.json").read_text())["jsonl_sha256"] == digest
+    result = io.load("j", tmp_path, trusted=True)
+    assert result.warnings == []
+    assert result.investigation.events[-1].message == "new"
+
+
+def _multi_day_case():
+    inv = Investigation(name="long")
+    inv.add_event(make_event(message="recon", dt=utc(2025, 1, 3, 8)))
+    inv.add_event(make_event(message="c2 beacon", dt=utc(2025, 1, 1, 22),
+                             end=utc(2025, 1, 4, 2)))
+    inv.add_event(make_event(message="login", dt=utc(2025, 1, 1, 9)))
+    inv.add_event(make_event(message="overnight", dt=utc(2025, 1, 2, 23),
+                             end=utc(2025, 1, 3, 1), span_id="s1"))
+    inv.add_event(make_event(message="exfil", dt=utc(2025, 1, 5, 4)))
+    return inv
+
+
+def test_partitioned_round_trip_across_shard_boundaries(tmp_path):
+    inv = _multi_day_case()
+    folder, meta_path = io.save(inv, tmp_path, partition="day")
+    assert sorted(p.name for p in folder.iterdir()) == [
+        "2025-01-01.jsonl", "2025-01-02.jsonl", "2025-01-03.jsonl", "2025-01-04.jsonl",
+        "2025-01-05.jsonl"]
+    meta = json.loads(meta_path.read_text())
+    assert meta["partition"] == "day"
+    assert meta["shards"][0]["reach"] == utc(2025, 1, 4, 2).isoformat()
+    result = io.load("long", tmp_path)
+    assert result.warnings == []
+    assert result.investigation.events == io._as_loaded(inv.events)
+    assert [e.message for e in io.iter_events("long", tmp_path)] == [
+        e.message for e in inv.events]
+
+
+@pytest.mark.parametrize("start,end", [
+    (utc(2025, 1, 3, 12), utc(2025, 1, 3, 13)),
+    (utc(2025, 1, 5), None),
+    (None, utc(2025, 1, 1, 23)),
+    (utc(2025, 1, 2, 12), utc(2025, 1, 3, 0, 30)),
+])
+def test_load_window_matches_for_both_layouts(tmp_path, start, end):
+    inv = _multi_day_case()
+    io.save(inv, tmp_path / "flat")
+    io.save(inv, tmp_path / "parts", partition="day")
+    flat = io.load_window("long", tmp_path / "flat", start, end)
+    warnings = []
+    parted = io.load_window("long", tmp_path / "parts", start, end, warnings=warnings)
+    assert parted == flat
+    assert warnings == []
+
+
+def test_load_window_opens_only_the_shards_it_needs(tmp_path):
+    io.save(_multi_day_case(), tmp_path, partition="day")
+    (tmp_path / "long" / "2025-01-05.jsonl").write_text("not json\n")
+    events = io.load_window("long", tmp_path, utc(2025, 1, 3, 12), utc(2025, 1, 3, 13))
+    assert [e.message for e in events] == ["c2 beacon"]
+    assert events[0].datetime == utc(2025, 1, 3, 12)  # clipped to the window
+
+
+def test_list_investigations_sees_both_layouts_and_saves_switch_layout(tmp_path):
+    io.save(sample_investigation(), tmp_path)
+    io.save(_multi_day_case(), tmp_path, partition="month")
+    assert io.list_investigations(tmp_path) == ["case-1", "long"]
+
+    io.save(_multi_day_case(), tmp_path)
+    assert not (tmp_path / "long").exists()
+    io.save(sample_investigation(), tmp_path, partition="hour")
+    assert not (tmp_path / "case-1.jsonl").exists()
+    assert io.list_investigations(tmp_path) == ["case-1", "long"]
+    with pytest.raises(ValueError):
+        io.save(sample_investigation(), tmp_path, partition="fortnight")
+
+
+def test_journal_keeps_a_partitioned_layout(tmp_path):
+    io.save(_multi_day_case(), tmp_path, partition="day")
+    journal = io.Journal(tmp_path)
+    inv = journal.load("long").investigation
+    inv.add_event(make_event(message="later", dt=utc(2025, 1, 6)))
+    journal.save(inv)
+    assert (tmp_path / "long" / "2025-01-06.jsonl").exists()
+    assert not (tmp_path / "long.journal").exists()
+    assert io.load("long", tmp_path).investigation.events[-1].message == "later"
+
+
+def test_compressed_save_round_trips_and_replaces_plain(tmp_path):
+    inv = sample_investigation()
+    io.save(inv, tmp_path)
+    jsonl, _ = io.save(inv, tmp_path, compress=True)
+    assert jsonl.name == "case-1.jsonl.gz"
+    assert not (tmp_path / "case-1.jsonl").exists()
+    assert io.list_investigations(tmp_path) == ["case-1"]
+    result = io.load("case-1", tmp_path, trusted=True)
+    assert result.warnings == []
+    assert result.investigation.model_dump() == inv.model_dump()
+
+    first = jsonl.read_bytes()
+    io.save(inv, tmp_path, compress=True)
+    assert jsonl.read_bytes() == first  # deterministic, so the recorded hash is stable
+    io.save(inv, tmp_path)
+    assert not jsonl.exists()
+
+
+def test_compressed_file_holds_the_plain_records(tmp_path):
+    inv = _multi_day_case()
+    io.save(inv, tmp_path / "plain")
+    io.save(inv, tmp_path / "gz", compress=True)
+    assert (gzip.decompress((tmp_path / "gz" / "long.jsonl.gz").read_bytes())
+            == (tmp_path / "plain" / "long.jsonl").read_bytes())
+
+
+def test_compressed_partitions_and_journal(tmp_path):
+    inv = _multi_day_case()
+    folder, _ = io.save(inv, tmp_path, partition="day", compress=True)
+    assert all(p.name.endswith(".jsonl.gz") for p in folder.iterdir())
+    window = (utc(2025, 1, 3, 12), utc(2025, 1, 3, 13))
+    assert [e.message for e in io.load_window("long", tmp_path, *window)] == ["c2 beacon"]
+
+    io.save(inv, tmp_path / "j", compress=True)
+    journal = io.Journal(tmp_path / "j", compact_min_bytes=0, compact_ratio=0)
+    loaded = journal.load("long").investigation
+    loaded.add_event(make_event(message="later", dt=utc(2025, 1, 6)))
+    journal.save(loaded)  # compacts at once; stays compressed
+    assert io.list_investigations(tmp_path / "j") == ["long"]
+    assert (tmp_path / "j" / "long.jsonl.gz").exists()
+    assert io.load("long", tmp_path / "j").investigation.events[-1].message == "later"
+
+
+def test_catalogue_summarises_without_loading(tmp_path, monkeypatch):
+    io.save(sample_investigation(), tmp_path)
+    io.save(_multi_day_case(), tmp_path, partition="day", compress=True)
+    io.save(Investigation(name="empty"), tmp_path)
+
+    def no_load(*args, **kwargs):
+        raise AssertionError("catalogue loaded a case")
+
+    monkeypatch.setattr(io, "load", no_load)
+    cases = {case.name: case for case in io.catalogue(tmp_path)}
+    assert sorted(cases) == ["case-1", "empty", "long"]
+    long = cases["long"]
+    assert (long.events, long.spans) == (5, 2)
+    assert (long.first, long.last) == (utc(2025, 1, 1, 9), utc(2025, 1, 5, 4))
+    assert long.endpoints == ["HOST1"]
+    assert long.users == {"alice": AccountType.USER}
+    assert cases["empty"].first is None and cases["empty"].events == 0
+
+
+def test_catalogue_rebuilds_stale_and_unreadable_entries(tmp_path):
+    inv = sample_investigation()
+    io.save(inv, tmp_path)
+    jsonl = tmp_path / "case-1.jsonl"
+    jsonl.write_text(jsonl.read_text().splitlines()[0] + "\n")  # edited outside the tool
+    assert io.catalogue(tmp_path)[0].events == 1
+
+    jsonl.write_text("{broken\n")
+    case = io.catalogue(tmp_path)[0]
+    assert case.error and case.events == 0
+
+    (tmp_path / io.CATALOGUE_NAME).write_text("not json")
+    io.save(inv, tmp_path)
+    assert [c.events for c in io.catalogue(tmp_path, rebuild=True)] == [3]
+
+
+def test_journal_save_patches_the_catalogue(tmp_path):
+    inv, journal = _journalled_case(tmp_path)
+    inv.add_event(make_event(message="much later", dt=utc(2026, 1, 1), end=utc(2026, 1, 2),
+                             endpoint="NEWHOST"))
+    del inv.events[2]
+    journal.save(inv)
+    assert (tmp_path / f"{inv.name}.journal").exists()
+    patched = io.catalogue(tmp_path)
+    assert patched == io.catalogue(tmp_path, rebuild=True)
+    assert patched[0].last == utc(2026, 1, 2) and "NEWHOST" in patched[0].endpoints
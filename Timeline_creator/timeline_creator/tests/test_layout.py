@@ -193,3 +193,56 @@ def test_injected_measurer_is_used():
     assert overlapping_x(wide.placed[0], wide.placed[1]) is True
     assert wide.n_levels == 2
     assert_no_overlaps(wide)
+
+
+# --- level packer -------------------------------------------------------------
+
+def _linear_scan_levels(intervals, gap):
+    """The original O(n·L) lowest-level-first scan, kept as a reference."""
+    edges, levels = [], []
+    for left, right in intervals:
+        level = next((i for i, edge in enumerate(edges) if left >= edge), len(edges))
+        if level == len(edges):
+            edges.append(0.0)
+        edges[level] = right + gap
+        levels.append(level)
+    return levels
+
+
+def test_level_packer_matches_linear_scan():
+    import random
+    rng = random.Random(7)
+    lefts = sorted(rng.uniform(0, 2000) for _ in range(3000))
+    intervals = [(left, left + rng.uniform(5, 300)) for left in lefts]
+    packer = layout._LevelPacker(4.0)
+    levels = [packer.place(left, right) for left, right in intervals]
+    assert levels == _linear_scan_levels(intervals, 4.0)
+    assert packer.n_levels == max(levels) + 1
+
+
+def test_dense_burst_levels_match_linear_scan():
+    base = utc(2025, 1, 1, 12, 0, 0)
+    events = [_ev(i, base + timedelta(seconds=i % 97), label=f"edr alert {i}")
+              for i in range(2000)]
+    result = compute_layout(events, _projection())
+    # compute_layout's own order: left edge, then anchor time, then id
+    by_left = sorted(result.placed,
+                     key=lambda p: (round(p.box_left_px, 6), p.anchor_x_px, p.id))
+    reference = _linear_scan_levels(
+        [(p.box_left_px, p.box_right_px) for p in by_left], LayoutParams().box_h_pad_px)
+    assert [p.level for p in by_left] == reference
+    assert result.n_levels == max(reference) + 1
+
+
+def test_split_windows_each_fit_under_the_cap():
+    base = utc(2025, 1, 1, 9, 0, 0)
+    events = [_ev(i, base + timedelta(minutes=(i * 7) % 480), label=f"alert {i}")
+              for i in range(300)]
+    boxes = sorted((layout._build_box(e, _projection(), default_font(), LayoutParams(), None)[0]
+                    for e in events), key=lambda b: (round(b.left, 6), b.anchor_iso, b.id))
+    splits = layout._suggest_splits([(b.left, b.right) for b in boxes],
+                                    _projection(), LayoutParams(), 5)
+    assert len(splits) > 1
+    assert all(1 <= s.peak_levels <= 5 for s in splits)
+    starts = [s.window_start_dt for s in splits]
+    assert starts == sorted(starts)
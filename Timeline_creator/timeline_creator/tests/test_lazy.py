@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy view: the same events as io.load, parsed only where asked for."""
+
+import json
+
+import pytest
+
+from timeline_creator import filters, io
+from timeline_creator.lazy import LazyInvestigation, index_path
+from timeline_creator.models import Investigation
+from .conftest import make_event, sample_investigation, utc
+
+
+def _week():
+    inv = Investigation(name="week")
+    for day in range(1, 8):
+        inv.add_event(make_event(message=f"login {day}", dt=utc(2025, 1, day, 9)))
+        inv.add_event(make_event(message=f"session {day}", dt=utc(2025, 1, day, 10),
+                                 end=utc(2025, 1, day, 11)))
+    inv.add_event(make_event(message="long", dt=utc(2025, 1, 1), end=utc(2025, 1, 5)))
+    return inv
+
+
+def test_matches_eager_load(tmp_path):
+    inv = _week()
+    io.save(inv, tmp_path)
+    eager = io.load(inv.name, tmp_path).investigation.events
+    with LazyInvestigation.open(inv.name, tmp_path) as lazy:
+        assert len(lazy) == len(eager)
+        assert list(lazy) == eager
+        assert lazy[-1] == eager[-1]
+        with pytest.raises(IndexError):
+            lazy[len(eager)]
+
+
+@pytest.mark.parametrize("start,end", [
+    (utc(2025, 1, 3), utc(2025, 1, 3, 23)),
+    (utc(2025, 1, 4, 10, 30), utc(2025, 1, 4, 10, 45)),
+    (utc(2025, 1, 6), None),
+    (None, utc(2025, 1, 1, 9, 30)),
+    (None, None),
+])
+def test_window_matches_by_time_window(tmp_path, start, end):
+    inv = _week()
+    io.save(inv, tmp_path)
+    eager = io.load(inv.name, tmp_path).investigation.events
+    with LazyInvestigation.open(inv.name, tmp_path) as lazy:
+        assert lazy.window(start, end) == filters.by_time_window(eager, start, end)
+
+
+def test_long_span_found_from_inside(tmp_path):
+    io.save(_week(), tmp_path)
+    with LazyInvestigation.open("week", tmp_path) as lazy:
+        messages = [e.message for e in lazy.window(utc(2025, 1, 4, 12), utc(2025, 1, 4, 13))]
+    assert messages == ["long"]
+
+
+def test_index_is_reused_then_rebuilt_on_change(tmp_path):
+    inv = sample_investigation()
+    io.save(inv, tmp_path)
+    LazyInvestigation.open(inv.name, tmp_path).close()
+    built = index_path(inv.name, tmp_path).stat().st_mtime_ns
+    LazyInvestigation.open(inv.name, tmp_path).close()
+    assert index_path(inv.name, tmp_path).stat().st_mtime_ns == built
+
+    inv.add_event(make_event(message="later", dt=utc(2025, 2, 1)))
+    io.save(inv, tmp_path)
+    with LazyInvestigation.open(inv.name, tmp_path) as lazy:
+        assert lazy[len(lazy) - 1].message == "later"
+
+
+def test_orphans_keep_load_warnings(tmp_path):
+    record = {"message": "half", "datetime": utc(2025, 1, 1).isoformat(),
+              "timestamp_desc": "End", "endpoint": "H", "username": "u",
+              "account_type": "user", "span_id": "s9"}
+    start = {**record, "timestamp_desc": "Start", "span_id": "s8"}
+    (tmp_path / "o.jsonl").write_text(json.dumps(start) + "\n" + json.dumps(record) + "\n")
+    eager = io.load("o", tmp_path)
+    with LazyInvestigation.open("o", tmp_path) as lazy:
+        assert list(lazy) == eager.investigation.events
+        assert lazy.warnings == eager.warnings[:2]
+
+
+def test_empty_and_journalled_cases(tmp_path):
+    io.save(Investigation(name="empty"), tmp_path)
+    with LazyInvestigation.open("empty", tmp_path) as lazy:
+        assert len(lazy) == 0
+        assert lazy.time_range() is None
+        assert lazy.window(utc(2025, 1, 1), utc(2025, 1, 2)) == []
+
+    journal = io.Journal(tmp_path)
+    inv = sample_investigation()
+    journal.save(inv)
+    inv.add_event(make_event(message="pending"))
+    journal.save(inv)
+    with pytest.raises(ValueError, match="journal"):
+        LazyInvestigation.open(inv.name, tmp_path)
@@ -0,0 +1,163 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+import random
+import string
+
+import pytest
+
+from timeline_creator.layout import default_font
+from timeline_creator.measure import MeasureCache, cache_path_for
+
+
+def _counting_measurer():
+    calls = []
+
+    def measurer(text, font):
+        calls.append(text)
+        return float(len(text) * 5)
+
+    return measurer, calls
+
+
+def test_cache_only_measures_new_lines():
+    cache = MeasureCache()
+    measurer, calls = _counting_measurer()
+    cached = cache.wrap(measurer, "DejaVu Sans", 8.0, 150)
+    for text in ["login", "priv esc", "login", "login"]:
+        cached(text, default_font())
+    assert calls == ["login", "priv esc"]
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.hit_rate == 0.5
+
+
+def test_key_includes_font_and_dpi():
+    cache = MeasureCache()
+    measurer, calls = _counting_measurer()
+    cache.wrap(measurer, "DejaVu Sans", 8.0, 150)("login", default_font())
+    cache.wrap(measurer, "DejaVu Sans", 8.0, 300)("login", default_font())
+    cache.wrap(measurer, "Liberation Sans", 8.0, 150)("login", default_font())
+    assert len(calls) == 3
+
+
+def test_lru_evicts_least_recently_used():
+    cache = MeasureCache(maxsize=2)
+    cache.put(("a", "f", 8.0, 150.0), 1.0)
+    cache.put(("b", "f", 8.0, 150.0), 2.0)
+    assert cache.get(("a", "f", 8.0, 150.0)) == 1.0   # 'a' is now most recent
+    cache.put(("c", "f", 8.0, 150.0), 3.0)
+    assert cache.get(("b", "f", 8.0, 150.0)) is None
+    assert len(cache) == 2
+
+
+def test_disk_store_round_trip(tmp_path):
+    path = cache_path_for("case-1", tmp_path)
+    cache = MeasureCache(path=path)
+    measurer, _ = _counting_measurer()
+    cache.wrap(measurer, "DejaVu Sans", 8.0, 150)("login", default_font())
+    assert cache.save() == path
+    assert cache.save() is None  # nothing new to write
+
+    warm = MeasureCache(path=path)
+    measurer, calls = _counting_measurer()
+    assert warm.wrap(measurer, "DejaVu Sans", 8.0, 150)("login", default_font()) == 25.0
+    assert calls == [] and warm.hits == 1
+
+
+def test_damaged_disk_store_is_a_cold_cache(tmp_path):
+    path = tmp_path / "c.measure.json"
+    path.write_text("{not json")
+    assert len(MeasureCache(path=path)) == 0
+
+
+# --- glyph-advance measurer (needs matplotlib) --------------------------------
+
+needs_matplotlib = pytest.mark.skipif(importlib.util.find_spec("matplotlib") is None,
+                                      reason="matplotlib not installed in this dev env")
+
+
+@needs_matplotlib
+@pytest.mark.parametrize("size,dpi", [(8.0, 150), (10.0, 96), (7.0, 300)])
+def test_glyph_measurer_bounded_against_artist_measurer(size, dpi):
+    import matplotlib
+    matplotlib.use("Agg")
+    from timeline_creator.measure import GlyphAdvanceMeasurer
+    from timeline_creator.render import RenderStyle, _make_measurer
+
+    style = RenderStyle(font_size=size, dpi=dpi)
+    artist = _make_measurer(style)
+    glyph = GlyphAdvanceMeasurer(size, dpi)
+    rng = random.Random(size * dpi)
+    alphabet = string.ascii_letters + string.digits + " .,:;-_/\\()[]@%'\"!?é"
+    for _ in range(300):
+        line = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 60)))
+        truth = artist(line, default_font())
+        estimate = glyph(line, default_font())
+        # never narrower than the real text (that would break non-overlap) ...
+        assert estimate >= truth, line
+        # ... and only a little wider
+        assert estimate <= truth * 1.03 + 4.0, line
+
+
+@needs_matplotlib
+def test_glyph_table_plugs_into_fontspec():
+    from timeline_creator.layout import estimate_text_width
+    from timeline_creator.measure import GlyphAdvanceMeasurer
+
+    glyph = GlyphAdvanceMeasurer(8.0, 150)
+    font = glyph.font_spec()
+    assert font.char_width_table["W"] > font.char_width_table["i"]
+    # no kerning in "mmm", so the table reproduces the measurer up to its margin
+    plain = estimate_text_width("mmm", font)
+    assert glyph("mmm", font) == pytest.approx(
+        plain * GlyphAdvanceMeasurer.MARGIN_RATIO + GlyphAdvanceMeasurer.MARGIN_PX, abs=0.5)
+
+
+@needs_matplotlib
+def test_glyph_measurer_defers_missing_glyphs_to_fallback():
+    from timeline_creator.measure import GlyphAdvanceMeasurer
+
+    glyph = GlyphAdvanceMeasurer(8.0, 150, fallback=lambda text, font: 999.0)
+    assert glyph("漢字", default_font()) == 999.0
+    assert glyph("abc", default_font()) < 999.0
+
+
+@needs_matplotlib
+def test_renderer_keeps_an_empty_caller_cache(tmp_path):
+    from timeline_creator.render import TimelineRenderer
+
+    cache = MeasureCache(path=tmp_path / "c.measure.json")
+    assert len(cache) == 0  # falsy, but still the caller's (persistent) cache
+    assert TimelineRenderer(measure_cache=cache).measure_cache is cache
+
+
+@needs_matplotlib
+@pytest.mark.parametrize("text_measurer", ["glyph", "artist"])
+def test_renders_fill_the_cache_and_rerenders_hit_it(tmp_path, text_measurer):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from timeline_creator.render import RenderStyle, TimelineRenderer
+    from .conftest import make_event, utc
+
+    events = [make_event(message=f"event {i} on host", dt=utc(2025, 1, 1, 9, i))
+              for i in range(50)]
+    path = tmp_path / "c.measure.json"
+    renderer = TimelineRenderer(RenderStyle(text_measurer=text_measurer),
+                                measure_cache=MeasureCache(path=path))
+    cache = renderer.measure_cache
+    plt.close(renderer.render(events).figure)
+    assert cache.misses > 0 and len(cache) == cache.misses and path.exists()
+    cache.reset_stats()
+    plt.close(renderer.render(events).figure)
+    assert cache.hits > 0 and cache.misses == 0
@@ -0,0 +1,80 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Super-timeline merge: time order, span id remapping, catalogue union."""
+
+import pytest
+
+from timeline_creator import filters, io, merge
+from timeline_creator.models import AccountType, Investigation
+from .conftest import make_event, utc
+
+
+def _host(name, endpoint, hours, **event_kwargs):
+    inv = Investigation(name=name)
+    for hour in hours:  # deliberately not saved in time order
+        inv.add_event(make_event(message=f"{name} {hour}", endpoint=endpoint,
+                                 dt=utc(2025, 1, 1, hour), **event_kwargs))
+    inv.add_event(make_event(message=f"{name} session", endpoint=endpoint,
+                             dt=utc(2025, 1, 1, 2, 30), end=utc(2025, 1, 1, 5)))
+    return inv
+
+
+def _hosts(tmp_path, **save_options):
+    a = _host("host-a", "A", [5, 1, 3])
+    b = _host("host-b", "B", [4, 0, 2], username="root", account_type=AccountType.PRIVILEGED)
+    io.save(a, tmp_path, **save_options)
+    io.save(b, tmp_path, **save_options)
+    return a, b
+
+
+@pytest.mark.parametrize("save_options", [{}, {"compress": True}, {"partition": "day"}])
+def test_iter_merged_is_time_ordered_and_remaps_collisions(tmp_path, save_options):
+    _hosts(tmp_path, **save_options)
+    events = list(merge.iter_merged(["host-a", "host-b"], tmp_path))
+    assert [e.datetime for e in events] == sorted(e.datetime for e in events)
+    assert [e.message for e in events][:3] == ["host-b 0", "host-a 1", "host-b 2"]
+    sessions = {e.message: e.span_id for e in events if e.is_span}
+    assert sessions == {"host-a session": "span-3", "host-b session": "host-b:span-3"}
+
+
+def test_merge_writes_a_loadable_investigation(tmp_path):
+    a, b = _hosts(tmp_path)
+    result = merge.merge(["host-a", "host-b"], "all", tmp_path)
+    assert (result.events, result.remapped_span_ids, result.warnings) == (8, 1, [])
+    merged = io.load("all", tmp_path)
+    assert merged.warnings == []
+    assert merged.investigation.endpoints == ["A", "B"]
+    assert merged.investigation.users == {"alice": AccountType.USER,
+                                          "root": AccountType.PRIVILEGED}
+    assert len({e.span_id for e in merged.investigation.events if e.is_span}) == 2
+    summary = {c.name: c for c in io.catalogue(tmp_path)}["all"]
+    assert (summary.events, summary.spans) == (8, 2)
+
+
+def test_window_feeds_the_renderer_clipped(tmp_path):
+    a, b = _hosts(tmp_path)
+    start, end = utc(2025, 1, 1, 3), utc(2025, 1, 1, 4)
+    events = merge.window(["host-a", "host-b"], tmp_path, start, end)
+    everything = list(merge.iter_merged(["host-a", "host-b"], tmp_path))
+    assert events == filters.by_time_window(everything, start, end)
+    assert [e.message for e in events] == ["host-a session", "host-b session",
+                                           "host-a 3", "host-b 4"]
+
+
+def test_conflicting_account_types_warn_and_merge_refuses_an_input_name(tmp_path):
+    io.save(_host("x", "A", [1], username="svc", account_type=AccountType.SERVICE), tmp_path)
+    io.save(_host("y", "B", [2], username="svc", account_type=AccountType.PRIVILEGED), tmp_path)
+    result = merge.merge(["x", "y"], "xy", tmp_path)
+    assert any("'svc'" in warning for warning in result.warnings)
+    with pytest.raises(ValueError):
+        merge.merge(["x", "y"], "x", tmp_path)
@@ -10,6 +10,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -116,3 +117,74 @@ def test_add_event_autocatalogs_endpoint_and_user():
                              account_type=AccountType.SERVICE))
     assert "NEWHOST" in inv.endpoints
     assert inv.users["carol"] is AccountType.SERVICE
+
+
+def test_construct_trusted_matches_validated_event():
+    validated = make_event(end=utc(2025, 1, 1, 13), span_id="s1")
+    trusted = Event.construct_trusted(
+        validated.datetime, validated.message, validated.endpoint, validated.username,
+        validated.account_type, validated.end, validated.span_id)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_fields_set == validated.model_fields_set
+
+
+@pytest.mark.parametrize("span", [False, True])
+def test_construct_trusted_matches_model_construct(span):
+    # construct_trusted fills pydantic's instance slots itself; pin it to the
+    # supported no-validation path so a pydantic upgrade that changes them fails here.
+    fields = make_event(**({"end": utc(2025, 1, 1, 13), "span_id": "s1"} if span else {}))
+    values = {name: getattr(fields, name) for name in Event.model_fields}
+    trusted = Event.construct_trusted(**values)
+    constructed = Event.model_construct(**values)
+    assert trusted == constructed and constructed == trusted
+    assert trusted.model_dump() == constructed.model_dump()
+    assert trusted.model_dump_json() == constructed.model_dump_json()
+    assert trusted.model_fields_set == constructed.model_fields_set
+    assert trusted.__pydantic_extra__ == constructed.__pydantic_extra__
+    assert trusted.__pydantic_private__ == constructed.__pydantic_private__
+    assert trusted.model_copy() == constructed
+    assert pickle.loads(pickle.dumps(trusted)) == constructed
+
+
+def test_content_key_ignores_span_id_and_normalises_offsets():
+    span = make_event(end=utc(2025, 1, 1, 13), span_id="s1")
+    assert span.content_key() == make_event(end=utc(2025, 1, 1, 13)).content_key()
+    shifted = make_event(dt=datetime(2025, 1, 1, 14, tzinfo=timezone(timedelta(hours=2))))
+    assert shifted.content_key() == make_event().content_key()
+    assert make_event(message="other").content_key() != make_event().content_key()
+
+
+def test_duplicate_index_tracks_add_remove_and_direct_edits():
+    inv = Investigation(name="c")
+    first, second = make_event(message="a"), make_event(message="b")
+    assert inv.add_event(first) is True
+    assert inv.has_event(make_event(message="a"))
+    assert inv.add_event(make_event(message="a"), skip_duplicate=True) is False
+    inv.add_event(make_event(message="a"))  # allowed without skip_duplicate
+    inv.add_event(second)
+    assert inv.content_keys()[first.content_key()] == 2
+    inv.remove_event(0)
+    assert inv.content_keys()[first.content_key()] == 1
+    inv.remove_event(0)
+    assert not inv.has_event(first)
+    inv.events.pop()  # bypassing the model: the index is dropped and rebuilt
+    assert not inv.has_event(second)
+    assert inv == Investigation(name="c", endpoints=inv.endpoints, users=inv.users)
+
+
+def test_duplicate_index_sees_in_place_edits():
+    inv = Investigation(name="c")
+    inv.add_event(make_event(message="a"))
+    assert inv.has_event(make_event(message="a"))
+    inv.events[0] = make_event(message="b")  # same length, different content
+    assert not inv.has_event(make_event(message="a"))
+    assert inv.has_event(make_event(message="b"))
+    inv.events.sort(key=lambda event: event.message)
+    inv.events += [make_event(message="c")]
+    assert inv.has_event(make_event(message="c"))
+    inv.events = [make_event(message="d")]  # a plain list assigned directly
+    assert inv.has_event(make_event(message="d")) and not inv.has_event(make_event(message="c"))
+    indexed, plain = Investigation(name="x"), Investigation(name="x")
+    indexed.has_event(make_event())
+    assert indexed == plain and indexed.model_dump() == plain.model_dump()
@@ -0,0 +1,128 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""plaso l2tcsv / JSON-lines import: field mapping, parse-time filters, errors."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from timeline_creator import io, plaso
+from timeline_creator.importers import ImportError_
+from timeline_creator.models import AccountType
+from .conftest import utc
+
+L2T_HEADER = ("date,time,timezone,MACB,source,sourcetype,type,user,host,short,desc,"
+              "version,filename,inode,notes,format,extra")
+
+
+def _l2t(*rows):
+    return StringIO("\n".join([L2T_HEADER, *rows]) + "\n")
+
+
+CREATED = "01/02/2025,09:30:00,UTC,...B,FILE,OS:stat,Creation Time,-,WS01,short,C:/a.txt,2,,,,,"
+WRITTEN = ("01/02/2025,10:00:00,UTC,M...,FILE,OS:stat,Content Modification Time,bob,WS01,"
+           "short,C:/b.txt,2,,,,,")
+LOGON = ("01/02/2025,11:00:00,UTC,....,EVT,WinEVTX,Event Logged,alice,DC1,logon short,,"
+         "2,,,,,")
+
+
+def test_l2tcsv_maps_fields():
+    staged = plaso.stage_l2tcsv(_l2t(CREATED, LOGON), users={"alice": AccountType.PRIVILEGED})
+    events = list(staged.events())
+    staged.discard()
+    assert [(e.datetime, e.message, e.endpoint, e.username, e.account_type) for e in events] == [
+        (utc(2025, 1, 2, 9, 30), "[Creation Time] C:/a.txt", "WS01", "unknown",
+         AccountType.UNKNOWN),
+        (utc(2025, 1, 2, 11), "[Event Logged] logon short", "DC1", "alice",
+         AccountType.PRIVILEGED),
+    ]
+    assert staged.discovered_endpoints == ["WS01", "DC1"]
+
+
+def test_l2tcsv_local_timezone_is_converted():
+    row = LOGON.replace(",UTC,", ",Europe/Amsterdam,")
+    with plaso.stage_l2tcsv(_l2t(row), desc_in_message=False) as staged:
+        (event,) = staged.events()
+    assert event.datetime == utc(2025, 1, 2, 10)
+    assert event.message == "logon short"
+
+
+def test_filters_drop_records_at_parse_time_and_count_them(tmp_path):
+    staged = plaso.stage_l2tcsv(_l2t(CREATED, WRITTEN, LOGON),
+                                timestamp_descs={"creation time", "Event Logged"},
+                                sources={"file"})
+    assert (staged.rows, staged.staged, staged.skipped) == (1, 1, 2)
+    staged.commit("case", tmp_path)
+    (event,) = io.load("case", tmp_path).investigation.events
+    assert event.message == "[Creation Time] C:/a.txt"
+
+
+def test_l2tcsv_errors_carry_data_row_numbers_and_reject_the_import():
+    staged = plaso.stage_l2tcsv(_l2t(CREATED, "13/45/2025,09:00:00,UTC" + CREATED[19:],
+                                     "2025-01-02,09:00:00,UTC" + CREATED[19:]))
+    assert not staged.ok and staged.path is None
+    assert [error.row for error in staged.errors] == [2, 3]
+    assert "MM/DD/YYYY" in staged.errors[1].message
+
+
+def test_l2tcsv_rejects_other_csv():
+    with pytest.raises(ImportError_, match="desc"):
+        plaso.stage_l2tcsv(StringIO("date,time,timezone,type,user,host\n"))
+
+
+def _jsonl(*records):
+    return "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records) + "\n"
+
+
+def test_jsonl_reads_psort_and_timesketch_records(tmp_path):
+    path = tmp_path / "export.jsonl"
+    path.write_text(_jsonl(
+        {"datetime": "2025-01-02T09:00:00+00:00", "timestamp_desc": "Last Login Time",
+         "message": "login", "hostname": "WS01", "username": "bob", "data_type": "wtmp"},
+        "",
+        {"timestamp": 1735808400000000, "timestamp_desc": "Event Logged",
+         "message": "svc start", "host": "-", "user": "svc", "account_type": "Service account"},
+    ), encoding="utf-8")
+    with plaso.stage_jsonl(path, staging_dir=tmp_path) as staged:
+        events = list(staged.events())
+    assert [(e.datetime, e.message, e.endpoint, e.username, e.account_type) for e in events] == [
+        (utc(2025, 1, 2, 9), "[Last Login Time] login", "WS01", "bob", AccountType.UNKNOWN),
+        (utc(2025, 1, 2, 9), "[Event Logged] svc start", "unknown", "svc",
+         AccountType.SERVICE),
+    ]
+    assert staged.skipped == 1  # the blank line
+
+
+def test_jsonl_filters_and_errors_use_line_numbers():
+    records = [{"datetime": "2025-01-02T09:00:00+00:00", "timestamp_desc": "Event Logged",
+                "message": f"event {i}", "hostname": "WS01", "username": "bob",
+                "parser": "winevtx" if i % 2 else "filestat"} for i in range(6)]
+    staged = plaso.stage_jsonl(StringIO(_jsonl(*records)), sources={"winevtx"}, chunk_size=2)
+    assert (staged.staged, staged.skipped) == (3, 3)
+    staged.discard()
+    bad = plaso.stage_jsonl(StringIO(_jsonl(records[1], "{not json", [1], {"message": "x"})))
+    assert [(error.row, error.message.split(":")[0]) for error in bad.errors] == [
+        (2, "invalid JSON"), (3, "not a JSON object"),
+        (4, "no datetime (or timestamp in epoch microseconds)")]
+
+
+def test_process_pool_matches_serial():
+    rows = [LOGON.replace("11:00:00", f"11:{i % 60:02d}:00") for i in range(50)]
+    serial = plaso.stage_l2tcsv(_l2t(*rows), chunk_size=7, sources={"evt"})
+    pooled = plaso.stage_l2tcsv(_l2t(*rows), chunk_size=7, workers=2, sources={"evt"})
+    try:
+        assert list(pooled.events()) == list(serial.events())
+    finally:
+        serial.discard()
+        pooled.discard()
@@ -0,0 +1,145 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""SQLite backend: same contract as io, filters pushed down to SQL."""
+
+import sqlite3
+
+import pytest
+
+from timeline_creator import filters, io, sqlite_store
+from timeline_creator.models import AccountType, Investigation
+from .conftest import make_event, sample_investigation, utc
+
+
+def _case():
+    inv = sample_investigation()
+    inv.add_event(make_event(message="svc span, no id", endpoint="HOST3", username="svc",
+                             account_type=AccountType.SERVICE,
+                             dt=utc(2025, 1, 1, 8), end=utc(2025, 1, 1, 9, 30)))
+    inv.add_event(make_event(message="ünïcode ✓", dt=utc(2025, 1, 2, 0, 0, 1)))
+    return inv
+
+
+def test_save_load_matches_io(tmp_path):
+    inv = _case()
+    db = tmp_path / "cases.db"
+    sqlite_store.save(inv, db)
+    io.save(inv, tmp_path)
+    assert (sqlite_store.load(inv.name, db).investigation.model_dump()
+            == io.load(inv.name, tmp_path).investigation.model_dump())
+
+
+def test_load_backfills_catalogues_like_io(tmp_path):
+    inv = Investigation(name="bare", events=[make_event(endpoint="HOST1", username="alice")])
+    db = tmp_path / "cases.db"
+    sqlite_store.save(inv, db)
+    io.save(inv, tmp_path)
+    loaded = sqlite_store.load("bare", db).investigation
+    assert (loaded.endpoints, loaded.users) == (["HOST1"], {"alice": AccountType.USER})
+    assert loaded.model_dump() == io.load("bare", tmp_path).investigation.model_dump()
+
+
+def test_point_event_span_id_is_dropped_like_io(tmp_path):
+    inv = _case()
+    inv.add_event(make_event(message="point with an id", span_id="stray",
+                             dt=utc(2025, 1, 2, 1)))
+    db = tmp_path / "cases.db"
+    sqlite_store.save(inv, db)
+    io.save(inv, tmp_path)
+    loaded = sqlite_store.load(inv.name, db).investigation
+    assert loaded.events[-1].span_id is None
+    assert loaded.model_dump() == io.load(inv.name, tmp_path).investigation.model_dump()
+    assert (sqlite_store.query(inv.name, db, start=utc(2025, 1, 2))
+            == filters.apply(loaded.events, start=utc(2025, 1, 2)))
+
+
+def test_jsonl_round_trip_is_byte_exact(tmp_path):
+    inv = _case()
+    io.save(inv, tmp_path / "a")
+    db = tmp_path / "cases.db"
+    sqlite_store.import_jsonl(inv.name, tmp_path / "a", db)
+    sqlite_store.export_jsonl(inv.name, db, tmp_path / "b")
+    for suffix in (".jsonl", ".meta.json"):
+        assert ((tmp_path / "b" / f"{inv.name}{suffix}").read_bytes()
+                == (tmp_path / "a" / f"{inv.name}{suffix}").read_bytes())
+
+
+@pytest.mark.parametrize("selection", [
+    {},
+    {"endpoints": ["HOST1"]},
+    {"users": ["root", "svc"]},
+    {"endpoints": []},
+    {"start": utc(2025, 1, 1, 9, 2), "end": utc(2025, 1, 1, 10, 30)},
+    {"start": utc(2025, 1, 1, 9, 2), "end": utc(2025, 1, 1, 10, 30), "clip": False},
+    {"users": ["alice"], "start": utc(2025, 1, 1, 10, 30)},
+])
+def test_query_matches_filters_apply(tmp_path, selection):
+    inv = _case()
+    db = tmp_path / "cases.db"
+    sqlite_store.save(inv, db)
+    loaded = sqlite_store.load(inv.name, db).investigation.events
+    assert sqlite_store.query(inv.name, db, **selection) == filters.apply(loaded, **selection)
+
+
+def test_query_uses_the_indexes(tmp_path):
+    db = tmp_path / "cases.db"
+    sqlite_store.save(_case(), db)
+    with sqlite3.connect(db) as connection:
+        plan = " ".join(row[-1] for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events WHERE investigation = ? AND "
+            "username IN (SELECT value FROM json_each(?))", ("case-1", '["root"]')))
+    assert "events_username" in plan
+
+
+def test_list_and_replace(tmp_path):
+    db = tmp_path / "cases.db"
+    assert sqlite_store.list_investigations(db) == []
+    inv = _case()
+    sqlite_store.save(inv, db)
+    sqlite_store.save(Investigation(name="another"), db)
+    inv.events.pop()
+    sqlite_store.save(inv, db)
+    assert sqlite_store.list_investigations(db) == ["another", "case-1"]
+    assert len(sqlite_store.load("case-1", db).investigation.events) == len(inv.events)
+    with pytest.raises(FileNotFoundError):
+        sqlite_store.load("missing", db)
+
+
+def test_reads_do_not_write(tmp_path):
+    db = tmp_path / "cases.db"
+    inv = _case()
+    sqlite_store.save(inv, db)
+    writer = sqlite3.connect(db)
+    try:
+        writer.execute("BEGIN IMMEDIATE")  # hold the write lock
+        assert sqlite_store.list_investigations(db) == ["case-1"]
+        assert len(sqlite_store.load("case-1", db).investigation.events) == len(inv.events)
+        assert sqlite_store.query("case-1", db, users=["root"])
+    finally:
+        writer.rollback()
+        writer.close()
+    with pytest.raises(FileNotFoundError):
+        sqlite_store.query("case-1", tmp_path / "missing.db")
+    assert not (tmp_path / "missing.db").exists()
+
+
+def test_unknown_store_version_is_rejected(tmp_path):
+    db = tmp_path / "cases.db"
+    sqlite_store.save(_case(), db)
+    with sqlite3.connect(db) as connection:
+        connection.execute(f"PRAGMA user_version={sqlite_store.SCHEMA_VERSION + 1}")
+    for call in (lambda: sqlite_store.load("case-1", db),
+                 lambda: sqlite_store.list_investigations(db),
+                 lambda: sqlite_store.save(_case(), db)):
+        with pytest.raises(ValueError, match="version 2 case store"):
+            call()
@@ -0,0 +1,115 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Direct SVG writer: well-formed output carrying the layout's geometry."""
+
+import importlib.util
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from timeline_creator import colour
+from timeline_creator.layout import (
+    AxisProjection, compute_layout, default_font, layout_events_from,
+)
+from timeline_creator.models import AccountType
+from timeline_creator.svg import export_svg_direct
+from .conftest import make_event, sample_investigation, utc
+
+NS = {"svg": "http://www.w3.org/2000/svg"}
+
+
+def _layout(events, engine="python"):
+    projection = AxisProjection(utc(2025, 1, 1, 8, 0, 0), utc(2025, 1, 1, 12, 0, 0), 800.0)
+    layout_events = layout_events_from(events)
+    if engine == "array":
+        from timeline_creator.array_layout import compute_layout_arrays
+        return compute_layout_arrays(layout_events, projection, default_font()), projection
+    return compute_layout(layout_events, projection, default_font()), projection
+
+
+def _export(tmp_path, events, **kwargs):
+    result, projection = _layout(events, kwargs.pop("engine", "python"))
+    path = export_svg_direct(tmp_path / "t.svg", result, events, projection=projection,
+                             **kwargs)
+    return result, ET.parse(path).getroot()
+
+
+def test_one_label_group_per_placed_label(tmp_path):
+    events = sample_investigation().events
+    result, root = _export(tmp_path, events)
+    labels = root.find("svg:g[@class='labels']", NS)
+    assert len(labels) == len(result.placed)
+    texts = ["".join(g.find("svg:text", NS).itertext()) for g in labels]
+    assert sorted(texts) == sorted(p.wrapped_text.replace("\n", "") for p in result.placed)
+
+
+def test_shared_classes_and_marker_symbols(tmp_path):
+    events = sample_investigation().events
+    _, root = _export(tmp_path, events)
+    style = root.find("svg:defs/svg:style", NS).text
+    assignment = colour.assign(events)
+    for token in assignment.values():
+        assert f".k-{token.family}-{token.shade_index}{{" in style
+    symbols = root.findall("svg:defs/svg:symbol", NS)
+    assert len(symbols) == len({t.marker_token for t in assignment.values()} | {"o"})
+    # the span is drawn as a bar, the two points as markers
+    assert len(root.find("svg:g[@class='bars']", NS)) == 1
+    assert len(root.find("svg:g[@class='markers']", NS)) == 2
+    assert not any("style" in el.attrib for el in root.iter())
+
+
+def test_label_text_is_escaped(tmp_path):
+    events = [make_event(message="<script> & \"quotes\"", dt=utc(2025, 1, 1, 9))]
+    _, root = _export(tmp_path, events, legend=False)
+    text = root.find("svg:g[@class='labels']/svg:g/svg:text", NS)
+    assert "".join(text.itertext()) == "<script> & \"quotes\""
+    assert root.find("svg:g[@class='legend']", NS) is None
+
+
+def test_control_characters_do_not_break_the_document(tmp_path):
+    events = [make_event(message="beacon\x00\x07 sent", username="bob\x1b[0m",
+                         dt=utc(2025, 1, 1, 9))]
+    _, root = _export(tmp_path, events)  # ET.parse fails on an invalid character
+    text = root.find("svg:g[@class='labels']/svg:g/svg:text", NS)
+    assert "".join(text.itertext()) == "beacon\ufffd\ufffd sent"
+    legend = root.find("svg:g[@class='legend']", NS)
+    assert "bob\ufffd[0m" in [t.text for t in legend.findall("svg:text", NS)]
+
+
+def test_canvas_is_tall_enough_for_a_long_legend(tmp_path):
+    events = [make_event(username=f"user{i:02d}", dt=utc(2025, 1, 1, 9, i)) for i in range(40)]
+    _, root = _export(tmp_path, events)
+    bottom = max(float(t.get("y")) for t in root.find("svg:g[@class='legend']", NS)
+                 .findall("svg:text", NS))
+    assert float(root.get("height")) > bottom
+
+
+def test_legend_lists_every_user(tmp_path):
+    events = [make_event(username=f"u{i}", dt=utc(2025, 1, 1, 9, i)) for i in range(3)]
+    events.append(make_event(username="svc", account_type=AccountType.SERVICE,
+                             dt=utc(2025, 1, 1, 10)))
+    _, root = _export(tmp_path, events)
+    legend = root.find("svg:g[@class='legend']", NS)
+    names = [t.text for t in legend.findall("svg:text", NS)]
+    assert {"u0", "u1", "u2", "svc"} <= set(names)
+
+
+@pytest.mark.skipif(importlib.util.find_spec("numpy") is None,
+                    reason="numpy not installed in this dev env")
+def test_array_layout_writes_the_same_document(tmp_path):
+    events = sample_investigation().events
+    result, projection = _layout(events)
+    arrays, _ = _layout(events, engine="array")
+    a = export_svg_direct(tmp_path / "a.svg", result, events, projection=projection)
+    b = export_svg_direct(tmp_path / "b.svg", arrays, events, projection=projection)
+    assert a.read_text() == b.read_text()